@@ -34,6 +34,18 @@ class TestCifParsing(BaseTest.CrystalTest):
             cif = crystal.to_cif()
             print(f'CIF = \n{cif}')
 
+    def test_serialization_roundtrip(self):
+        for crystal in self.custom_structures:
+            crystal_dict = crystal.to_dict()
+            reloaded = CrystalStructure.from_dict(crystal_dict)
+            self.assertEqual(crystal.to_str(), reloaded.to_str())
+
+            crystal_dict['lattice'] = str(tuple(crystal_dict['lattice']))
+            legacy_reloaded = CrystalStructure.from_dict(crystal_dict)
+            self.assertEqual(crystal.lattice.parameters, legacy_reloaded.lattice.parameters)
+
+        self.assertIs(CrystalStructure.get_decode_plan(), CrystalStructure.get_decode_plan())
+
     def test_standardize(self):
         a,b,c = 5.801, 11.272, 5.57
         alpha, beta, gamma = 90,90,90
@@ -55,6 +67,21 @@ class TestCifParsing(BaseTest.CrystalTest):
 
         self.assertTrue(len(nonempty_standardized.basis) == len(nonempty_phase.basis))
 
+    def test_deferred_properties(self):
+        lattice = Lattice.from_parameters(a=5.801, b=11.272, c=5.57, alpha=90, beta=90, gamma=90)
+        empty_phase = CrystalStructure(lattice=lattice, basis=None)
+        empty_phase.defer_properties()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                _ = empty_phase.spacegroup
+
+        phase = CrystalStructure.from_cif(cif_content=CrystalExamples.get_cif_content())
+        phase.defer_properties()
+        expected = CrystalStructure.from_cif(cif_content=CrystalExamples.get_cif_content())
+        expected.calculate_properties()
+        self.assertEqual(phase.spacegroup, expected.spacegroup)
+        self.assertFalse(phase.__dict__.get('_properties_deferred'))
+
 
 if __name__ == "__main__":
     TestCifParsing.execute_all()
\ No newline at end of file
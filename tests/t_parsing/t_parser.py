@@ -1,11 +1,18 @@
+import io
+import os
 import tempfile
 from typing import Optional
 
+import numpy as np
 from holytools.devtools import Unittest
 from tests.base_pattern import ParserBaseTest
 from xrdpattern.parsing import Formats
+from xrdpattern.parsing.binary import BinaryReader, IntegerQuantity, FloatQuantity
+from xrdpattern.parsing.binary.binary_analyser import get_zero_regions, get_array_blocks, analyse_files
 from xrdpattern.parsing.csv.matrix import CsvOrientations
+from xrdpattern.parsing.dat.dat_parser import DatParser
 from xrdpattern.parsing.examples import DataExamples
+from xrdpattern.parsing.xylib.xylib_repr import xylib
 from xrdpattern.pattern import XrdPattern, PatternDB
 from xrdpattern.xrd import XrdData
 
@@ -33,6 +40,17 @@ class TestXYLib(ParserBaseTest):
         for data in [raw_data, std_data]:
             self.check_data_ok(*data)
 
+    def test_values_buffer(self):
+        block = xylib.load_file(self.get_fpath()).get_block(0)
+        num_points = block.get_point_count()
+        for col_num in [1, 2]:
+            column = block.get_column(col_num)
+            values = np.frombuffer(column.get_values_buffer(num_points), dtype=np.float64)
+            self.assertEqual(values.dtype, np.float64)
+            self.assertEqual(len(values), num_points)
+            self.assertEqual(values.tolist(), [column.get_value(i) for i in range(num_points)])
+        self.assertEqual(len(block.get_column(1).get_values_buffer(-1)), 0)
+
     @classmethod
     def update_aimat_json(cls):
         pattern = XrdPattern.load(fpath=cls.get_fpath())
@@ -52,6 +70,13 @@ class TestCustomFormats(ParserBaseTest):
         pattern = XrdPattern.load(fpath=DataExamples.get_cif_fpath())
         self.assertIsInstance(pattern, XrdPattern)
 
+        phase = pattern.powder_experiment.phases[0]
+        self.assertTrue(phase.__dict__.get('_properties_deferred'))
+        self.assertEqual(phase.spacegroup, 11)
+        self.assertEqual(len(phase.basis), 24)
+        self.assertEqual(pattern.powder_experiment.xray_info.primary_wavelength, 1.540598)
+        self.assertEqual(pattern.powder_experiment.xray_info.secondary_wavelength, 1.54439)
+
     def test_xlsx(self):
         patterns = self.parser.extract(fpath=DataExamples.get_xlsx_fpath(), csv_orientation=CsvOrientations.VERTICAL)
         for p in patterns:
@@ -66,6 +91,80 @@ class TestCustomFormats(ParserBaseTest):
         patterns = self.parser.extract(fpath=DataExamples.get_dat_fpath())
         for p in patterns:
             self.assertIsInstance(p, XrdData)
+        self.assertEqual([len(p.two_theta_values) for p in patterns], [2600, 2600])
+        self.assertIs(patterns[0].two_theta_values.base, patterns[1].two_theta_values.base)
+
+    def test_dat_float_precision(self):
+        values = np.random.default_rng(seed=0).uniform(0, 100, size=(1000, 2))
+        lines = ['imagenum twotheta intensity'] + [f'{i // 500} {x!r} {y!r}' for i, (x, y) in enumerate(values)]
+        image_nums, x, y = DatParser.read_columns(source=io.StringIO('\n'.join(lines)))
+        self.assertTrue(np.array_equal(x, [float(repr(v)) for v in values[:, 0]]))
+        self.assertTrue(np.array_equal(y, [float(repr(v)) for v in values[:, 1]]))
+        self.assertEqual(image_nums.tolist(), [i // 500 for i in range(1000)])
+
+    def test_format_detection(self):
+        self.assertEqual(Formats.get_format(fpath=DataExamples.get_stoe_fpath()), Formats.stoe_raw)
+        self.assertEqual(Formats.get_format(fpath=DataExamples.get_bruker_fpath()), Formats.bruker_raw)
+        self.assertEqual(Formats.get_format(fpath=DataExamples.get_dat_fpath()), Formats.plaintext_dat)
+
+        riet_header = b'Riet7 pattern\n10.0 0.02 12.0\n5 5 5 5 5 5 5 5\n'
+        self.assertTrue(Formats.is_riet_dat(header=riet_header))
+        self.assertTrue(Formats.is_rigaku_dat(header=b'*TYPE           =  Raw\n'))
+
+    def test_in_memory_parsing(self):
+        fpaths = [DataExamples.get_bruker_fpath(), DataExamples.get_stoe_fpath(), DataExamples.get_single_csv_fpath(),
+                  DataExamples.get_cif_fpath(), DataExamples.get_xlsx_fpath(), DataExamples.get_dat_fpath(),
+                  DataExamples.get_aimat_fpath()]
+        for fpath in fpaths:
+            expected = self.parser.extract(fpath=fpath, csv_orientation=CsvOrientations.VERTICAL)
+            with open(fpath, 'rb') as f:
+                from_stream = self.parser.extract_stream(fileobj=f, csv_orientation=CsvOrientations.VERTICAL)
+                f.seek(0)
+                from_bytes = self.parser.extract_bytes(data=f.read(), suffix=os.path.splitext(fpath)[1], csv_orientation=CsvOrientations.VERTICAL)
+
+            for actual in [from_stream, from_bytes]:
+                self.assertEqual(len(actual), len(expected))
+                for p1, p2 in zip(actual, expected):
+                    self.assertTrue(np.array_equal(p1.two_theta_values, p2.two_theta_values))
+                    self.assertTrue(np.array_equal(p1.intensities, p2.intensities))
+
+    def test_binary_layout(self):
+        class ExampleReader(BinaryReader):
+            def __init__(self):
+                self.num_entries : IntegerQuantity = IntegerQuantity(start=0)
+                self.step : FloatQuantity = FloatQuantity(start=4)
+                self.values : IntegerQuantity = IntegerQuantity(start=8, count_from=self.num_entries)
+
+        values = np.arange(100, dtype='<i4')
+        byte_content = np.array([100], dtype='<i4').tobytes() + np.array([0.5], dtype='<f4').tobytes() + values.tobytes()
+        reader = ExampleReader()
+        reader.read_bytes(byte_content=byte_content)
+
+        self.assertEqual(reader.num_entries.get_value(), 100)
+        self.assertEqual(reader.step.get_value(), 0.5)
+        self.assertTrue(np.array_equal(reader.values.get_value(), values))
+
+    def test_binary_analyser(self):
+        zero_regions = get_zero_regions(bytes([0]*10 + [1]*5 + [0]*18 + [1] + [0]*15), min_size=12)
+        self.assertEqual([(r.start, r.end) for r in zero_regions], [(15, 33), (34, 49)])
+
+        stoe_fpath = DataExamples.get_stoe_fpath()
+        with open(stoe_fpath, 'rb') as f:
+            blocks = get_array_blocks(f.read(), dtype='<i4', min_length=100, min_abs=1, max_abs=10**7)
+        self.assertIn(2560, [b.start for b in blocks])
+
+        sample_dirpath = tempfile.mkdtemp()
+        sample_fpaths = []
+        for num in [1, 2]:
+            fpath = os.path.join(sample_dirpath, f'sample_{num}.bin')
+            header = b'MAGIC' + bytes(3) + np.array([1.5*num], dtype='<f4').tobytes() + bytes(4)
+            with open(fpath, 'wb') as f:
+                f.write(header + np.arange(num, 100+num, dtype='<i4').tobytes())
+            sample_fpaths.append(fpath)
+        report = analyse_files(fpaths=sample_fpaths, min_block_length=50)
+        self.assertEqual((report.constant_regions[0].start, report.constant_regions[0].end), (0, 10))
+        self.assertIn(8, report.float_offsets)
+        self.assertIn(16, report.block_starts)
 
 original_get_fpaths = Formats.get_xrd_fpaths
 def load_excluding_horizontal(dirpath : str, selected_suffixes : Optional[list[str]]):
@@ -1,3 +1,8 @@
+import os
+import tempfile
+from unittest import mock
+
+import numpy as np
 from holytools.devtools import Unittest
 from xrdpattern.parsing.csv import CsvParser
 from xrdpattern.parsing.csv.matrix import CsvOrientations
@@ -26,6 +31,63 @@ class TestCsvReader(Unittest):
         self.read_as_matrix(CsvOrientations.VERTICAL, self.single_csv_path)
         self.read_as_pattern_info(CsvOrientations.VERTICAL, self.single_csv_path)
 
+    def test_read_dialects(self):
+        x = np.linspace(10, 80, num=100)
+        y = np.arange(1, 101, dtype=float)
+        tab_content = '# instrument export\ntwo_theta\tintensity\n\n' + '\n'.join(f'{a}\t {b}' for a, b in zip(x, y)) + '\nend\tend\n'
+        semicolon_content = ';'.join(['x'] + [f'p{i}' for i in range(3)]) + '\n' + '\n'.join(f'{a};{b};{2*b};{3*b};' for a, b in zip(x, y))
+
+        for content, num_patterns in [(tab_content, 1), (semicolon_content, 3)]:
+            xrd_datas = CsvParser().extract_multi_str(content=content, pattern_dimension=CsvOrientations.VERTICAL)
+            self.assertEqual(len(xrd_datas), num_patterns)
+            self.assertTrue(np.allclose(xrd_datas[0].two_theta_values, x))
+            self.assertTrue(np.allclose(xrd_datas[-1].intensities, num_patterns*y))
+
+    def test_float_precision(self):
+        values = np.random.default_rng(seed=0).uniform(0, 100, size=(1000, 2))
+        content = '\n'.join(f'{a!r},{b!r}' for a, b in values)
+        for table_content in [content, content + '\nend,end']:
+            table = CsvParser.read_table(content=table_content, separator=',')
+            self.assertTrue(np.array_equal(table, values))
+
+    def test_iter_batches(self):
+        reader = CsvParser()
+        for csv_path, orientation in [(self.vertical_csv_path, CsvOrientations.VERTICAL), (self.horizontal_csv_path, CsvOrientations.HORIZONTAL)]:
+            xrd_datas = reader.extract_multi(fpath=csv_path, pattern_dimension=orientation)
+            batches = list(reader.iter_batches(fpath=csv_path, pattern_dimension=orientation, batch_size=200))
+            streamed = [d for batch in batches for d in batch]
+
+            self.assertTrue(all(len(batch) <= 200 for batch in batches))
+            self.assertEqual(len(xrd_datas), len(streamed))
+            self.assertIs(streamed[0].two_theta_values, streamed[-1].two_theta_values)
+            for d1, d2 in zip(xrd_datas, streamed):
+                self.assertTrue(np.array_equal(d1.two_theta_values, d2.two_theta_values))
+                self.assertTrue(np.array_equal(d1.intensities, d2.intensities))
+
+    def test_vertical_batches_read_once(self):
+        reader = CsvParser()
+        with mock.patch.object(CsvParser, '_iter_row_chunks', wraps=reader._iter_row_chunks) as iter_row_chunks:
+            batches = list(reader.iter_batches(fpath=self.vertical_csv_path, pattern_dimension=CsvOrientations.VERTICAL, batch_size=2))
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(iter_row_chunks.call_count, 1)
+
+    def test_compatibility_methods(self):
+        reader = CsvParser()
+        self.assertTrue(reader.has_two_columns(fpath=self.single_csv_path))
+        self.assertFalse(reader.has_two_columns(fpath=self.vertical_csv_path))
+        self.assertEqual(reader.to_numerical(data=[['1.5', '2'], ['a', '3'], ['0.1', '1e3']]), [[1.5, 2.0], [0.1, 1000.0]])
+        self.assertEqual(CsvParser.convert_to_float('0.1', row_num=1, col_num=1), 0.1)
+        with self.assertRaises(ValueError):
+            CsvParser.convert_to_float('a', row_num=1, col_num=1)
+
+        csv_fpath = os.path.join(tempfile.mkdtemp(), 'converted.csv')
+        CsvParser.xlsx_to_csv(xlsx_fpath=DataExamples.get_xlsx_fpath(), csv_fpath=csv_fpath)
+        converted = reader.extract_multi(fpath=csv_fpath, pattern_dimension=CsvOrientations.VERTICAL)
+        original = reader.extract_multi(fpath=DataExamples.get_xlsx_fpath(), pattern_dimension=CsvOrientations.VERTICAL)
+        self.assertEqual(len(converted), len(original))
+        for d1, d2 in zip(converted, original):
+            self.assertTrue(np.array_equal(d1.intensities, d2.intensities))
+
     def read_as_matrix(self, pattern_data_axis : str, csv_path : str):
         reader = CsvParser()
         table = reader._as_matrix(fpath=csv_path, pattern_orientation=pattern_data_axis)
@@ -1,8 +1,18 @@
+import shutil
+import tarfile
 import tempfile
 import os, uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
 from tests.base_pattern import ParserBaseTest
 from xrdpattern.parsing.examples import DataExamples
-from xrdpattern.pattern import PatternDB
+from xrdpattern.pattern import PatternDB, ParseCache, PatternStore, XrdPattern, Deduplicator, MatrixCache
+from xrdpattern.pattern.store import StoreShard
+from xrdpattern.pattern.standardize import OperatorCache, standardize_batch, get_std_angles
+from xrdpattern.xrd import LabelType, XrayInfo
 
 
 # ---------------------------------------------------------
@@ -34,6 +44,276 @@ class TestPatternDB(ParserBaseTest):
 
             self.assertEqual(old_pattern, new_pattern)
 
+    def test_parallel_load(self):
+        serial_db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw', '.json'])
+        parallel_db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw', '.json'], workers=2)
+
+        self.assertEqual(list(serial_db.fpath_dict.keys()), list(parallel_db.fpath_dict.keys()))
+        self.assertEqual(serial_db, parallel_db)
+
+        limited_db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw', '.json'], workers=2, limit_patterns=1)
+        self.assertEqual(len(limited_db.patterns), 1)
+
+    def test_iter_patterns(self):
+        db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw', '.json'])
+        streamed = list(PatternDB.iter_patterns(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw', '.json']))
+        self.assertEqual(db.patterns, streamed)
+
+        batches = list(PatternDB.iter_batches(dirpath=DataExamples.get_datafolder_fpath(), batch_size=2, suffixes=['.raw', '.json']))
+        self.assertEqual([len(b.patterns) for b in batches], [2, 1])
+        self.assertEqual([p for b in batches for p in b.patterns], db.patterns)
+
+    def test_parse_cache(self):
+        data_dirpath = tempfile.mkdtemp()
+        for fpath in [DataExamples.get_bruker_fpath(), DataExamples.get_stoe_fpath()]:
+            shutil.copy(fpath, data_dirpath)
+        with open(os.path.join(data_dirpath, 'broken.raw'), 'wb') as f:
+            f.write(b'RAW4.00' + bytes(100))
+
+        cache_dirpath = tempfile.mkdtemp()
+        uncached_db = PatternDB.load(dirpath=data_dirpath)
+        first_cache = ParseCache(dirpath=cache_dirpath)
+        first_db = PatternDB.load(dirpath=data_dirpath, cache=first_cache)
+        self.assertEqual(first_cache.num_hits, 0)
+
+        second_cache = ParseCache(dirpath=cache_dirpath)
+        second_db = PatternDB.load(dirpath=data_dirpath, cache=second_cache)
+        self.assertEqual(second_cache.num_hits, 3)
+        self.assertEqual(uncached_db, first_db)
+        self.assertEqual(first_db, second_db)
+
+        os.utime(os.path.join(data_dirpath, 'stoe.raw'), ns=(0, 0))
+        retry_cache = ParseCache(dirpath=cache_dirpath, retry_failed=True)
+        PatternDB.load(dirpath=data_dirpath, cache=retry_cache)
+        self.assertEqual(retry_cache.num_hits, 1)
+
+    def test_parse_cache_options(self):
+        data_dirpath = tempfile.mkdtemp()
+        shutil.copy(DataExamples.get_vertical_csv_fpath(), data_dirpath)
+        cache_dirpath = tempfile.mkdtemp()
+        results_dirpath = os.path.join(cache_dirpath, ParseCache.results_dirname)
+
+        vertical_db = PatternDB.load(dirpath=data_dirpath, csv_orientation='vertical', cache=ParseCache(dirpath=cache_dirpath))
+        self.assertEqual(len(os.listdir(results_dirpath)), 1)
+
+        horizontal_cache = ParseCache(dirpath=cache_dirpath)
+        horizontal_db = PatternDB.load(dirpath=data_dirpath, csv_orientation='horizontal', cache=horizontal_cache)
+        self.assertEqual(horizontal_cache.num_hits, 0)
+        self.assertEqual(len(horizontal_db.patterns), 0)
+        self.assertEqual(len(os.listdir(results_dirpath)), 0)
+
+        vertical_cache = ParseCache(dirpath=cache_dirpath)
+        reloaded_db = PatternDB.load(dirpath=data_dirpath, csv_orientation='vertical', cache=vertical_cache)
+        self.assertEqual(vertical_cache.num_hits, 0)
+        self.assertEqual(reloaded_db, vertical_db)
+
+    def test_matrix_cache(self):
+        db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw'])
+        cache_dirpath = tempfile.mkdtemp()
+        expected = db.get_standardized_matrix()
+
+        first_cache = MatrixCache(dirpath=cache_dirpath)
+        first = db.get_standardized_matrix(cache=first_cache)
+        self.assertEqual(first_cache.num_hits, 0)
+        second_cache = MatrixCache(dirpath=cache_dirpath)
+        second = db.get_standardized_matrix(cache=second_cache)
+        self.assertEqual(second_cache.num_hits, 1)
+        self.assertIsInstance(second, np.memmap)
+        self.assertTrue(np.array_equal(first, expected) and np.array_equal(second, expected))
+
+        db.patterns[0].intensities[0] += 1
+        db.get_standardized_matrix(cache=second_cache)
+        self.assertEqual(second_cache.num_hits, 1)
+
+        small_cache = MatrixCache(dirpath=cache_dirpath, max_bytes=expected.nbytes)
+        db.get_standardized_matrix(num_entries=1024, cache=small_cache)
+        self.assertEqual(len(small_cache.load_manifest()), 1)
+        self.assertEqual(len([f for f in os.listdir(cache_dirpath) if f.endswith('.npy')]), 1)
+        with self.assertRaises(ValueError):
+            db.get_standardized_matrix(out=np.empty_like(expected), cache=small_cache)
+
+        with mock.patch.object(PatternDB, 'get_standardized_matrix', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                small_cache.get_matrix(db=db, num_entries=512)
+        self.assertEqual([f for f in os.listdir(cache_dirpath) if f.endswith('.tmp')], [])
+
+        shared_cache = MatrixCache(dirpath=tempfile.mkdtemp())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda num : shared_cache.store(key=f'key_{num}', entry={'nbytes' : 1}), range(64)))
+        self.assertEqual(len(shared_cache.load_manifest()), 64)
+
+    def test_archive_load(self):
+        dir_db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw'])
+        fnames = [os.path.basename(fpath) for fpath in dir_db.fpath_dict.keys()]
+
+        archive_dirpath = tempfile.mkdtemp()
+        zip_fpath = os.path.join(archive_dirpath, 'patterns.zip')
+        tar_fpath = os.path.join(archive_dirpath, 'patterns.tar.gz')
+        with zipfile.ZipFile(zip_fpath, 'w') as zf, tarfile.open(tar_fpath, 'w:gz') as tf:
+            for fname in fnames:
+                fpath = os.path.join(DataExamples.get_datafolder_fpath(), fname)
+                zf.write(fpath, arcname=f'data/{fname}')
+                tf.add(fpath, arcname=f'data/{fname}')
+
+        for archive_fpath in [zip_fpath, tar_fpath]:
+            archive_db = PatternDB.load(dirpath=archive_fpath, suffixes=['.raw'])
+            self.assertEqual(sorted(archive_db.fpath_dict.keys()), sorted([f'data/{fname}' for fname in fnames]))
+            for fname in fnames:
+                self.assertEqual(archive_db.fpath_dict[f'data/{fname}'], dir_db.fpath_dict[os.path.join(DataExamples.get_datafolder_fpath(), fname)])
+
+    def test_store_roundtrip(self):
+        db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw', '.json'])
+        store_dirpath = os.path.join(tempfile.mkdtemp(), 'store')
+        db.save(dirpath=store_dirpath, as_store=True, shard_size=2)
+
+        store = PatternStore(dirpath=store_dirpath)
+        self.assertEqual(len(store), len(db.patterns))
+        self.assertEqual(store.shard_sizes, [2, 1])
+        self.assertEqual(store[-1], db.patterns[-1])
+        self.assertEqual(store.get_fpath(index=0), list(db.fpath_dict.keys())[0])
+
+        stored = store[0]
+        stored.intensities *= 2
+        stored.two_theta_values[0] = -1
+        self.assertTrue(np.array_equal(stored.intensities, 2 * db.patterns[0].intensities))
+        self.assertEqual(store[0], db.patterns[0])
+
+        reloaded_db = PatternDB.load(dirpath=store_dirpath)
+        self.assertEqual(db, reloaded_db)
+        self.assertEqual(list(db.fpath_dict.keys()), list(reloaded_db.fpath_dict.keys()))
+
+    def test_lazy_store_load(self):
+        pattern = XrdPattern.load(fpath=DataExamples.get_bruker_fpath())
+        num_records_read = []
+        original_get_record = StoreShard.get_record
+        def counting_get_record(shard, index : int) -> dict:
+            num_records_read.append(index)
+            return original_get_record(shard, index=index)
+
+        for num_patterns in [10, 1000]:
+            store_dirpath = os.path.join(tempfile.mkdtemp(), 'store')
+            PatternStore.write(dirpath=store_dirpath, entries=((f'p_{j}.raw', pattern) for j in range(num_patterns)), shard_size=100)
+            num_records_read.clear()
+            with mock.patch.object(StoreShard, 'get_record', counting_get_record):
+                db = PatternDB.load(dirpath=store_dirpath)
+                self.assertEqual(len(db.patterns), num_patterns)
+                self.assertEqual(num_records_read, [])
+
+                self.assertEqual(db.patterns[-1], pattern)
+                self.assertIs(db.patterns[-1], db.patterns[num_patterns - 1])
+                self.assertEqual((len(num_records_read), db.patterns.num_loaded), (1, 1))
+
+                db._add_pattern(pattern=pattern, fpath='extra.raw')
+                self.assertEqual(len(db.fpath_dict), num_patterns + 1)
+                self.assertEqual(len(db.patterns), num_patterns + 1)
+
+        limited_db = PatternDB.load(dirpath=store_dirpath, limit_patterns=5)
+        self.assertEqual(len(limited_db.patterns), 5)
+        self.assertEqual(list(limited_db.fpath_dict.keys()), [f'p_{j}.raw' for j in range(5)])
+
+    def test_query_index(self):
+        db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath())
+        for label_type in [LabelType.spg, LabelType.primary_wavelength, LabelType.secondary_wavelength]:
+            view = db.query(labels=[label_type])
+            expected = [p for p in db.patterns if p.has_label(label_type=label_type)]
+            self.assertEqual(view.patterns, expected)
+
+        view = db.query(num_entries=(1000, None)).query(any_labels=LabelType.get_main_labels())
+        self.assertEqual(view.patterns, [p for p in db.patterns if p.num_entries >= 1000 and p.is_partially_labeled])
+        self.assertFalse(db.index['num_entries'].flags.writeable)
+
+        merged = db + db
+        self.assertEqual(len(merged.index), 2 * len(db.patterns))
+        self.assertEqual(list(merged.index.get_original_formats()), 2 * list(db.index.get_original_formats()))
+
+        db.set_xray(xray_info=XrayInfo.copper_xray())
+        self.assertEqual(len(db.query(labels=[LabelType.secondary_wavelength])), len(db.patterns))
+        db._add_pattern(pattern=db.patterns[0], fpath='duplicate')
+        self.assertEqual(len(db.index), len(db.patterns))
+
+        def count_labeled(the_db : PatternDB, label_type : LabelType) -> int:
+            return sum(p.has_label(label_type=label_type) for p in the_db.patterns)
+
+        unindexed_db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath())
+        merged = db + unindexed_db
+        self.assertIsNone(merged._index)
+        self.assertEqual(len(merged.query(labels=[LabelType.spg])), count_labeled(merged, LabelType.spg))
+
+        is_labeled = db.patterns[-1].has_label(label_type=LabelType.spg)
+        db.patterns[-1] = [p for p in db.patterns if p.has_label(label_type=LabelType.spg) != is_labeled][0]
+        self.assertEqual(len(db.query(labels=[LabelType.spg])), count_labeled(db, LabelType.spg))
+        db.patterns.pop()
+        self.assertEqual(len(db.query(labels=[LabelType.spg])), count_labeled(db, LabelType.spg))
+
+        with self.assertRaises(ValueError):
+            db.query(labels=[LabelType.lengths])
+
+    def test_deduplicate(self):
+        dirpath = tempfile.mkdtemp()
+        for fname in ['bruker.raw', 'stoe.raw']:
+            for prefix in ['', 'copy_']:
+                shutil.copy(os.path.join(DataExamples.get_datafolder_fpath(), fname), os.path.join(dirpath, f'{prefix}{fname}'))
+        bruker = XrdPattern.load(fpath=DataExamples.get_bruker_fpath())
+        rescaled = XrdPattern(two_theta_values=bruker.two_theta_values, intensities=2 * bruker.intensities + 1,
+                              powder_experiment=bruker.powder_experiment)
+        rescaled.save(fpath=os.path.join(dirpath, 'rescaled.json'))
+
+        exact_db = PatternDB.load(dirpath=dirpath, dedup=Deduplicator())
+        self.assertEqual(len(exact_db.patterns), 3)
+
+        dedup = Deduplicator(near_duplicates=True)
+        near_db = PatternDB.load(dirpath=dirpath, dedup=dedup)
+        self.assertEqual(len(near_db.patterns), 2)
+        clusters = dedup.get_duplicate_clusters()
+        self.assertEqual(sum(len(c.exact_duplicates) for c in clusters), 2)
+        self.assertEqual([os.path.basename(f) for c in clusters for f in c.near_duplicates], ['rescaled.json'])
+
+        merged = PatternDB.merge(dbs=[near_db, exact_db], dedup=dedup)
+        self.assertEqual(merged.patterns, near_db.patterns)
+        self.assertEqual(list(merged.fpath_dict.keys()), list(near_db.fpath_dict.keys()))
+        self.assertEqual(sum(len(c.exact_duplicates) for c in dedup.get_duplicate_clusters()), 4)
+        self.assertEqual(len((near_db + exact_db).patterns), 5)
+
+    def test_scan_headers(self):
+        db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath(), suffixes=['.raw', '.json'])
+        save_dirpath = os.path.join(tempfile.mkdtemp(), 'saved')
+        store_dirpath = os.path.join(tempfile.mkdtemp(), 'store')
+        db.save(dirpath=save_dirpath)
+        db.save(dirpath=store_dirpath, as_store=True)
+
+        for dirpath in [save_dirpath, store_dirpath]:
+            headers = [header for _, header in PatternDB.scan_headers(dirpath=dirpath)]
+            self.assertEqual(len(headers), len(db.patterns))
+            self.assertEqual(sorted(h.num_entries for h in headers), sorted(p.num_entries for p in db.patterns))
+            self.assertEqual(sum(h.xray_info.primary_wavelength is not None for h in headers),
+                             sum(p.powder_experiment.xray_info.primary_wavelength is not None for p in db.patterns))
+
+    def test_standardized_matrix(self):
+        db = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath())
+        grid_pattern = db.patterns[0]
+        for scale in [2, 3]:
+            db._add_pattern(pattern=XrdPattern(two_theta_values=grid_pattern.two_theta_values,
+                                               intensities=scale * grid_pattern.intensities + scale,
+                                               powder_experiment=grid_pattern.powder_experiment), fpath=f'scaled_{scale}')
+        expected = np.stack([p.get_pattern_data()[1] for p in db.patterns])
+
+        matrix = db.get_standardized_matrix(dtype=np.float64, batch_size=3)
+        self.assertEqual(matrix.shape, (len(db.patterns), XrdPattern.std_num_entries()))
+        self.assertTrue(np.allclose(matrix, expected, atol=1e-10))
+
+        out = np.lib.format.open_memmap(os.path.join(tempfile.mkdtemp(), 'std.npy'), mode='w+', dtype=np.float32,
+                                        shape=matrix.shape)
+        db.get_standardized_matrix(out=out)
+        self.assertTrue(np.allclose(out, expected, atol=1e-6))
+        with self.assertRaises(ValueError):
+            db.get_standardized_matrix(num_entries=100, out=out)
+
+        cache = OperatorCache()
+        for _ in range(2):
+            self.assertTrue(np.allclose(standardize_batch(db.patterns, std_angles=get_std_angles(), cache=cache), expected))
+        self.assertGreaterEqual(cache.misses, 1)
+        self.assertEqual((cache.hits, len(cache)), (cache.misses, cache.misses))
+
 
 if __name__ == "__main__":
     TestPatternDB.execute_all()
\ No newline at end of file
@@ -1,6 +1,9 @@
+import json
 import os.path
 import tempfile
 
+import numpy as np
+import orjson
 from matplotlib import pyplot as plt
 from pymatgen.core import Lattice
 
@@ -8,8 +11,10 @@ from tests.base_pattern import ParserBaseTest
 from xrdpattern.crystal import CrystalExamples, CrystalStructure
 from xrdpattern.parsing import Formats
 from xrdpattern.parsing.examples import DataExamples
-from xrdpattern.pattern import XrdPattern
-from xrdpattern.xrd import PowderExperiment, LabelType
+from xrdpattern.pattern import XrdPattern, InterpolationMethod
+from xrdpattern.pattern.interpolation import rebin
+from xrdpattern.pattern.view_cache import view_cache, StandardizedViewCache, ViewEntry
+from xrdpattern.xrd import PowderExperiment, LabelType, PatternHeader, XrdData
 
 
 # ---------------------------------------------------------
@@ -35,6 +40,71 @@ class TestXrdPattern(ParserBaseTest):
         print(f'labeled after roundtrip \n:{self.fully_labeled.get_info_as_str()[:500]} + '
               f'{self.fully_labeled.get_info_as_str()[-500:]}')
 
+    def test_binary_roundtrip(self):
+        for pattern in [self.unlabeled, self.fully_labeled]:
+            json_reloaded = self.save_and_load(pattern)
+            binary_reloaded = self.save_and_load(pattern, suffix=Formats.aimat_binary_suffix())
+
+            self.assertEqual(pattern, binary_reloaded)
+            self.assertEqual(json_reloaded.to_str(), binary_reloaded.to_str())
+            for arr in [binary_reloaded.two_theta_values, binary_reloaded.intensities]:
+                self.assertTrue(arr.flags.writeable and arr.flags.owndata)
+
+            zero_copy = XrdData.from_bytes(data=pattern.to_bytes(), copy=False)
+            self.assertFalse(zero_copy.intensities.flags.writeable)
+            self.assertTrue(np.array_equal(zero_copy.intensities, pattern.intensities))
+
+        if os.path.isdir('/proc/self/fd'):
+            save_path = os.path.join(tempfile.mkdtemp(), f'pattern.{Formats.aimat_binary_suffix()}')
+            self.unlabeled.save(fpath=save_path)
+            reloaded = [XrdPattern.load(fpath=save_path) for _ in range(50)]
+            open_fpaths = [os.path.realpath(os.path.join('/proc/self/fd', fd)) for fd in os.listdir('/proc/self/fd')]
+            self.assertNotIn(os.path.realpath(save_path), open_fpaths)
+            self.assertEqual(len(reloaded), 50)
+
+    def test_load_header(self):
+        for suffix in [Formats.aimat_suffix(), Formats.aimat_binary_suffix()]:
+            for pattern in [self.unlabeled, self.fully_labeled, self.lattice_only]:
+                save_path = os.path.join(tempfile.mkdtemp(), f'pattern.{suffix}')
+                pattern.save(fpath=save_path)
+                header = XrdPattern.load_header(fpath=save_path)
+
+                self.assertEqual(header.num_entries, pattern.num_entries)
+                self.assertEqual(header.metadata, pattern.metadata)
+                self.assertEqual(header.xray_info, pattern.powder_experiment.xray_info)
+                for label_type in LabelType.get_main_labels():
+                    self.assertEqual(header.has_label(label_type=label_type), pattern.has_label(label_type=label_type))
+                if pattern.primary_phase is not None:
+                    self.assertEqual(header.spacegroup, pattern.primary_phase.spacegroup)
+
+        pattern_dict = orjson.loads(self.unlabeled.to_str())
+        pattern_dict['metadata']['tags'] = ['two_theta_values', '"intensities', '{"intensities":[]}']
+        reordered = {key : pattern_dict[key] for key in ['metadata', 'label', 'intensities', 'two_theta_values']}
+        header = PatternHeader.from_json(content=orjson.dumps(reordered))
+        self.assertEqual(header.num_entries, self.unlabeled.num_entries)
+        self.assertEqual(header.metadata.tags, pattern_dict['metadata']['tags'])
+
+    def test_legacy_layout(self):
+        pattern = self.fully_labeled
+        flat_dict = orjson.loads(pattern.to_str())
+        self.assertIsInstance(flat_dict['label']['phases'][0]['basis'][0], dict)
+
+        experiment, phase = pattern.powder_experiment, pattern.primary_phase
+        phase_dict = phase.to_dict()
+        phase_dict['lattice'] = str(tuple(phase_dict['lattice']))
+        phase_dict['basis'] = json.dumps([site.to_str() for site in phase.basis])
+        label_dict = experiment.to_dict()
+        label_dict['phases'] = [json.dumps(phase_dict)]
+        label_dict['xray_info'] = experiment.xray_info.to_str()
+        legacy_str = json.dumps({'two_theta_values' : pattern.two_theta_values.tolist(),
+                                 'intensities' : pattern.intensities.tolist(),
+                                 'label' : json.dumps(label_dict),
+                                 'metadata' : pattern.metadata.to_str()})
+
+        reloaded = XrdPattern.from_str(legacy_str)
+        self.assertEqual(pattern, reloaded)
+        self.assertEqual(experiment, reloaded.powder_experiment)
+
     def test_plot(self):
         if self.is_manual_mode:
             self.skipTest(reason='Only available in manual mode')
@@ -44,6 +114,52 @@ class TestXrdPattern(ParserBaseTest):
         two_theta_values, _ = pattern.get_pattern_data(apply_standardization=True)
         self.assertTrue(len(two_theta_values) == XrdPattern.std_num_entries())
 
+    def test_interpolation_methods(self):
+        pattern = self.unlabeled
+        for method in InterpolationMethod:
+            two_theta_values, intensities = pattern.get_pattern_data(method=method)
+            self.assertEqual(len(intensities), XrdPattern.std_num_entries())
+            self.assertEqual((np.min(intensities), np.max(intensities)), (0, 1))
+        self.assertTrue(np.array_equal(pattern.get_pattern_data(method='linear')[1],
+                                       pattern.get_pattern_data(method=InterpolationMethod.linear)[1]))
+
+        x, y = np.asarray(pattern.two_theta_values), np.asarray(pattern.intensities)
+        centers = np.linspace(x[0], x[-1], num=200)
+        edges = np.concatenate(([x[0]], (centers[1:] + centers[:-1]) / 2, [x[-1]]))
+        area = np.sum(rebin(x=x, y=y, centers=centers) * np.diff(edges))
+        self.assertTrue(np.isclose(area, np.trapz(y, x)))
+
+    def test_view_cache(self):
+        pattern = self.unlabeled
+        pattern.get_pattern_data()
+        self.assertFalse(view_cache.is_enabled)
+        self.assertEqual(len(view_cache), 0)
+
+        view_cache.enable()
+        try:
+            num_hits = view_cache.hits
+            _, first = pattern.get_pattern_data()
+            first[:] = 0
+            _, second = pattern.get_pattern_data()
+            self.assertEqual(view_cache.hits, num_hits + 1)
+            self.assertEqual(np.max(second), 1)
+
+            pattern.intensities[len(pattern.intensities) // 2] += 10 * np.max(pattern.intensities)
+            self.assertFalse(np.array_equal(pattern.get_pattern_data()[1], second))
+            pattern.two_theta_values = pattern.two_theta_values + 1
+            self.assertEqual(view_cache.hits, num_hits + 1)
+        finally:
+            view_cache.disable()
+        self.assertEqual(len(view_cache), 0)
+
+        angles, intensities = np.zeros(100), np.zeros(100)
+        cache = StandardizedViewCache(max_bytes=3 * ViewEntry(pattern=pattern, angles=angles, intensities=intensities).nbytes)
+        for num_entries in [100, 200, 300, 400]:
+            cache.put(pattern=pattern, params=(num_entries,), angles=angles, intensities=intensities)
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get(pattern=pattern, params=(100,)))
+        self.assertIsNotNone(cache.get(pattern=pattern, params=(400,)))
+
     def test_data_ok(self):
         raw_data = self.pattern.get_pattern_data(apply_standardization=False)
         std_data = self.pattern.get_pattern_data(apply_standardization=True)
@@ -92,8 +208,8 @@ class TestXrdPattern(ParserBaseTest):
         self.assertTrue(self.fully_labeled.has_label(label_type=LabelType.spg))
 
     @staticmethod
-    def save_and_load(pattern : XrdPattern) -> XrdPattern:
-        save_path = os.path.join(tempfile.mkdtemp(), f'pattern.{Formats.aimat_suffix()}')
+    def save_and_load(pattern : XrdPattern, suffix : str = Formats.aimat_suffix()) -> XrdPattern:
+        save_path = os.path.join(tempfile.mkdtemp(), f'pattern.{suffix}')
         pattern.save(fpath=save_path)
         reloaded_pattern = XrdPattern.load(fpath=save_path)
         return reloaded_pattern
@@ -4,9 +4,10 @@ import json, os
 from dataclasses import dataclass
 from typing import Optional
 
+import orjson
 from pymatgen.core import Species
 
-from xrdpattern.serialization import Serializable
+from xrdpattern.serialization import Serializable, dumps_json
 
 ScatteringParams = tuple[float, float, float, float, float, float, float, float]
 #---------------------------------------------------------
@@ -32,15 +33,19 @@ class AtomSite(Serializable):
     # save/load
 
     def to_str(self) -> str:
-        the_dict = {'x': self.x, 'y': self.y, 'z': self.z, 'occupancy': self.occupancy,
-                    'symbol': self.species_str,
-                    'wyckoff_letter': self.wyckoff_letter}
-
-        return json.dumps(the_dict)
+        return dumps_json(self.to_dict()).decode('utf-8')
 
     @classmethod
     def from_str(cls, s: str):
-        the_dict = json.loads(s)
+        return cls.from_dict(orjson.loads(s))
+
+    def to_dict(self) -> dict:
+        return {'x': self.x, 'y': self.y, 'z': self.z, 'occupancy': self.occupancy,
+                'symbol': self.species_str,
+                'wyckoff_letter': self.wyckoff_letter}
+
+    @classmethod
+    def from_dict(cls, the_dict : dict):
         return cls(x=the_dict['x'], y=the_dict['y'], z=the_dict['z'], occupancy=the_dict['occupancy'],
                    species_str=the_dict['symbol'], wyckoff_letter=the_dict['wyckoff_letter'])
 
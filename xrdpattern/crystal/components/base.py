@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import math
 from typing import Iterable
 
-from xrdpattern.serialization import Serializable
+import orjson
+
+from xrdpattern.serialization import Serializable, dumps_json
 from .atomic_site import AtomSite
 
 
@@ -67,11 +68,17 @@ class CrystalBasis(Serializable):
 
     @classmethod
     def from_str(cls, s: str):
-        site_strs = json.loads(s)
-        return cls([AtomSite.from_str(site_str) for site_str in site_strs])
+        return cls.from_dict(orjson.loads(s))
 
     def to_str(self) -> str:
-        return json.dumps([site.to_str() for site in self])
+        return dumps_json(self.to_dict()).decode('utf-8')
+
+    @classmethod
+    def from_dict(cls, d : list[dict | str]):
+        return cls([AtomSite.from_entry(site) for site in d])
+
+    def to_dict(self) -> list[dict]:
+        return [site.to_dict() for site in self]
 
     def __str__(self):
         return str([x for x in self])
\ No newline at end of file
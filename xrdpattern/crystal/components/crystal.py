@@ -6,7 +6,9 @@ import logging
 from dataclasses import dataclass, asdict
 from typing import Optional, Literal
 
+import gemmi
 from distlib.util import cached_property
+from gemmi import cif
 from pymatgen.core import Structure, Lattice, Species, Element
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
@@ -18,13 +20,31 @@ logger = logging.getLogger(__name__)
 CrystalSystem = Literal["cubic", "hexagonal", "monoclinic", "orthorhombic", "tetragonal", "triclinic", "trigonal"]
 # ---------------------------------------------------------
 
+class SymmetryProperty:
+    """Field descriptor for attributes derived by calculate_properties. On structures marked via defer_properties
+    the (expensive) symmetry analysis only runs on first access of any such attribute. If it fails, the error is
+    raised again on every access"""
+    def __set_name__(self, owner, name):
+        self.private_name = f'_{name}'
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return None
+        if obj.__dict__.get('_properties_deferred', False):
+            obj.calculate_properties()
+        return obj.__dict__.get(self.private_name)
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.private_name] = value
+
+
 @dataclass
 class CrystalStructure(JsonDataclass):
     lattice : Optional[Lattice]
     basis : Optional[CrystalBasis]
-    spacegroup : Optional[int] = None
-    chemical_composition : Optional[str] = None
-    wyckoff_symbols : Optional[list[str]] = None
+    spacegroup : Optional[int] = SymmetryProperty()
+    chemical_composition : Optional[str] = SymmetryProperty()
+    wyckoff_symbols : Optional[list[str]] = SymmetryProperty()
     phase_fraction: Optional[float] = None
 
     def __post_init__(self):
@@ -48,6 +68,27 @@ class CrystalStructure(JsonDataclass):
         crystal_structure = cls.from_pymatgen(pymatgen_structure)
         return crystal_structure
 
+    @classmethod
+    def from_cif_block(cls, block : cif.Block) -> CrystalStructure:
+        """Builds the unit cell content from an already parsed gemmi block by applying its symmetry operations.
+        Raises on content that cannot be converted to a pymatgen structure, as the symmetry analysis would"""
+        small_structure = gemmi.make_small_structure_from_block(block)
+        sites = small_structure.get_all_unit_cell_sites()
+        if len(sites) == 0:
+            raise ValueError(f'Cif block {block.name} does not contain any atomic sites')
+
+        cell = small_structure.cell
+        lattice = Lattice.from_parameters(cell.a, cell.b, cell.c, cell.alpha, cell.beta, cell.gamma)
+        base : CrystalBasis = CrystalBasis(atomic_sites=[])
+        for site in sites:
+            species = Species(symbol=site.element.name, oxidation_state=site.charge)
+            x, y, z = (coord % 1 for coord in site.fract.tolist())
+            base.append(AtomSite(x, y, z, occupancy=site.occ, species_str=str(species)))
+
+        crystal_structure = cls(lattice=lattice, basis=base)
+        crystal_structure.to_pymatgen()
+        return crystal_structure
+
     @classmethod
     def from_pymatgen(cls, pymatgen_structure: Structure) -> CrystalStructure:
         lattice = pymatgen_structure.lattice
@@ -93,6 +134,9 @@ class CrystalStructure(JsonDataclass):
     # ---------------------------------------------------------
     # properties
 
+    def defer_properties(self):
+        self.__dict__['_properties_deferred'] = True
+
     def calculate_properties(self):
         if self.basis is None:
             raise ValueError('Base is empty! Cannot calculate properties of empty crystal. Aborting ...')
@@ -104,6 +148,7 @@ class CrystalStructure(JsonDataclass):
         self.spacegroup = analyzer.get_space_group_number()
         self.wyckoff_symbols = symmetry_dataset['wyckoffs']
         self.chemical_composition = pymatgen_structure.composition.formula
+        self.__dict__.pop('_properties_deferred', None)
 
     def get_standardized(self) -> CrystalStructure:
         if self.lattice is None:
@@ -167,13 +212,23 @@ class CrystalStructure(JsonDataclass):
         return self.lattice.lengths
 
     @staticmethod
-    def make_basic(basic_cls, s: str):
+    def get_basic_decoder(basic_cls):
         if basic_cls == Lattice:
-            arr = s[1:-1].split(',')
-            params = [float(x) for x in arr]
-            return Lattice.from_parameters(*params)
+            return CrystalStructure.make_lattice
+        else:
+            return JsonDataclass.get_basic_decoder(basic_cls)
+
+    @staticmethod
+    def make_lattice(s : str | list[float]) -> Lattice:
+        params = [float(x) for x in s[1:-1].split(',')] if isinstance(s, str) else s
+        return Lattice.from_parameters(*params)
+
+    @classmethod
+    def get_native_entry(cls, obj):
+        if isinstance(obj, Lattice):
+            return [*obj.lengths, *obj.angles]
         else:
-            return JsonDataclass.make_basic(basic_cls, s)
+            return super().get_native_entry(obj)
 
     @staticmethod
     def get_basic_entry(obj):
@@ -1 +1,2 @@
-from .master import MasterParser, XrdFormat, Formats
\ No newline at end of file
+from .master import MasterParser, XrdFormat, Formats
+from .archive import ArchiveReader
\ No newline at end of file
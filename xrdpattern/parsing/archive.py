@@ -0,0 +1,58 @@
+import os
+import tarfile
+import zipfile
+from typing import Iterator, Optional
+
+from xrdpattern.parsing.path_tools import PathTools
+
+# -------------------------------------------
+
+class ArchiveReader:
+    zip_suffixes = ['.zip']
+    tar_suffixes = ['.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz']
+
+    @classmethod
+    def is_archive(cls, fpath : str) -> bool:
+        return os.path.isfile(fpath) and (cls.is_zip(fpath) or cls.is_tar(fpath))
+
+    @classmethod
+    def is_zip(cls, fpath : str) -> bool:
+        return any(fpath.lower().endswith(s) for s in cls.zip_suffixes)
+
+    @classmethod
+    def is_tar(cls, fpath : str) -> bool:
+        return any(fpath.lower().endswith(s) for s in cls.tar_suffixes)
+
+    @classmethod
+    def count_members(cls, fpath : str, selected_suffixes : list[str]) -> Optional[int]:
+        """Number of members matching selected_suffixes if it can be determined without reading the archive
+        content (zip central directory), otherwise None"""
+        if not cls.is_zip(fpath):
+            return None
+        with zipfile.ZipFile(fpath) as zf:
+            return len([info for info in zf.infolist() if cls._is_selected(info.filename, selected_suffixes) and not info.is_dir()])
+
+    @classmethod
+    def iter_members(cls, fpath : str, selected_suffixes : list[str]) -> Iterator[tuple[str, bytes]]:
+        """Yields (member name, content) for regular archive members matching selected_suffixes. Tar archives are
+        read in stream mode so only one member is held in memory at a time"""
+        if cls.is_zip(fpath):
+            with zipfile.ZipFile(fpath) as zf:
+                for info in zf.infolist():
+                    if info.is_dir() or not cls._is_selected(info.filename, selected_suffixes):
+                        continue
+                    yield info.filename, zf.read(info)
+        elif cls.is_tar(fpath):
+            with tarfile.open(fpath, mode='r|*') as tf:
+                for member in tf:
+                    if not member.isfile() or not cls._is_selected(member.name, selected_suffixes):
+                        continue
+                    yield member.name, tf.extractfile(member).read()
+        else:
+            raise ValueError(f"File {fpath} is not a supported archive. Supported suffixes are {cls.zip_suffixes + cls.tar_suffixes}")
+
+    @staticmethod
+    def _is_selected(member_name : str, selected_suffixes : list[str]) -> bool:
+        if member_name.startswith('__MACOSX/'):
+            return False
+        return PathTools.get_suffix(fpath=member_name) in selected_suffixes
@@ -0,0 +1 @@
+from .layout import BinaryReader, Quantity, FloatQuantity, IntegerQuantity, BooleanQuantity, DataType
\ No newline at end of file
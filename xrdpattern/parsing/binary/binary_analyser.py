@@ -1,6 +1,12 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+from numpy.typing import NDArray
+
 # region should work such that the_list[reg.start, reg.end] yield the specified portion of the list
 @dataclass
 class Region:
@@ -11,26 +17,44 @@ class Region:
         if self.start == self.end:
             raise ValueError(f'Region start and end must be different; Got {self.start} and {self.end} respectively')
 
-def get_zero_regions(byte_content: bytes, min_size: int = 16) -> list[Region]:
-    zero_regions = []
-    current_zeros = 0
-    current_region_start = None
 
-    for index, byte in enumerate(byte_content):
-        if byte == 0:
-            if current_region_start is None:
-                current_region_start = index
-            current_zeros += 1
-        else:
-            if current_zeros >= min_size:
-                zero_regions.append(Region(start=current_region_start, end=index))
-            current_zeros = 0
-            current_region_start = None
+@dataclass
+class ArrayBlock:
+    """Run of at least min_length consecutive plausible values of dtype starting at byte offset start"""
+    start : int
+    num_values : int
+    dtype : str
 
-    if current_zeros >= min_size:
-        zero_regions.append(Region(start=current_region_start, end=len(byte_content)))
+    @property
+    def end(self) -> int:
+        return self.start + self.num_values * np.dtype(self.dtype).itemsize
 
-    return zero_regions
+
+@dataclass
+class BinaryReport:
+    """Offsets that are stable across a set of sample files of one (unknown) binary format"""
+    fpaths : list[str]
+    constant_regions : list[Region] = field(default_factory=list)
+    float_offsets : list[int] = field(default_factory=list)
+    int_offsets : list[int] = field(default_factory=list)
+    block_starts : list[int] = field(default_factory=list)
+
+    def __str__(self):
+        constant_strs = [f'[{r.start}:{r.end}]' for r in self.constant_regions]
+        return (f'Binary report over {len(self.fpaths)} files:\n'
+                f'- Constant regions : {", ".join(constant_strs)}\n'
+                f'- Float32 offsets  : {self.float_offsets}\n'
+                f'- Int32 offsets    : {self.int_offsets}\n'
+                f'- Array blocks at  : {self.block_starts}')
+
+# -------------------------------------------
+# single file
+
+def get_zero_regions(byte_content: bytes, min_size: int = 16) -> list[Region]:
+    arr = np.frombuffer(byte_content, dtype=np.uint8)
+    starts, ends = get_runs(mask=arr == 0)
+    keep = (ends - starts) >= min_size
+    return [Region(start=int(s), end=int(e)) for s, e in zip(starts[keep], ends[keep])]
 
 
 def get_complement_regions(byte_content : bytes, regions : list[Region]) -> list[Region]:
@@ -55,6 +79,92 @@ def get_complement_regions(byte_content : bytes, regions : list[Region]) -> list
     return complement_regions
 
 
+def get_plausible_mask(byte_content : bytes, dtype : str = '<f4',
+                       min_abs : float = 1e-3, max_abs : float = 1e6, allow_zero : bool = False) -> NDArray:
+    """Boolean mask over every byte offset (i.e. all alignments) indicating whether the value of dtype
+    starting at that offset is finite and has min_abs <= |value| <= max_abs (or is zero if allow_zero)"""
+    dtype = np.dtype(dtype)
+    num_offsets = max(len(byte_content) - dtype.itemsize + 1, 0)
+    mask = np.zeros(num_offsets, dtype=bool)
+    for alignment in range(min(dtype.itemsize, num_offsets)):
+        count = (len(byte_content) - alignment) // dtype.itemsize
+        values = np.frombuffer(byte_content, dtype=dtype, count=count, offset=alignment).astype(np.float64)
+        with np.errstate(invalid='ignore'):
+            abs_values = np.abs(values)
+            plausible = np.isfinite(values) & (abs_values >= min_abs) & (abs_values <= max_abs)
+        if allow_zero:
+            plausible |= values == 0
+        mask[alignment::dtype.itemsize] = plausible
+    return mask
+
+
+def get_array_blocks(byte_content : bytes, dtype : str = '<f4', min_length : int = 50, **plausibility_kwargs) -> list[ArrayBlock]:
+    """Finds runs of at least min_length consecutive plausible values of dtype at every alignment"""
+    itemsize = np.dtype(dtype).itemsize
+    mask = get_plausible_mask(byte_content, dtype=dtype, **plausibility_kwargs)
+    blocks = []
+    for alignment in range(itemsize):
+        starts, ends = get_runs(mask=mask[alignment::itemsize])
+        keep = (ends - starts) >= min_length
+        for s, e in zip(starts[keep], ends[keep]):
+            blocks.append(ArrayBlock(start=int(alignment + s * itemsize), num_values=int(e - s), dtype=dtype))
+    blocks.sort(key=lambda b: b.start)
+    return blocks
+
+
+def get_runs(mask : NDArray) -> tuple[NDArray, NDArray]:
+    """Start (inclusive) and end (exclusive) indices of runs of True values in mask"""
+    padded = np.concatenate(([False], np.asarray(mask, dtype=bool), [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return edges[::2], edges[1::2]
+
+# -------------------------------------------
+# multi file
+
+def analyse_files(fpaths : list[str], header_size : int = 4096, min_block_length : int = 50) -> BinaryReport:
+    """Compares the first header_size bytes of several files of the same format to find constant regions
+    (magic bytes, version fields) and offsets that hold plausible float32/int32 values in every file while
+    differing between files (candidate header fields). Also reports array block starts shared by all files"""
+    if len(fpaths) == 0:
+        raise ValueError('No files to analyse')
+
+    contents = []
+    for fpath in fpaths:
+        with open(fpath, 'rb') as f:
+            contents.append(f.read())
+    header_len = min(header_size, *[len(c) for c in contents])
+    headers = np.stack([np.frombuffer(c, dtype=np.uint8, count=header_len) for c in contents])
+
+    is_constant = np.all(headers == headers[0], axis=0)
+    starts, ends = get_runs(mask=is_constant)
+    constant_regions = [Region(start=int(s), end=int(e)) for s, e in zip(starts, ends)]
+
+    def get_varying_offsets(dtype : str, **plausibility_kwargs) -> list[int]:
+        itemsize = np.dtype(dtype).itemsize
+        masks = np.stack([get_plausible_mask(bytes(h), dtype=dtype, **plausibility_kwargs) for h in headers])
+        windows = np.lib.stride_tricks.sliding_window_view(is_constant, itemsize)
+        is_varying = ~np.all(windows, axis=1)
+        return np.flatnonzero(np.all(masks, axis=0) & is_varying).tolist()
+
+    float_offsets = get_varying_offsets(dtype='<f4')
+    int_offsets = get_varying_offsets(dtype='<i4', min_abs=1, max_abs=10**7)
+
+    block_start_sets = [{b.start for b in get_array_blocks(c, dtype='<i4', min_length=min_block_length, min_abs=1, max_abs=10**7)}
+                        for c in contents]
+    block_starts = sorted(set.intersection(*block_start_sets))
+
+    return BinaryReport(fpaths=fpaths, constant_regions=constant_regions, float_offsets=float_offsets,
+                        int_offsets=int_offsets, block_starts=block_starts)
+
+
+def analyse_directory(dirpath : str, suffix : Optional[str] = None, **kwargs) -> BinaryReport:
+    fpaths = []
+    for root, _, files in os.walk(dirpath):
+        for fname in sorted(files):
+            if suffix is None or fname.lower().endswith(suffix.lower()):
+                fpaths.append(os.path.join(root, fname))
+    return analyse_files(fpaths=fpaths, **kwargs)
+
 
 if __name__ == "__main__":
     test_bytes_1 = bytes([0]*20)
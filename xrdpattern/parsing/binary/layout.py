@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import mmap
+import os
+from abc import abstractmethod
+from enum import Enum
+from typing import Optional, Any
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class DataType(Enum):
+    PASCAL_STRING = 'p'
+    FLOAT = 'f'
+    DOUBLE = 'd'
+    UNSIGNED_CHAR = 'B'
+    SHORT = 'h'
+    UNSIGNED_SHORT = 'H'
+    INT_OR_LONG = 'i'
+    UNSIGNED_INT_OR_LONG = 'I'
+    LONG_LONG = 'q'
+    UNSIGNED_LONG_LONG = 'Q'
+    CHAR = 'c'
+    PAD_BYTE = 'x'
+    BOOLEAN = '?'
+
+    def get_num_bytes(self) -> Optional[int]:
+        size_map = {
+            'b': 1, 'B': 1, '?': 1,
+            'h': 2, 'H': 2,
+            'i': 4, 'I': 4, 'l': 4, 'L': 4,
+            'q': 8, 'Q': 8,
+            'f': 4, 'd': 8,
+            'c': 1, 'x': 1,
+        }
+        return size_map.get(self.value, None)
+
+    def get_numpy_dtype(self) -> np.dtype:
+        """Little endian numpy dtype with the same layout as the corresponding struct format character"""
+        dtype_map = {'c': 'S1', 'x': 'V1', '?': '?'}
+        if self == DataType.PASCAL_STRING:
+            raise ValueError(f'Data type {self} has no fixed size numpy equivalent')
+        return np.dtype(dtype_map.get(self.value, f'<{self.value}'))
+
+
+class Quantity:
+    """Field of a binary layout located at byte offset start. The number of entries is either fixed through size
+    (in bytes) or read from the scalar quantity count_from, which must be extracted first"""
+    def __init__(self, start : int, size : Optional[int] = None, count_from : Optional[Quantity] = None):
+        self.start : int = start
+        self.dtype : DataType = self.get_dtype()
+        self.value : Optional[NDArray] = None
+        self.count_from : Optional[Quantity] = count_from
+        self._size: int = self.dtype.get_num_bytes()
+        if not size is None:
+            self.set_num_bytes(size=size)
+
+    def set_num_bytes(self, size : int):
+        if not size % self.dtype.get_num_bytes() == 0:
+            raise ValueError(f'Size must be a multiple of {self.dtype.get_num_bytes()}')
+        self._size = size
+
+    @abstractmethod
+    def get_dtype(self) -> DataType:
+        pass
+
+    def get_value(self) -> Any:
+        if len(self.value) == 1:
+            return self.value[0].item()
+        else:
+            return self.value
+
+    def extract_value(self, byte_content : bytes):
+        """Sets value to a zero-copy numpy view of the field within byte_content (any buffer, e.g. bytes or mmap)"""
+        if not self.count_from is None:
+            self.set_num_bytes(size=self.count_from.get_value() * self.dtype.get_num_bytes())
+
+        if len(byte_content) < self.start + self._size:
+            raise ValueError(f'Binary content has length {len(byte_content)} but expected at least {self.start + self._size} bytes')
+
+        if self._size == 0:
+            return
+
+        num = self._size // self.dtype.get_num_bytes()
+        self.value = np.frombuffer(byte_content, dtype=self.dtype.get_numpy_dtype(), count=num, offset=self.start)
+
+    def get_fmt_str(self) -> str:
+        num = self._size // self.dtype.get_num_bytes()
+        return f'{num}{self.dtype.value}'
+
+
+class FloatQuantity(Quantity):
+    def get_dtype(self) -> DataType:
+        return DataType.FLOAT
+
+    def get_value(self) -> Union[float, NDArray]:
+        return super().get_value()
+
+
+class IntegerQuantity(Quantity):
+    def get_dtype(self) -> DataType:
+        return DataType.INT_OR_LONG
+
+    def get_value(self) -> Union[int, NDArray]:
+        return super().get_value()
+
+
+class BooleanQuantity(Quantity):
+    def get_dtype(self) -> DataType:
+        return DataType.BOOLEAN
+
+    def get_value(self) -> bool:
+        return super().get_value()
+
+
+class BinaryReader:
+    """Declarative reader for fixed binary layouts: Subclasses define their fields as Quantity attributes in __init__.
+    Quantities whose count is read from another quantity are extracted after all fixed size quantities"""
+    def read(self, fpath : str):
+        if os.path.getsize(fpath) == 0:
+            raise ValueError(f'File {fpath} is empty')
+        with open(fpath, 'rb') as f:
+            byte_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.read_bytes(byte_content=byte_content)
+
+    def read_bytes(self, byte_content : bytes):
+        quantities = [value for value in self.__dict__.values() if isinstance(value, Quantity)]
+        quantities.sort(key=lambda q: not q.count_from is None)
+        for quantity in quantities:
+            quantity.extract_value(byte_content)
@@ -9,19 +9,22 @@ class CifParser:
     def extract(self, fpath : str) -> XrdData:
         with open(fpath, 'r') as f:
             cif_content = f.read()
-        experiment_info = PowderExperiment.from_cif(cif_content=cif_content)
+        return self.extract_str(cif_content=cif_content, name=fpath)
 
-        doc = cif.read_file(fpath)
+    def extract_str(self, cif_content : str, name : str = '<string>') -> XrdData:
+        doc = cif.read_string(cif_content)
         if len(doc) != 1:
-            raise ValueError("Could not find pattern data in .cif located at {fpath}")
+            raise ValueError(f"Could not find pattern data in .cif {name}")
         block = doc.sole_block()
+        experiment_info = PowderExperiment.from_cif_block(block=block)
         x,y = self.extract_pattern_from_block(block)
 
         metadata = Metadata()
-        lines = cif_content.split('\n')
-        for l in lines:
-            if '$Date' in l:
-                parts = l.split()
+        date_index = cif_content.rfind('$Date')
+        if date_index != -1:
+            line_end = cif_content.find('\n', date_index)
+            parts = cif_content[date_index:line_end if line_end != -1 else None].split()
+            if len(parts) > 1:
                 metadata.measurement_date = parts[1]
 
         pattern_data = XrdData(intensities=y, two_theta_values=x, powder_experiment=experiment_info, metadata=metadata)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import csv
+import io
 import math
+from typing import Optional, Iterator, Iterable, IO, Union
 
+import numpy as np
+import openpyxl
 import pandas as pd
+from numpy.typing import NDArray
 
 from xrdpattern.parsing.csv.matrix import Matrix, CsvOrientations
-from xrdpattern.xrd import XrdData, XrdAnode, XrayInfo
+from xrdpattern.xrd import XrdData, XrdAnode, XrayInfo, PowderExperiment
 
 copper_xray_info  = XrayInfo.from_anode(element=XrdAnode.Cu)
 copper_wavelength = copper_xray_info.primary_wavelength
@@ -16,88 +21,210 @@ copper_wavelength = copper_xray_info.primary_wavelength
 
 class CsvParser:
     MAX_Q_VALUE = 60 # Two_theta = 180; lambda=0.21 Angstr;  Wavelength is k-alpha of W (Z=74); In practice no higher sources than Ag (Z=47) found
-
-    def extract_multi(self, fpath: str, pattern_dimension : str) -> list[XrdData]:
-        matrix = self._as_matrix(fpath=fpath, pattern_orientation=pattern_dimension)
-        x_axis_row = matrix.get_x_values()
-        y_axis_rows = [matrix.get_y_data(row=row) for row in range(1, matrix.get_row_count())]
-
-        if len(y_axis_rows) == 0:
+    SNIFF_NUM_CHARS = 2**16
+    SNIFF_NUM_LINES = 50
+    CHUNK_NUM_ROWS = 2**14
+    DELIMITERS = ',;\t |'
+
+    def extract_multi(self, fpath: str, pattern_dimension : Optional[str]) -> list[XrdData]:
+        if fpath.lower().endswith('.xlsx'):
+            with open(fpath, 'rb') as f:
+                return self.extract_xlsx(xlsx_data=f.read(), pattern_dimension=pattern_dimension, name=fpath)
+        return self.extract_multi_str(content=read_text(fpath=fpath), pattern_dimension=pattern_dimension, name=fpath)
+
+    def extract_multi_str(self, content : str, pattern_dimension : Optional[str], name : str = '<string>') -> list[XrdData]:
+        separator = self.get_separator(content=content)
+        table = self.read_table(content=content, separator=separator, name=name)
+        return self.extract_table(table=table, pattern_dimension=pattern_dimension, name=name, separator=separator)
+
+    def extract_xlsx(self, xlsx_data : bytes, pattern_dimension : Optional[str], name : str = '<bytes>') -> list[XrdData]:
+        table = self.read_xlsx_table(xlsx_data=xlsx_data, name=name)
+        return self.extract_table(table=table, pattern_dimension=pattern_dimension, name=name)
+
+    def extract_table(self, table : NDArray, pattern_dimension : Optional[str], name : str, separator : Optional[str] = None) -> list[XrdData]:
+        pattern_dimension = self.get_orientation(num_columns=table.shape[1], pattern_dimension=pattern_dimension, name=name)
+        matrix = self._to_matrix(table=table, pattern_orientation=pattern_dimension)
+        if matrix.get_row_count() < 2:
             return []
-        if not len(x_axis_row) == len(y_axis_rows[0]):
-            raise ValueError(f"X-axis row length {len(x_axis_row)} does not match data row length {len(y_axis_rows[0])}")
-
-        is_qvalues = max(x_axis_row) < CsvParser.MAX_Q_VALUE
-        x_axis_type = 'QValues' if is_qvalues else 'TwoThetaDegs'
-        print(f'The format of the csv file {fpath} was automatically determined/specified as:'
-              f'\n- XAxisType     : \"{x_axis_type}\"'
-              f'\n- Csv Seperator : \"{CsvParser.get_separator(fpath=fpath)}\"'
-              f'\n- Orientation   : \"{pattern_dimension}\"')
 
-        if is_qvalues:
-            two_theta_degs = qvalues_to_copper_angles(qvalues=x_axis_row)
-        else:
-            two_theta_degs = x_axis_row
-
-        pattern_infos = []
-        for intensities in y_axis_rows:
-            new = XrdData.make_unlabeled(two_theta_values=two_theta_degs, intensities=intensities)
-            if is_qvalues:
-                new.powder_experiment.xray_info = copper_xray_info
-            pattern_infos.append(new)
+        x_axis_row = matrix.get_x_values()
+        is_qvalues = self.is_qvalues(x_axis_row=x_axis_row)
+        self.print_format(name=name, is_qvalues=is_qvalues, separator=separator, pattern_dimension=pattern_dimension)
+        two_theta_degs = self.to_two_theta_degs(x_axis_row=x_axis_row, is_qvalues=is_qvalues)
 
-        return pattern_infos
+        return self.make_patterns(two_theta_degs=two_theta_degs, intensity_rows=matrix.numerical_data[1:], is_qvalues=is_qvalues)
 
     def _as_matrix(self, fpath: str, pattern_orientation : str) -> Matrix:
-        table = []
-        seperator = self.get_separator(fpath=fpath)
+        return self._str_as_matrix(content=read_text(fpath=fpath), pattern_orientation=pattern_orientation, name=fpath)
 
-        with open(fpath, 'r', newline='') as f:
-            for line in f:
-                row = [item.strip() for item in line.strip().split(seperator)]
-                if row and any(item for item in row):
-                    table.append(row)
-
-        if self.is_numerical(values=table[0]):
-            numerical_part = table
-        else:
-            numerical_part = table[1:]
+    def _str_as_matrix(self, content : str, pattern_orientation : str, name : str = '<string>') -> Matrix:
+        table = self.read_table(content=content, separator=self.get_separator(content=content), name=name)
+        return self._to_matrix(table=table, pattern_orientation=pattern_orientation)
 
+    @staticmethod
+    def _to_matrix(table : NDArray, pattern_orientation : str) -> Matrix:
         if pattern_orientation == CsvOrientations.VERTICAL:
-            numerical_part = [list(col) for col in zip(*numerical_part)]
-        data = self.to_numerical(numerical_part)
-        matrix = Matrix( numerical_data=data)
+            table = table.T
+        return Matrix(numerical_data=table)
+
+    @staticmethod
+    def get_orientation(num_columns : int, pattern_dimension : Optional[str], name : str) -> str:
+        if num_columns == 2:
+            return CsvOrientations.VERTICAL
+        if pattern_dimension is None:
+            raise ValueError(f"Could not determine orientation of data in csv file {name}")
+        return pattern_dimension
 
-        delta = len(numerical_part) - len(matrix.numerical_data)
-        if delta > 0:
-            print(f'Warning: In {fpath}, {delta} rows were skipped due to non-numerical values')
+    # -------------------------------------------
+    # chunked
+
+    def iter_batches(self, fpath : str, pattern_dimension : Optional[str], batch_size : int = 1000) -> Iterator[list[XrdData]]:
+        """Yields the patterns of a (wide) multi-pattern csv or xlsx file in batches of at most batch_size while the
+        file is being read. Patterns of one x-axis share a single two theta array. Horizontal files are read in row
+        chunks of batch_size; vertical files are read once and split into column batches"""
+        num_columns = self.get_num_columns(fpath=fpath)
+        pattern_dimension = self.get_orientation(num_columns=num_columns, pattern_dimension=pattern_dimension, name=fpath)
+        if pattern_dimension == CsvOrientations.HORIZONTAL:
+            yield from self._iter_horizontal(fpath=fpath, num_columns=num_columns, batch_size=batch_size)
+        else:
+            yield from self._iter_vertical(fpath=fpath, num_columns=num_columns, batch_size=batch_size)
+
+    def _iter_horizontal(self, fpath : str, num_columns : int, batch_size : int) -> Iterator[list[XrdData]]:
+        two_theta_degs, is_qvalues, valid_columns = None, False, None
+        for chunk in self._iter_row_chunks(fpath=fpath, num_columns=num_columns, chunk_size=batch_size):
+            if two_theta_degs is None:
+                x_axis_row, chunk = chunk[0], chunk[1:]
+                valid_columns = ~np.isnan(x_axis_row)
+                is_qvalues = self.is_qvalues(x_axis_row=x_axis_row[valid_columns])
+                self.print_format(name=fpath, is_qvalues=is_qvalues, pattern_dimension=CsvOrientations.HORIZONTAL)
+                two_theta_degs = self.to_two_theta_degs(x_axis_row=x_axis_row[valid_columns], is_qvalues=is_qvalues)
+
+            chunk = drop_nonnumerical_rows(table=chunk[:, valid_columns], name=fpath)
+            if len(chunk) > 0:
+                yield self.make_patterns(two_theta_degs=two_theta_degs, intensity_rows=chunk, is_qvalues=is_qvalues)
+
+    def _iter_vertical(self, fpath : str, num_columns : int, batch_size : int) -> Iterator[list[XrdData]]:
+        chunks = list(self._iter_row_chunks(fpath=fpath, num_columns=num_columns, chunk_size=self.CHUNK_NUM_ROWS))
+        table = drop_nonnumerical_rows(table=np.concatenate(chunks), name=fpath)
+        if len(table) == 0:
+            return
+
+        x_axis_row = table[:, 0]
+        is_qvalues = self.is_qvalues(x_axis_row=x_axis_row)
+        self.print_format(name=fpath, is_qvalues=is_qvalues, pattern_dimension=CsvOrientations.VERTICAL)
+        two_theta_degs = self.to_two_theta_degs(x_axis_row=x_axis_row, is_qvalues=is_qvalues)
+        for start in range(1, num_columns, batch_size):
+            intensity_rows = np.ascontiguousarray(table[:, start:start + batch_size].T)
+            yield self.make_patterns(two_theta_degs=two_theta_degs, intensity_rows=intensity_rows, is_qvalues=is_qvalues)
+
+    def _iter_row_chunks(self, fpath : str, num_columns : int, chunk_size : int) -> Iterator[NDArray]:
+        columns = list(range(num_columns))
+        if fpath.lower().endswith('.xlsx'):
+            rows = skip_header_rows(rows=iter_xlsx_rows(source=fpath))
+            while True:
+                chunk_rows = [row for _, row in zip(range(chunk_size), rows)]
+                if len(chunk_rows) == 0:
+                    break
+                frame = pd.DataFrame(chunk_rows).reindex(columns=columns)
+                yield to_numerical(frame=frame).to_numpy(dtype=np.float64)
+        else:
+            prefix = self.get_prefix(content=read_text(fpath=fpath, num_chars=self.SNIFF_NUM_CHARS + 1))
+            separator = self.get_separator(content=prefix)
+            num_header_lines = self.get_num_header_lines(lines=prefix.split('\n'), separator=separator)
+            read_kwargs = self.get_read_kwargs(separator=separator, num_header_lines=num_header_lines)
+            with pd.read_csv(fpath, chunksize=chunk_size, usecols=columns, **read_kwargs) as reader:
+                for frame in reader:
+                    yield to_numerical(frame=frame).to_numpy(dtype=np.float64)
 
-        return matrix
+    @classmethod
+    def get_num_columns(cls, fpath : str) -> int:
+        if fpath.lower().endswith('.xlsx'):
+            first_row = next(skip_header_rows(rows=iter_xlsx_rows(source=fpath)), ())
+            items = ['' if v is None else str(v) for v in first_row]
+        else:
+            prefix = cls.get_prefix(content=read_text(fpath=fpath, num_chars=cls.SNIFF_NUM_CHARS + 1))
+            separator = cls.get_separator(content=prefix)
+            lines = prefix.split('\n')
+            num_header_lines = cls.get_num_header_lines(lines=lines, separator=separator)
+            items = split_line(line=lines[num_header_lines], separator=separator) if num_header_lines < len(lines) else []
+        while items and not items[-1].strip():
+            items.pop()
+        return len(items)
 
     # -------------------------------------------
     # csv tools
 
+    @classmethod
+    def read_table(cls, content : str, separator : str, name : str = '<string>') -> NDArray:
+        """Loads the numerical block of content as a 2D float array in file orientation. Leading header lines are
+        skipped, trailing empty columns are removed and rows containing non-numerical values are dropped"""
+        num_header_lines = cls.get_num_header_lines(lines=cls.get_prefix(content=content).split('\n'), separator=separator)
+        read_kwargs = cls.get_read_kwargs(separator=separator, num_header_lines=num_header_lines)
+        try:
+            try:
+                frame = pd.read_csv(io.StringIO(content), dtype=np.float64, **read_kwargs)
+            except ValueError:
+                frame = pd.read_csv(io.StringIO(content), dtype=str, **read_kwargs)
+                frame = to_numerical(frame=frame)
+        except pd.errors.ParserError as e:
+            raise ValueError(f'Could not parse csv file {name}: {e}')
+        except pd.errors.EmptyDataError:
+            raise ValueError(f'Csv file {name} does not contain any numerical data')
+
+        table = frame.dropna(axis=1, how='all').to_numpy(dtype=np.float64)
+        return drop_nonnumerical_rows(table=table, name=name)
+
     @staticmethod
-    def get_separator(fpath: str) -> str:
-        with open(fpath, newline='') as csvfile:
-            content = csvfile.read()
-            sniffer = csv.Sniffer()
-            dialect = sniffer.sniff(content)
-            return str(dialect.delimiter)
+    def read_xlsx_table(xlsx_data : bytes, name : str = '<bytes>') -> NDArray:
+        rows = list(skip_header_rows(rows=iter_xlsx_rows(source=io.BytesIO(xlsx_data))))
+        if len(rows) == 0:
+            raise ValueError(f'Xlsx file {name} does not contain any numerical data')
+        frame = to_numerical(frame=pd.DataFrame(rows))
+        table = frame.dropna(axis=1, how='all').to_numpy(dtype=np.float64)
+        return drop_nonnumerical_rows(table=table, name=name)
 
     @classmethod
     def has_two_columns(cls, fpath : str) -> bool:
-        with open(fpath, newline='') as csvfile:
-            reader = csv.reader(csvfile)
-            for row in reader:
-                if len(row) != 2:
-                    return False
-            return True
+        return cls.get_num_columns(fpath=fpath) == 2
 
     @staticmethod
     def xlsx_to_csv(xlsx_fpath : str, csv_fpath : str):
-        data = pd.read_excel(xlsx_fpath)
-        data.to_csv(csv_fpath, index=False, sep=';')
+        rows = iter_xlsx_rows(source=xlsx_fpath)
+        pd.DataFrame(rows).dropna(how='all').to_csv(csv_fpath, index=False, header=False, sep=';')
+
+    @staticmethod
+    def xlsx_to_csv_str(xlsx_data : bytes) -> str:
+        rows = iter_xlsx_rows(source=io.BytesIO(xlsx_data))
+        return pd.DataFrame(rows).dropna(how='all').to_csv(index=False, header=False, sep=';')
+
+    @staticmethod
+    def get_read_kwargs(separator : str, num_header_lines : int) -> dict:
+        sep = r'\s+' if separator.isspace() else separator
+        return dict(sep=sep, header=None, skiprows=num_header_lines, skipinitialspace=True, engine='c',
+                    float_precision='round_trip')
+
+    @classmethod
+    def get_separator(cls, content: str) -> str:
+        lines = cls.get_prefix(content=content).split('\n')[:cls.SNIFF_NUM_LINES]
+        sniffer = csv.Sniffer()
+        dialect = sniffer.sniff('\n'.join(lines), delimiters=cls.DELIMITERS)
+        return str(dialect.delimiter)
+
+    @classmethod
+    def get_prefix(cls, content : str) -> str:
+        prefix = content[:cls.SNIFF_NUM_CHARS]
+        if len(content) > cls.SNIFF_NUM_CHARS and '\n' in prefix:
+            prefix = prefix[:prefix.rfind('\n')]
+        return prefix
+
+    @classmethod
+    def get_num_header_lines(cls, lines : list[str], separator : str) -> int:
+        for num, line in enumerate(lines):
+            items = [item.strip() for item in split_line(line=line, separator=separator)]
+            items = [item for item in items if item]
+            if items and cls.is_numerical(values=items):
+                return num
+        return 1
 
     # ------------------------------------------
     # datatype tools
@@ -113,17 +240,11 @@ class CsvParser:
             return False
 
     def to_numerical(self, data : list[list[str]], row_start : int = 0) -> list[list[float]]:
-        numerical_data = []
-        for row_num, row in enumerate(data):
-            try:
-                float_data = [self.convert_to_float(x, row_num + row_start + 1, col_num + 1) for col_num, x in enumerate(row)]
-            except Exception:
-                continue
-            numerical_data.append(float_data)
-
-
-
-        return numerical_data
+        """Rows containing non-numerical values are dropped. row_start is kept for compatibility and unused"""
+        if len(data) == 0:
+            return []
+        table = to_numerical(frame=pd.DataFrame(data, dtype=object)).to_numpy(dtype=np.float64)
+        return table[~np.isnan(table).any(axis=1)].tolist()
 
     @staticmethod
     def convert_to_float(x : str, row_num : int, col_num : int) -> float:
@@ -132,10 +253,91 @@ class CsvParser:
         except Exception:
             raise ValueError(f"Could not convert value \"{x}\" at row {row_num}, column {col_num} to a numerical value")
 
+    @staticmethod
+    def is_qvalues(x_axis_row : NDArray) -> bool:
+        return bool(np.max(x_axis_row) < CsvParser.MAX_Q_VALUE)
+
+    @staticmethod
+    def to_two_theta_degs(x_axis_row : NDArray, is_qvalues : bool) -> NDArray:
+        return qvalues_to_copper_angles(qvalues=x_axis_row) if is_qvalues else np.array(x_axis_row)
+
+    @staticmethod
+    def make_patterns(two_theta_degs : NDArray, intensity_rows : Iterable[NDArray], is_qvalues : bool) -> list[XrdData]:
+        pattern_infos = []
+        for intensities in intensity_rows:
+            new = XrdData(two_theta_values=two_theta_degs, intensities=intensities, powder_experiment=PowderExperiment.make_empty())
+            if is_qvalues:
+                new.powder_experiment.xray_info = copper_xray_info
+            pattern_infos.append(new)
+        return pattern_infos
+
+    @staticmethod
+    def print_format(name : str, is_qvalues : bool, pattern_dimension : str, separator : Optional[str] = None):
+        x_axis_type = 'QValues' if is_qvalues else 'TwoThetaDegs'
+        msg = (f'The format of the csv file {name} was automatically determined/specified as:'
+               f'\n- XAxisType     : \"{x_axis_type}\"')
+        if separator is not None:
+            msg += f'\n- Csv Seperator : \"{separator}\"'
+        msg += f'\n- Orientation   : \"{pattern_dimension}\"'
+        print(msg)
+
+
+def read_text(fpath : str, num_chars : int = -1) -> str:
+    with open(fpath, 'r', newline='') as f:
+        return f.read(num_chars)
+
+
+def split_line(line : str, separator : str) -> list[str]:
+    return line.split() if separator.isspace() else line.split(separator)
+
+
+def drop_nonnumerical_rows(table : NDArray, name : str) -> NDArray:
+    is_numerical_row = ~np.isnan(table).any(axis=1)
+    num_skipped = len(table) - int(np.count_nonzero(is_numerical_row))
+    if num_skipped > 0:
+        print(f'Warning: In {name}, {num_skipped} rows were skipped due to non-numerical values')
+        table = table[is_numerical_row]
+    return table
+
+
+def to_numerical(frame : pd.DataFrame) -> pd.DataFrame:
+    non_numerical_columns = frame.columns[[not pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes]]
+    if len(non_numerical_columns) > 0:
+        frame[non_numerical_columns] = frame[non_numerical_columns].apply(to_numerical_column)
+    return frame
+
+
+def to_numerical_column(column : pd.Series) -> pd.Series:
+    """Non-numerical values become NaN. Numerical strings are converted like float() since pd.to_numeric may be off
+    by one ulp"""
+    numerical = pd.to_numeric(column, errors='coerce')
+    is_text = column.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool) & numerical.notna().to_numpy()
+    if is_text.any():
+        numerical = numerical.astype(np.float64)
+        numerical[is_text] = column[is_text].to_numpy(dtype=str).astype(np.float64)
+    return numerical
+
+
+def iter_xlsx_rows(source : Union[str, IO]) -> Iterator[tuple]:
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def skip_header_rows(rows : Iterator[tuple]) -> Iterator[tuple]:
+    for row in rows:
+        items = [str(v) for v in row if v is not None and str(v).strip()]
+        if items and CsvParser.is_numerical(values=items):
+            yield row
+            break
+    yield from rows
+
 
-def qvalues_to_copper_angles(qvalues : list[float]) -> list[float]:
-    theta_values_rad = [math.asin(q*copper_wavelength/(4*math.pi)) for q in qvalues]
-    two_theta_degs = [2*math.degrees(theta) for theta in theta_values_rad]
+def qvalues_to_copper_angles(qvalues : NDArray) -> NDArray:
+    theta_values_rad = np.arcsin(np.asarray(qvalues)*copper_wavelength/(4*math.pi))
+    two_theta_degs = 2*np.degrees(theta_values_rad)
 
     return two_theta_degs
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from numpy.typing import NDArray
+
 
 # -------------------------------------------
 
@@ -12,12 +14,12 @@ class CsvOrientations:
 
 @dataclass
 class Matrix:
-    numerical_data : list[list[float]]
+    numerical_data : NDArray
 
-    def get_x_values(self) -> list[float]:
+    def get_x_values(self) -> NDArray:
         return self.numerical_data[0]
 
-    def get_y_data(self, row : int) -> list[float]:
+    def get_y_data(self, row : int) -> NDArray:
         if row == 0:
             raise ValueError('First row is reserved for x values')
         return self.numerical_data[row]
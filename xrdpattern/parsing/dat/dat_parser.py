@@ -1,66 +1,50 @@
+import io
+from typing import Union, IO
+
 import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
 
-from xrdpattern.xrd import XrdData, XrayInfo
+from xrdpattern.xrd import XrdData, XrayInfo, PowderExperiment
 
 
 class DatParser:
     def extract_multi(self, fpath : str) -> list[XrdData]:
-        data = self.get_data_dict(fpath=fpath)
-        x,y = self.get_xy_data(data_dict=data)
-        x = np.array(x)
-        y = np.array(y)
+        return self._extract_multi(source=fpath)
 
-        img_indices = self.image_indices(img_list=data['imagenum'])
-        img_indices.append(len(x))
-        image_lengths = [img_indices[k+1] - img_indices[k] for k in range(len(img_indices)-1)]
+    def extract_multi_str(self, content : str) -> list[XrdData]:
+        return self._extract_multi(source=io.StringIO(content))
 
-        patterns = []
-        for l in image_lengths:
-            pattern_angles = x[:l]
-            pattern_intensities = y[:l]
-            x,y = x[l:], y[l:]
+    def _extract_multi(self, source : Union[str, IO]) -> list[XrdData]:
+        image_nums, x, y = self.read_columns(source=source)
+        bounds = self.get_frame_bounds(image_nums=image_nums)
 
-            new_pattern = XrdData.make_unlabeled(two_theta_values=pattern_angles, intensities=pattern_intensities)
-            new_pattern.powder_experiment.xray_info = XrayInfo.copper_xray()
+        patterns = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            experiment = PowderExperiment.make_empty()
+            experiment.xray_info = XrayInfo.copper_xray()
+            new_pattern = XrdData(two_theta_values=x[start:end], intensities=y[start:end], powder_experiment=experiment)
             patterns.append(new_pattern)
 
         return patterns
 
-
     @staticmethod
-    def get_data_dict(fpath: str) -> dict[str, list[str]]:
-        with open(fpath, 'r') as f:
-            content = f.read()
-            lines = content.split('\n')
-        entries = [line.split() for line in lines if not line.strip() == '']
-        headers = entries[0]
-        data = entries[1:]
-
-        data_dict = {}
-        for j, header in enumerate(headers):
-            data_dict[header] = [entry[j] for entry in data]
-        return data_dict
-
-    @staticmethod
-    def image_indices(img_list : list[str]) -> list[int]:
-        img_list = [int(s) for s in img_list]
-
-        current_frame = 0
-        indices = []
-        for k, frame_num in enumerate(img_list):
-            if frame_num == current_frame:
-                indices.append(k)
-                current_frame += 1
-
-        return indices
+    def read_columns(source : Union[str, IO]) -> tuple[NDArray, NDArray, NDArray]:
+        """Loads the imagenum, twotheta and intensity columns in one pass as contiguous arrays"""
+        frame = pd.read_csv(source, sep=r'\s+', header=0, usecols=['imagenum', 'twotheta', 'intensity'],
+                            engine='c', float_precision='round_trip')
+        image_nums = frame['imagenum'].to_numpy(dtype=np.int64)
+        x = np.ascontiguousarray(frame['twotheta'].to_numpy(dtype=np.float64))
+        y = np.ascontiguousarray(frame['intensity'].to_numpy(dtype=np.float64))
+        return image_nums, x, y
 
     @staticmethod
-    def get_xy_data(data_dict : dict[str, list[str]]) -> (list[float], list[float]):
-        angles = [float(val) for val in data_dict['twotheta']]
-        intensities = [float(val) for val in data_dict['intensity']]
-        return angles, intensities
+    def get_frame_bounds(image_nums : NDArray) -> NDArray:
+        """Start indices of each frame (i.e. each run of constant imagenum) followed by the total length"""
+        changes = np.flatnonzero(np.diff(image_nums) != 0) + 1
+        return np.concatenate(([0], changes, [len(image_nums)]))
 
 
 if __name__ == "__main__":
     dat_parser = DatParser()
-    dat_parser.extract_multi(fpath='/home/daniel/aimat/data/opXRD/processed/sutter-fella_kodalle_0/data/CIGS_Pvsk_GIWAXS/Dat-Samples/Sample_04-2-PVD/PVD.dat')
\ No newline at end of file
+    dat_parser.extract_multi(fpath='/home/daniel/aimat/data/opXRD/processed/sutter-fella_kodalle_0/data/CIGS_Pvsk_GIWAXS/Dat-Samples/Sample_04-2-PVD/PVD.dat')
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Optional
 
-from xrdpattern.parsing.xylib import get_xylib_repr
-
 from xrdpattern.parsing.path_tools import PathTools
 from .stoe import StoeParser
 
+HEADER_NUM_BYTES = 4096
 
 # -------------------------------------------
 
@@ -38,6 +38,7 @@ class Formats:
     plaintext_dat = XrdFormat("column_dat", ["dat"])
     pdcif = XrdFormat("pdCIF", ["cif"])
     aimat_xrdpattern = XrdFormat("aimat", ['json'])
+    aimat_binary = XrdFormat("aimat_binary", ['xrdb'])
     stoe_raw = XrdFormat("stoe_raw", ['raw'])
     csv = XrdFormat("csv", ["csv", "xlsx"])
 
@@ -45,6 +46,10 @@ class Formats:
     def aimat_suffix(cls) -> str:
         return cls.aimat_xrdpattern.suffixes[0]
 
+    @classmethod
+    def aimat_binary_suffix(cls) -> str:
+        return cls.aimat_binary.suffixes[0]
+
     @classmethod
     def get_xylib_formats(cls):
         formatsOne = [cls.bruker_raw, cls.bruker_spc, cls.canberra_cnf, cls.canberra_mca, cls.chiplot, cls.cpi]
@@ -66,16 +71,15 @@ class Formats:
     @classmethod
     def get_format(cls, fpath : str) -> XrdFormat:
         suffix = PathTools.get_suffix(fpath)
-        if suffix == 'raw':
-            return Formats.stoe_raw if cls.is_stoe(fpath) else Formats.bruker_raw
-        if suffix == 'dat':
-            if Formats.is_rigaku_dat(fpath):
-                return Formats.rigaku_dat
-            elif Formats.is_riet_dat(fpath):
-                return Formats.riet7
-            else:
-                return Formats.plaintext_dat
+        if suffix in cls.get_sniffed_suffixes():
+            with open(fpath, 'rb') as f:
+                header = f.read(HEADER_NUM_BYTES)
+            return cls.format_from_header(suffix=suffix, header=header, fsize=os.path.getsize(fpath))
+
+        return cls.get_suffix_format(suffix=suffix)
 
+    @classmethod
+    def get_suffix_format(cls, suffix : Optional[str]) -> XrdFormat:
         suffix_to_format_map = {}
         for f in cls.get_all_formats():
             for s in f.suffixes:
@@ -86,17 +90,38 @@ class Formats:
 
         return xrd_format
 
+    @staticmethod
+    def get_sniffed_suffixes() -> list[str]:
+        return ['raw', 'dat']
+
+    @classmethod
+    def format_from_header(cls, suffix : Optional[str], header : bytes, fsize : int) -> XrdFormat:
+        """Determines format from suffix and, for ambiguous suffixes, the leading bytes of the content"""
+        if suffix == 'raw':
+            return cls.stoe_raw if cls.is_stoe(header=header, fsize=fsize) else cls.bruker_raw
+        if suffix == 'dat':
+            if cls.is_rigaku_dat(header=header):
+                return cls.rigaku_dat
+            elif cls.is_riet_dat(header=header):
+                return cls.riet7
+            else:
+                return cls.plaintext_dat
+
+        return cls.get_suffix_format(suffix=suffix)
+
     @classmethod
-    def is_stoe(cls, fpath : str) -> bool:
+    def is_stoe(cls, header : bytes, fsize : int) -> bool:
         try:
             reader = StoeParser()
-            reader.read(fpath=fpath)
+            for quantity in [reader.angle_start, reader.angle_end, reader.num_entries]:
+                quantity.extract_value(byte_content=header)
             angle_start, angle_end = reader.angle_start.get_value(), reader.angle_end.get_value()
             num_entries = reader.num_entries.get_value()
 
             angles_ok = 0 < angle_start < angle_end < 180
             entries_ok = isinstance(num_entries, int) and 0 < num_entries < 10**6
-            is_stoe = angles_ok and entries_ok
+            size_ok = fsize >= reader.intensities.start + 4 * num_entries
+            is_stoe = angles_ok and entries_ok and size_ok
 
         except:
             is_stoe = False
@@ -104,34 +129,55 @@ class Formats:
         return is_stoe
 
     @classmethod
-    def is_rigaku_dat(cls, fpath : str) -> bool:
-        try:
-            get_xylib_repr(fpath=fpath,format_name=Formats.rigaku_dat.name)
-            is_rigaku_dat = True
-        except:
-            is_rigaku_dat = False
-        return is_rigaku_dat
+    def is_rigaku_dat(cls, header : bytes) -> bool:
+        return header.startswith(b'*TYPE')
 
     @classmethod
-    def is_riet_dat(cls, fpath : str) -> bool:
-        try:
-            get_xylib_repr(fpath=fpath,format_name=Formats.riet7.name)
-            is_riet_dat = True
-        except:
-            is_riet_dat = False
-        return is_riet_dat
+    def is_riet_dat(cls, header : bytes) -> bool:
+        """Mirrors xylib's Riet7 check: One of the first 6 lines starts with start, step, stop values spanning an
+        integer number (>=4) of steps and the following line has a different number of leading numbers"""
+        lines = header.decode(encoding='latin-1').splitlines()
+        for j, line in enumerate(lines[:6]):
+            values = get_leading_numbers(line)
+            if len(values) < 3:
+                continue
+            start, step, stop = values[:3]
+            try:
+                dcount = (stop - start) / step + 1
+            except ZeroDivisionError:
+                continue
+            count = round(dcount)
+            if count < 4 or abs(count - dcount) > 1e-2:
+                continue
+
+            next_line = lines[j+1] if j+1 < len(lines) else ''
+            return len(get_leading_numbers(next_line)) != len(values)
+        return False
 
     @staticmethod
     def get_xrd_fpaths(dirpath: str, selected_suffixes : Optional[list[str]]) -> list[str]:
-        if selected_suffixes is None:
-            selected_suffixes = Formats.get_all_suffixes()
-        selected_suffixes = [x.replace('.', '') for x in selected_suffixes]
+        selected_suffixes = Formats.normalize_suffixes(selected_suffixes=selected_suffixes)
 
         subfile_paths = PathTools.get_subfile_fpaths(dirpath=dirpath)
         data_fpaths = [p for p in subfile_paths if PathTools.get_suffix(fpath=p) in selected_suffixes]
 
         return data_fpaths
 
+    @staticmethod
+    def normalize_suffixes(selected_suffixes : Optional[list[str]]) -> list[str]:
+        if selected_suffixes is None:
+            selected_suffixes = Formats.get_all_suffixes()
+        return [x.replace('.', '') for x in selected_suffixes]
+
+
+def get_leading_numbers(line : str) -> list[float]:
+    numbers = []
+    for token in line.split():
+        try:
+            numbers.append(float(token))
+        except ValueError:
+            break
+    return numbers
 
 
 if __name__ == "__main__":
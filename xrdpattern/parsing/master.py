@@ -1,19 +1,18 @@
 from __future__ import annotations
 
 import os.path
-import tempfile
-from typing import Optional, Iterator, Tuple
-
-import numpy as np
+from typing import Optional, IO
 
 from xrdpattern.xrd import XrdData, XrayInfo, PowderExperiment, Metadata
 from xrdpattern.parsing.stoe import StoeParser
 from .cif.cif_parser import CifParser
 from .csv import CsvParser
 from .dat.dat_parser import DatParser
-from .formats import XrdFormat, Formats
+from .formats import XrdFormat, Formats, HEADER_NUM_BYTES
 from .path_tools import PathTools
-from .xylib import get_xylib_repr
+from .xylib import get_xylib_repr_from_bytes
+
+TEXT_ENCODING = 'utf-8'
 
 
 # -------------------------------------------
@@ -33,32 +32,55 @@ class MasterParser:
         suffix = PathTools.get_suffix(fpath)
         if not suffix in Formats.get_all_suffixes():
             raise ValueError(f"File {fpath} has unsupported format .{suffix}")
-        if suffix:
-            the_format = Formats.get_format(fpath)
-        else:
-            raise ValueError(f"Could not determine file format of \"{fpath}\": Invalid suffix {suffix}")
+        with open(fpath, 'rb') as f:
+            data = f.read()
+
+        return self.extract_bytes(data=data, suffix=suffix, csv_orientation=csv_orientation, fname=os.path.basename(fpath))
+
+    def extract_stream(self, fileobj : IO, suffix : Optional[str] = None, csv_orientation : Optional[str] = None) -> list[XrdData]:
+        fname = getattr(fileobj, 'name', None)
+        fname = os.path.basename(fname) if isinstance(fname, str) else None
+        if suffix is None:
+            suffix = PathTools.get_suffix(fname) if fname else None
+        if suffix is None:
+            raise ValueError(f"Could not determine file format of stream {fileobj}. Please specify suffix explicitly")
+
+        data = fileobj.read()
+        if isinstance(data, str):
+            data = data.encode(encoding=TEXT_ENCODING)
+        return self.extract_bytes(data=data, suffix=suffix, csv_orientation=csv_orientation, fname=fname)
+
+    def extract_bytes(self, data : bytes, suffix : str, csv_orientation : Optional[str] = None, fname : Optional[str] = None) -> list[XrdData]:
+        suffix = suffix.lstrip('.')
+        name = fname or f'<.{suffix} bytes>'
+        if not suffix in Formats.get_all_suffixes():
+            raise ValueError(f"File {name} has unsupported format .{suffix}")
+        the_format = Formats.format_from_header(suffix=suffix, header=data[:HEADER_NUM_BYTES], fsize=len(data))
 
         if the_format == Formats.aimat_xrdpattern:
-            pattern_infos = [self.load_json(fpath=fpath)]
+            pattern_infos = [XrdData.from_str(json_str=to_text(data))]
+        elif the_format == Formats.aimat_binary:
+            pattern_infos = [XrdData.from_bytes(data=data)]
         elif the_format == Formats.pdcif:
-            pattern_infos = [self._load_cif(fpath=fpath)]
+            pattern_infos = [self.cif_parser.extract_str(cif_content=to_text(data), name=name)]
         elif the_format == Formats.stoe_raw:
-            pattern_infos = [self.stoe_reader.extract(fpath=fpath)]
+            pattern_infos = [self.stoe_reader.extract_bytes(byte_content=data)]
         elif the_format in Formats.get_xylib_formats():
-            pattern_infos = [self._load_xylib_file(fpath=fpath, format_hint=the_format)]
+            pattern_infos = [self._load_xylib_bytes(data=data, format_hint=the_format, name=name)]
         elif the_format == Formats.csv:
-            pattern_infos = self._load_csv(fpath=fpath, orientation=csv_orientation)
+            pattern_infos = self._load_csv(data=data, suffix=suffix, orientation=csv_orientation, name=name)
         elif the_format == Formats.plaintext_dat:
-            pattern_infos = self._load_plaintext_dat(fpath=fpath)
+            pattern_infos = self.dat_parser.extract_multi_str(content=to_text(data))
         else:
             raise ValueError(f"Format .{the_format} is not supported")
-        for info in pattern_infos:
-            info.name = os.path.basename(fpath)
+        if fname:
+            for info in pattern_infos:
+                info.name = fname
 
         for p in pattern_infos:
-            if not the_format == Formats.aimat_xrdpattern:
+            if not the_format in [Formats.aimat_xrdpattern, Formats.aimat_binary]:
                 p.metadata.original_file_format = f'{the_format.name} (.{suffix})'
-                p.metadata.filename = os.path.basename(fpath)
+                p.metadata.filename = fname
         return pattern_infos
 
 
@@ -71,51 +93,28 @@ class MasterParser:
 
 
     @staticmethod
-    def _load_xylib_file(fpath: str, format_hint : XrdFormat) -> XrdData:
-        xylib_repr = get_xylib_repr(fpath=fpath, format_name=format_hint.name)
-        header,data_str = xylib_repr.get_header(), xylib_repr.get_data()
-        powder_experiment = MasterParser.parse_experiment_params(header_str=header)
-        metadata = MasterParser.parse_metadata(header_str=header)
-
-        two_theta_values, intensities= [], []
-        data_rows = [row for row in data_str.split('\n') if not row.strip() == '']
-        for row in data_rows:
-            deg_str, intensity_str = row.split()
-            deg, intensity = float(deg_str), float(intensity_str)
-            two_theta_values.append(deg)
-            intensities.append(intensity)
-
-        two_theta_values, intensities = np.array(two_theta_values), np.array(intensities)
-        return XrdData(two_theta_values=two_theta_values, intensities=intensities, powder_experiment=powder_experiment, metadata=metadata)
-
-
-    def _load_csv(self, fpath : str, orientation : Optional[str] = None) -> list[XrdData]:
-        if PathTools.get_suffix(fpath) == 'xlsx':
-            tmp_fpath = tempfile.mktemp(suffix='.csv')
-            CsvParser.xlsx_to_csv(xlsx_fpath=fpath, csv_fpath=tmp_fpath)
-            fpath = tmp_fpath
-        if CsvParser.has_two_columns(fpath=fpath):
-            orientation = 'vertical'
-        if orientation is None:
-            raise ValueError(f"Could not determine orientation of data in csv file {fpath}")
+    def _load_xylib_bytes(data: bytes, format_hint : XrdFormat, name : str) -> XrdData:
+        xylib_repr = get_xylib_repr_from_bytes(data=data, format_name=format_hint.name, name=name)
+        header = xylib_repr.get_header()
+        powder_experiment = MasterParser.parse_experiment_params(header=header)
+        metadata = MasterParser.parse_metadata(header=header)
 
-        return self.csv_parser.extract_multi(fpath=fpath, pattern_dimension=orientation)
+        two_theta_values, intensities = xylib_repr.get_data()
+        return XrdData(two_theta_values=two_theta_values, intensities=intensities, powder_experiment=powder_experiment, metadata=metadata)
 
-    def _load_cif(self, fpath : str) -> XrdData:
-        return self.cif_parser.extract(fpath=fpath)
 
-    def _load_plaintext_dat(self, fpath : str) -> list[XrdData]:
-        return self.dat_parser.extract_multi(fpath=fpath)
+    def _load_csv(self, data : bytes, suffix : str, name : str, orientation : Optional[str] = None) -> list[XrdData]:
+        if suffix == 'xlsx':
+            return self.csv_parser.extract_xlsx(xlsx_data=data, pattern_dimension=orientation, name=name)
+        return self.csv_parser.extract_multi_str(content=to_text(data), pattern_dimension=orientation, name=name)
 
     # -------------------------------------------
     # special xylib header
 
     @classmethod
-    def parse_experiment_params(cls, header_str: str) -> PowderExperiment:
-        metadata_map = cls.get_key_value_dict(header_str=header_str)
-
+    def parse_experiment_params(cls, header: dict[str, str]) -> PowderExperiment:
         def get_float(key: str) -> Optional[float]:
-            val = metadata_map.get(key)
+            val = header.get(key)
             if val:
                 val = float(val)
             return val
@@ -127,24 +126,10 @@ class MasterParser:
         return experiment
 
     @classmethod
-    def parse_metadata(cls, header_str : str) -> Metadata:
-        metadata_map = cls.get_key_value_dict(header_str=header_str)
-        metadata = Metadata(measurement_date=metadata_map.get('MEASURE_DATE'))
+    def parse_metadata(cls, header : dict[str, str]) -> Metadata:
+        metadata = Metadata(measurement_date=header.get('MEASURE_DATE'))
         return metadata
 
-    @staticmethod
-    def get_key_value_dict(header_str: str) -> dict:
-        key_value_dict = {}
-        for key, value in MasterParser.get_key_value_pairs(header_str):
-            key_value_dict[key] = value
-        return key_value_dict
-
-    @staticmethod
-    def get_key_value_pairs(header_str: str) -> Iterator[Tuple[str, str]]:
-        commented_lines = [line for line in header_str.splitlines() if line.startswith('#')]
-        for line in commented_lines:
-            key_value = line[1:].split(':', 1)
-            if len(key_value) == 2:
-                yield key_value[0].strip(), key_value[1].strip()
-
 
+def to_text(data : bytes) -> str:
+    return bytes(data).decode(encoding=TEXT_ENCODING)
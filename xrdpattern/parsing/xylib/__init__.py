@@ -1 +1 @@
-from .xylib_repr import XYLibPattern, get_xylib_repr
\ No newline at end of file
+from .xylib_repr import XYLibPattern, get_xylib_repr, get_xylib_repr_from_bytes
\ No newline at end of file
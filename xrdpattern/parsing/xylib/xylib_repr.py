@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 import os
-from tempfile import NamedTemporaryFile
 from typing import Optional
 
+import numpy as np
 import xylib
+from numpy.typing import NDArray
 
 __version__ = xylib.xylib_get_version()
 
-import re
 from dataclasses import dataclass
 
 
@@ -18,21 +18,15 @@ from dataclasses import dataclass
 @dataclass
 class XYLibPattern:
     fpath : str
-    content : str
+    header : dict[str, str]
+    two_theta_values : NDArray
+    intensities : NDArray
 
-    def __post_init__(self):
-        column_pattern = r'# column_1\tcolumn_2'
-        matches = re.findall(pattern=column_pattern, string=self.content)
-        if not matches:
-            raise ValueError(f"Could not find header matching pattern \"{column_pattern}\" in file {self.fpath}")
+    def get_header(self) -> dict[str, str]:
+        return self.header
 
-        self.header_str, self.data_str = self.content.split(matches[0])
-
-    def get_header(self) -> str:
-        return self.header_str
-
-    def get_data(self) -> str:
-        return self.data_str
+    def get_data(self) -> tuple[NDArray, NDArray]:
+        return self.two_theta_values, self.intensities
 
 
 def get_xylib_repr(fpath : str, format_name : Optional[str] = None) -> XYLibPattern:
@@ -40,56 +34,45 @@ def get_xylib_repr(fpath : str, format_name : Optional[str] = None) -> XYLibPatt
         raise ValueError(f"File \"{fpath}\" does not exist")
 
     try:
-        with NamedTemporaryFile(delete=False) as temp_file:
-            output_path = temp_file.name
-        option = XYLibOption(input_path=fpath, output_path=output_path, format_name=format_name)
-        convert_file(opt=option)
-        with open(output_path, "r") as file:
-            content = file.read()
-        return XYLibPattern(content=content, fpath=fpath)
-
+        dataset = xylib.load_file(fpath, format_name) if format_name else xylib.load_file(fpath)
+        return from_dataset(dataset=dataset, fpath=fpath)
     except BaseException as e:
         raise ValueError(f"Error obtaining xy repr of file {fpath}: {str(e)}")
 
 
-def convert_file(opt : XYLibOption):
-    if opt.INPUT_TYPE:
-        d = xylib.load_file(opt.INPUT_FILE, opt.INPUT_TYPE)
-    else:
-        d = xylib.load_file(opt.INPUT_FILE)
-
-    with open(opt.OUTPUT_PATH, 'w') as f:
-        f.write('# exported by xylib from a %s file\n' % d.fi.name)
-        export_metadata(f, d.meta)
-        f.write('\n')
-        number_of_blocks = d.get_block_count()
-        for block_counter in range(number_of_blocks):
-            block = d.get_block(block_counter)
-            if number_of_blocks > 1 or block.get_name():
-                f.write(f'\n### block #{block_counter} {block.get_name()}\n')
-                export_metadata(f, block.meta)
-
-            number_of_cols = block.get_column_count()
-            # column 0 is pseudo-column with point indices, we skip it
-            col_names = [block.get_column(col_counter).get_name() or ('column_%d' % col_counter)
-                         for col_counter in range(1, number_of_cols+1)]
-            f.write('# ' + '\t'.join(col_names) + '\n')
-            number_of_rows = block.get_point_count()
-            for row_counter in range(number_of_rows):
-                values = ["%.6f" % block.get_column(k).get_value(row_counter)
-                          for k in range(1, number_of_cols+1)]
-                f.write('\t'.join(values) + '\n')
-
-def export_metadata(f, meta):
-    for i in range(meta.size()):
-        key = meta.get_key(i)
-        value = meta.get(key)
-        f.write('# %s: %s\n' % (key, value.replace('\n', '\n#\t')))
+def get_xylib_repr_from_bytes(data : bytes, format_name : str, name : str = '<bytes>') -> XYLibPattern:
+    try:
+        dataset = xylib.load_string(bytes(data), format_name)
+        return from_dataset(dataset=dataset, fpath=name)
+    except BaseException as e:
+        raise ValueError(f"Error obtaining xy repr of {name}: {str(e)}")
 
 
+def from_dataset(dataset, fpath : str) -> XYLibPattern:
+    if dataset.get_block_count() == 0:
+        raise ValueError(f"No data blocks found in file {fpath}")
+    block = dataset.get_block(0)
+    if block.get_column_count() < 2:
+        raise ValueError(f"Expected at least two data columns in file {fpath}, got {block.get_column_count()}")
 
-class XYLibOption:
-    def __init__(self, input_path : str, output_path : str, format_name : Optional[str] = None):
-        self.INPUT_FILE : str = input_path
-        self.OUTPUT_PATH : str = output_path
-        self.INPUT_TYPE : Optional[str] = format_name
+    header = get_metadata_dict(dataset.meta)
+    header.update(get_metadata_dict(block.meta))
+
+    # column 0 is pseudo-column with point indices, we skip it
+    num_points = block.get_point_count()
+    x = get_column_values(block=block, col_num=1, num_points=num_points)
+    y = get_column_values(block=block, col_num=2, num_points=num_points)
+    return XYLibPattern(fpath=fpath, header=header, two_theta_values=x, intensities=y)
+
+
+def get_column_values(block, col_num : int, num_points : int) -> NDArray:
+    buffer = block.get_column(col_num).get_values_buffer(num_points)
+    return np.frombuffer(buffer, dtype=np.float64)
+
+
+def get_metadata_dict(meta) -> dict[str, str]:
+    metadata_dict = {}
+    for i in range(meta.size()):
+        key = meta.get_key(i)
+        metadata_dict[key.strip()] = meta.get(key).strip()
+    return metadata_dict
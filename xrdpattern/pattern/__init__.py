@@ -1,2 +1,8 @@
 from .db import PatternDB
-from .pattern import XrdPattern
\ No newline at end of file
+from .dedup import Deduplicator, DuplicateCluster
+from .index import LabelIndex, PatternView
+from .interpolation import InterpolationMethod
+from .matrix_cache import MatrixCache
+from .pattern import XrdPattern
+from .parse_cache import ParseCache
+from .store import PatternStore
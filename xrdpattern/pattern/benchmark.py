@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from xrdpattern.parsing.examples import DataExamples
+from .db import PatternDB
+from .interpolation import InterpolationMethod, interpolate
+from .pattern import XrdPattern
+from .standardize import standardize_batch, get_std_angles, OperatorCache
+
+# -------------------------------------------
+
+def make_same_grid_corpus(num_patterns : int = 2000, seed : int = 0) -> list[XrdPattern]:
+    """Variations of the bruker example pattern (rescaled peaks plus noise) on its two theta grid, as produced by a
+    single instrument"""
+    template = XrdPattern.load(fpath=DataExamples.get_bruker_fpath())
+    rng = np.random.default_rng(seed)
+    intensities = np.asarray(template.intensities, dtype=np.float64)
+    patterns = []
+    for _ in range(num_patterns):
+        varied = intensities * rng.uniform(0.5, 2) + rng.normal(scale=0.05 * np.std(intensities), size=len(intensities))
+        patterns.append(XrdPattern(two_theta_values=template.two_theta_values, intensities=varied,
+                                   powder_experiment=template.powder_experiment))
+    return patterns
+
+
+def benchmark_grid_sharing(num_patterns : int = 2000, repeats : int = 3) -> dict[str, float]:
+    """Times standardization of a same-grid corpus per pattern (get_pattern_data) and batched via the cached
+    resampling operator of the grid, with a cold and a warm operator cache"""
+    patterns = make_same_grid_corpus(num_patterns=num_patterns)
+    std_angles = get_std_angles()
+    cache = OperatorCache()
+
+    def standardize_cold():
+        cache.clear()
+        return standardize_batch(patterns=patterns, std_angles=std_angles, cache=cache)
+
+    reference = np.stack([p.get_pattern_data()[1] for p in patterns])
+    timings = {
+        'per_pattern' : get_best_time(lambda : [p.get_pattern_data() for p in patterns], repeats=repeats),
+        'batched_cold' : get_best_time(standardize_cold, repeats=repeats),
+        'batched_warm' : get_best_time(lambda : standardize_batch(patterns, std_angles=std_angles, cache=cache), repeats=repeats)
+    }
+    max_error = float(np.max(np.abs(standardize_batch(patterns, std_angles=std_angles, cache=cache) - reference)))
+
+    print(f'Standardized {num_patterns} patterns with {patterns[0].num_entries} values on a shared grid')
+    for name, seconds in timings.items():
+        print(f'- {name:<12} {seconds:8.3f} s  {num_patterns / seconds:10.0f} patterns/s  '
+              f'speedup {timings["per_pattern"] / seconds:5.1f}x')
+    print(f'- max abs deviation from get_pattern_data: {max_error:.2e}')
+    return timings
+
+
+def benchmark_methods(num_entries : Optional[int] = None, repeats : int = 3) -> dict[str, dict[str, float]]:
+    """Throughput of standardizing the example patterns with each interpolation method (pattern by pattern and
+    batched), deviation from cubic interpolation and undershoot, the largest drop of the interpolant below the minimum
+    of the data relative to the data range"""
+    patterns = PatternDB.load(dirpath=DataExamples.get_datafolder_fpath()).patterns
+    std_angles = get_std_angles(num_entries=num_entries)
+    num_entries = len(std_angles)
+    reference = np.stack([p.get_pattern_data(num_entries=num_entries)[1] for p in patterns])
+
+    results = {}
+    print(f'Standardized {len(patterns)} example patterns to {num_entries} values')
+    for method in InterpolationMethod:
+        values = np.stack([p.get_pattern_data(num_entries=num_entries, method=method)[1] for p in patterns])
+        single_time = get_best_time(lambda : [p.get_pattern_data(num_entries=num_entries, method=method) for p in patterns], repeats=repeats)
+        batch_time = get_best_time(lambda : standardize_batch(patterns, std_angles=std_angles, method=method), repeats=repeats)
+        results[method.value] = {
+            'patterns_per_s' : len(patterns) / single_time,
+            'batched_patterns_per_s' : len(patterns) / batch_time,
+            'max_abs_error' : float(np.max(np.abs(values - reference))),
+            'mean_abs_error' : float(np.mean(np.abs(values - reference))),
+            'undershoot' : max(get_undershoot(pattern=p, std_angles=std_angles, method=method) for p in patterns)
+        }
+        print(f'- {method.value:<7} ' + '  '.join(f'{name} {value:.3g}' for name, value in results[method.value].items()))
+    return results
+
+
+def get_undershoot(pattern : XrdPattern, std_angles : NDArray, method : InterpolationMethod) -> float:
+    x, y = pattern.to_strictly_increasing(np.asarray(pattern.two_theta_values), np.asarray(pattern.intensities))
+    query = std_angles[(std_angles >= x[0]) & (std_angles <= x[-1])]
+    values = interpolate(x=x, y=y, query=query, method=method)
+    data_range = np.max(y) - np.min(y)
+    return float(max(np.min(y) - np.min(values), 0) / data_range) if data_range > 0 else 0.
+
+
+def get_best_time(func : Callable, repeats : int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    benchmark_grid_sharing()
+    benchmark_methods()
@@ -2,17 +2,32 @@ from __future__ import annotations
 
 import os
 import random
-from dataclasses import dataclass
-from typing import Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from contextlib import closing
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Optional, Iterator, Iterable
 
+import numpy as np
 from matplotlib import pyplot as plt
+from numpy.typing import NDArray
 
-from xrdpattern.parsing import MasterParser, Formats
-from xrdpattern.xrd import XrayInfo, XrdData
+from xrdpattern.parsing import MasterParser, Formats, ArchiveReader
+from xrdpattern.parsing.path_tools import PathTools
+from xrdpattern.xrd import XrayInfo, XrdData, PatternHeader, LabelType
+from .dedup import Deduplicator
+from .index import LabelIndex, PatternView
+from .interpolation import InterpolationMethod
+from .matrix_cache import MatrixCache
+from .parse_cache import ParseCache, ParseResult
 from .pattern import XrdPattern
 from .progress_tracker import TrackedCollection
+from .standardize import standardize_batch, get_std_angles
+from .store import PatternStore, StorePatterns, StoreFpathDict
 
 parser = MasterParser()
+MAX_PENDING_PER_WORKER = 4
 
 # -------------------------------------------
 
@@ -21,6 +36,8 @@ class PatternDB:
     patterns : list[XrdPattern]
     fpath_dict: dict[str, list[XrdPattern]]
     name : str = ''
+    _index : Optional[LabelIndex] = field(default=None, init=False, repr=False)
+    _index_tail : Optional[XrdPattern] = field(default=None, init=False, repr=False)
 
     # -------------------------------------------
     # load/save
@@ -30,60 +47,203 @@ class PatternDB:
              strict : bool = False,
              limit_patterns: Optional[int] = None,
              suffixes : Optional[list[str]] = None,
-             csv_orientation : Optional[str] = None) -> PatternDB:
+             csv_orientation : Optional[str] = None,
+             workers : int = 1,
+             cache : Optional[ParseCache] = None,
+             dedup : Optional[Deduplicator] = None) -> PatternDB:
+        """dirpath may be a directory or a .zip/.tar(.gz|.bz2|.xz) archive. Archive members are parsed in memory
+        and their member names are used as keys of fpath_dict. If a cache is given, unchanged files are served from it
+        and only new or modified files are parsed. Directories written with save(as_store=True) are read from the store.
+        If a deduplicator is given, patterns it flags as duplicates are dropped and reported"""
         dirpath = os.path.normpath(path=dirpath)
-        if not os.path.isdir(dirpath):
-            raise ValueError(f"Given path {dirpath} is not a directory")
+        if PatternStore.is_store(dirpath):
+            return cls.from_store(store=PatternStore(dirpath=dirpath), limit_patterns=limit_patterns, dedup=dedup)
+        db = cls._make_empty(name=os.path.basename(dirpath))
+        num_files = 0
+        parsed = cls._iter_parsed(dirpath=dirpath, strict=strict, suffixes=suffixes, csv_orientation=csv_orientation,
+                                  workers=workers, cache=cache)
+        with closing(parsed):
+            for fpath, patterns in parsed:
+                num_files += 1
+                for p in patterns:
+                    if dedup and dedup.is_duplicate(pattern=p, fpath=fpath):
+                        continue
+                    db._add_pattern(pattern=p, fpath=fpath)
 
-        data_fpaths = Formats.get_xrd_fpaths(dirpath=dirpath, selected_suffixes=suffixes)
-        if len(data_fpaths) == 0:
-            raise ValueError(f"No data files matching suffixes {suffixes} found in directory {dirpath}")
+                if not limit_patterns is None:
+                    if len(db.patterns) >= limit_patterns:
+                        break
 
-        print(f'Loading patterns from local dirpath {dirpath}')
-        db = cls._make_empty(name=os.path.basename(dirpath))
-        for fpath in TrackedCollection(data_fpaths):
+        print(f'Finished loading pattern database located at {dirpath}')
+        print(f'Successfully extracted {len(db.patterns)} patterns '
+                             f'from {len(db.fpath_dict)}/{num_files} xrd files')
+        if dedup:
+            print(dedup.get_report())
+
+        return db
+
+    @classmethod
+    def iter_patterns(cls, dirpath : str,
+                      strict : bool = False,
+                      suffixes : Optional[list[str]] = None,
+                      csv_orientation : Optional[str] = None,
+                      workers : int = 1,
+                      cache : Optional[ParseCache] = None) -> Iterator[XrdPattern]:
+        """Lazily yields the patterns contained in dirpath (directory or archive) one at a time, holding at most the
+        patterns of one file (or a few files per worker) in memory"""
+        dirpath = os.path.normpath(path=dirpath)
+        parsed = cls._iter_parsed(dirpath=dirpath, strict=strict, suffixes=suffixes, csv_orientation=csv_orientation,
+                                  workers=workers, cache=cache)
+        with closing(parsed):
+            for _, patterns in parsed:
+                yield from patterns
+
+    @classmethod
+    def iter_batches(cls, dirpath : str, batch_size : int,
+                     strict : bool = False,
+                     suffixes : Optional[list[str]] = None,
+                     csv_orientation : Optional[str] = None,
+                     workers : int = 1,
+                     cache : Optional[ParseCache] = None) -> Iterator[PatternDB]:
+        """Lazily yields PatternDBs of at most batch_size patterns each from dirpath (directory or archive)"""
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1. Got {batch_size}")
+
+        dirpath = os.path.normpath(path=dirpath)
+        name = os.path.basename(dirpath)
+        batch = cls._make_empty(name=name)
+        parsed = cls._iter_parsed(dirpath=dirpath, strict=strict, suffixes=suffixes, csv_orientation=csv_orientation,
+                                  workers=workers, cache=cache)
+        with closing(parsed):
+            for fpath, patterns in parsed:
+                for p in patterns:
+                    batch._add_pattern(pattern=p, fpath=fpath)
+                    if len(batch.patterns) == batch_size:
+                        yield batch
+                        batch = cls._make_empty(name=name)
+        if len(batch.patterns) > 0:
+            yield batch
+
+    @classmethod
+    def scan_headers(cls, dirpath : str, strict : bool = False) -> Iterator[tuple[str, PatternHeader]]:
+        """Yields (fpath, header) for every aimat json or binary pattern in dirpath (or pattern store) without
+        loading pattern data. Intended for cataloging and filtering, e.g. selecting files by their labels"""
+        dirpath = os.path.normpath(path=dirpath)
+        if PatternStore.is_store(dirpath):
+            yield from PatternStore(dirpath=dirpath).iter_headers()
+            return
+
+        suffixes = [Formats.aimat_suffix(), Formats.aimat_binary_suffix()]
+        for fpath in Formats.get_xrd_fpaths(dirpath=dirpath, selected_suffixes=suffixes):
             try:
-                xrd_datas = parser.extract(fpath=fpath, csv_orientation=csv_orientation)
-                [db._add_data(info=info, fpath=fpath, strict=strict) for info in xrd_datas]
+                header = XrdPattern.load_header(fpath=fpath)
             except Exception as e:
-                err_msg = f'Failed to parse file {fpath}:\n- Reason: {e.__repr__()}'
                 if strict:
-                    raise ValueError(err_msg)
-                else:
-                    print(err_msg)
+                    raise e
+                print(f'Failed to read header of file {fpath}:\n- Reason: {e.__repr__()}')
+                continue
+            yield fpath, header
 
-            if not limit_patterns is None:
-                if len(db.patterns) >= limit_patterns:
-                    break
+    @classmethod
+    def _iter_parsed(cls, dirpath : str, strict : bool, suffixes : Optional[list[str]], csv_orientation : Optional[str],
+                     workers : int, cache : Optional[ParseCache] = None) -> Iterator[tuple[str, list[XrdPattern]]]:
+        """Yields (fpath, patterns) for every data file in dirpath in order. Files that fail to parse yield no
+        patterns or raise in strict mode"""
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1. Got {workers}")
 
-        print(f'Finished loading pattern database located at {dirpath}')
-        print(f'Successfully extracted {len(db.patterns)} patterns '
-                             f'from {len(db.fpath_dict)}/{len(data_fpaths)} xrd files')
+        cache_scope = ''
+        if ArchiveReader.is_archive(dirpath):
+            cache_scope = dirpath
+            selected_suffixes = Formats.normalize_suffixes(selected_suffixes=suffixes)
+            sources = ArchiveReader.iter_members(fpath=dirpath, selected_suffixes=selected_suffixes)
+            num_sources = ArchiveReader.count_members(fpath=dirpath, selected_suffixes=selected_suffixes)
+            print(f'Loading patterns from local archive {dirpath}')
+        elif os.path.isdir(dirpath):
+            data_fpaths = Formats.get_xrd_fpaths(dirpath=dirpath, selected_suffixes=suffixes)
+            sources = [(fpath, None) for fpath in data_fpaths]
+            num_sources = len(data_fpaths)
+            print(f'Loading patterns from local dirpath {dirpath}')
+        else:
+            raise ValueError(f"Given path {dirpath} is neither a directory nor a supported archive")
+        if num_sources == 0:
+            raise ValueError(f"No data files matching suffixes {suffixes} found in {dirpath}")
 
-        return db
+        results = extract_sources(sources=sources, csv_orientation=csv_orientation, workers=workers, cache=cache, cache_scope=cache_scope)
+        tracked_results = TrackedCollection(results, length=num_sources) if num_sources else results
+        num_files = 0
+        try:
+            for fpath, xrd_datas, err_repr in tracked_results:
+                num_files += 1
+                if err_repr is None:
+                    patterns = [cls._make_pattern(info=info, fpath=fpath, strict=strict) for info in xrd_datas]
+                    yield fpath, [p for p in patterns if not p is None]
+                else:
+                    err_msg = f'Failed to parse file {fpath}:\n- Reason: {err_repr}'
+                    if strict:
+                        raise ValueError(err_msg)
+                    else:
+                        print(err_msg)
+                    yield fpath, []
+        finally:
+            results.close()
+            if cache:
+                cache.save()
+        if num_files == 0:
+            raise ValueError(f"No data files matching suffixes {suffixes} found in {dirpath}")
 
     @classmethod
     def _make_empty(cls, name : str = '') -> PatternDB:
         return cls(patterns=[], fpath_dict={}, name=name)
 
-    def _add_data(self, info : XrdData, fpath : str, strict : bool):
+    @staticmethod
+    def _make_pattern(info : XrdData, fpath : str, strict : bool) -> Optional[XrdPattern]:
         try:
-            p = XrdPattern(**info.to_init_dict())
-            if not fpath in self.fpath_dict:
-                self.fpath_dict[fpath] = []
-            self.fpath_dict[fpath].append(p)
-            self.patterns.append(p)
+            return XrdPattern(**info.to_init_dict())
         except Exception as e:
             print(f"Could not import pattern from file {fpath}:\n- Reason: \"{e}\"\n")
             if strict:
                 raise e
+            return None
+
+    def _add_pattern(self, pattern : XrdPattern, fpath : str):
+        if not fpath in self.fpath_dict:
+            self.fpath_dict[fpath] = []
+        self.fpath_dict[fpath].append(pattern)
+        self.patterns.append(pattern)
+
+    @classmethod
+    def from_store(cls, store : PatternStore, limit_patterns : Optional[int] = None,
+                   dedup : Optional[Deduplicator] = None) -> PatternDB:
+        """Patterns are loaded from the store on first access unless a deduplicator is given, which needs to
+        inspect all of them"""
+        name = os.path.basename(os.path.normpath(store.dirpath))
+        if not dedup:
+            patterns = StorePatterns(store=store, num_stored=limit_patterns)
+            return cls(patterns=patterns, fpath_dict=StoreFpathDict(patterns=patterns), name=name)
+
+        db = cls._make_empty(name=name)
+        for fpath, pattern in store.iter_entries():
+            if not limit_patterns is None and len(db.patterns) >= limit_patterns:
+                break
+            if dedup and dedup.is_duplicate(pattern=pattern, fpath=fpath):
+                continue
+            db._add_pattern(pattern=pattern, fpath=fpath)
+        return db
 
-    def save(self, dirpath : str, skip_if_occupied : bool = True):
+    def save(self, dirpath : str, skip_if_occupied : bool = True, as_store : bool = False,
+             shard_size : int = PatternStore.default_shard_size):
+        """Saves one aimat json file per pattern or, if as_store, a sharded PatternStore"""
         is_occupied = os.path.isfile(dirpath) or os.path.isdir(dirpath)
         if is_occupied and skip_if_occupied:
             print(f'Path \"{dirpath}\" already exists. Skipping save operation')
             return
 
+        if as_store:
+            entries = ((fpath, p) for fpath, patterns in self.fpath_dict.items() for p in patterns)
+            PatternStore.write(dirpath=dirpath, entries=entries, shard_size=shard_size)
+            return
+
         os.makedirs(dirpath, exist_ok=True)
         for j, patterns in enumerate(self.fpath_dict.values()):
             for k, p in enumerate(patterns):
@@ -98,14 +258,27 @@ class PatternDB:
     # operations
 
     @classmethod
-    def merge(cls, dbs : list[PatternDB]):
+    def merge(cls, dbs : list[PatternDB], dedup : Optional[Deduplicator] = None):
+        """Concatenates dbs. If a deduplicator is given, patterns it flags as duplicates (also of patterns it has seen
+        in earlier loads or merges) are dropped"""
         patterns = []
         fpath_dict = {}
         for db in dbs:
-            patterns += db.patterns
-            fpath_dict.update(db.fpath_dict)
+            db_fpath_dict = db.fpath_dict
+            if dedup:
+                db_fpath_dict = {fpath : [p for p in db_patterns if not dedup.is_duplicate(pattern=p, fpath=fpath)]
+                                 for fpath, db_patterns in db_fpath_dict.items()}
+                db_fpath_dict = {fpath : db_patterns for fpath, db_patterns in db_fpath_dict.items() if db_patterns}
+                patterns += [p for db_patterns in db_fpath_dict.values() for p in db_patterns]
+            else:
+                patterns += db.patterns
+            fpath_dict.update(db_fpath_dict)
 
-        return PatternDB(patterns=patterns, fpath_dict=fpath_dict)
+        merged = cls(patterns=patterns, fpath_dict=fpath_dict)
+        if not dedup and all(not db._index is None for db in dbs):
+            merged._index = LabelIndex.concatenate(indices=[db.index for db in dbs])
+            merged._index_tail = patterns[-1] if patterns else None
+        return merged
 
     def __add__(self, other : PatternDB) -> PatternDB:
         return PatternDB.merge(dbs=[self, other])
@@ -113,6 +286,75 @@ class PatternDB:
     def set_xray(self, xray_info : XrayInfo):
         for p in self.patterns:
             p.powder_experiment.xray_info = xray_info
+        if not self._index is None:
+            self._index.set_xray(xray_info=xray_info)
+
+    # -------------------------------------------
+    # index
+
+    @property
+    def index(self) -> LabelIndex:
+        """Columnar label index over patterns, built on first access. Patterns appended since the last access are
+        indexed on demand and the index is rebuilt if indexed patterns were removed or replaced (detected via the
+        length and last indexed pattern); use reindex after modifying the labels of patterns that are already indexed"""
+        if self._index is None or not self._is_index_prefix():
+            self._index = LabelIndex()
+        if len(self._index) < len(self.patterns):
+            self._index.extend(self.patterns[len(self._index):])
+        self._index_tail = self.patterns[-1] if len(self.patterns) > 0 else None
+        return self._index
+
+    def reindex(self):
+        self._index = LabelIndex.from_patterns(self.patterns)
+        self._index_tail = self.patterns[-1] if len(self.patterns) > 0 else None
+
+    def _is_index_prefix(self) -> bool:
+        num_indexed = len(self._index)
+        if num_indexed > len(self.patterns):
+            return False
+        return num_indexed == 0 or self.patterns[num_indexed - 1] is self._index_tail
+
+    def query(self, labels : Iterable[LabelType] = (),
+              any_labels : Iterable[LabelType] = (),
+              spacegroups : Optional[Iterable[int]] = None,
+              original_formats : Optional[Iterable[str]] = None,
+              **ranges : tuple[Optional[float], Optional[float]]) -> PatternView:
+        """Selects patterns by their indexed attributes, e.g. query(labels=[LabelType.spg], temp_K=(250, 350)).
+        Range keywords are index columns mapped to inclusive (low, high) bounds, None for an open bound"""
+        mask = self.index.get_mask(labels=labels, any_labels=any_labels, spacegroups=spacegroups,
+                                   original_formats=original_formats, **ranges)
+        return PatternView(db=self, indices=np.flatnonzero(mask))
+
+    # -------------------------------------------
+    # standardization
+
+    def get_standardized_matrix(self, num_entries : Optional[int] = None,
+                                two_theta_range : Optional[tuple[float, float]] = None,
+                                dtype : type = np.float32,
+                                out : Optional[NDArray] = None,
+                                batch_size : int = 1024,
+                                method : InterpolationMethod = InterpolationMethod.cubic,
+                                cache : Optional[MatrixCache] = None) -> NDArray:
+        """Standardized intensities of all patterns as rows of a (num patterns, num_entries) matrix, equal to stacking
+        get_pattern_data of each pattern. Patterns are standardized batch_size at a time directly into out, which may
+        be a preallocated or memory-mapped array (e.g. np.lib.format.open_memmap) to bound memory use. If a cache is
+        given, the matrix is served from (or added to) it as a read-only memory-mapped array"""
+        if not cache is None:
+            if not out is None:
+                raise ValueError('Cannot write into a given output array when reading from a matrix cache')
+            return cache.get_matrix(db=self, num_entries=num_entries, two_theta_range=two_theta_range, dtype=dtype,
+                                    batch_size=batch_size, method=method)
+        std_angles = get_std_angles(num_entries=num_entries, two_theta_range=two_theta_range)
+        shape = (len(self.patterns), len(std_angles))
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f'Output array has shape {out.shape}, expected {shape}')
+
+        for start in range(0, len(self.patterns), batch_size):
+            batch = self.patterns[start:start + batch_size]
+            out[start:start + len(batch)] = standardize_batch(patterns=batch, std_angles=std_angles, method=method)
+        return out
 
     def __eq__(self, other : PatternDB):
         if not isinstance(other, PatternDB):
@@ -161,6 +403,59 @@ class PatternDB:
                 break
 
 
+def extract_sources(sources : Iterable[tuple[str, Optional[bytes]]], csv_orientation : Optional[str],
+                    workers : int = 1, cache : Optional[ParseCache] = None, cache_scope : str = '') -> Iterator[ParseResult]:
+    """Yields (name, xrd_datas, error repr) for each (name, content) source in the given order. Sources without
+    content are read from the filesystem. Results found in cache are served without parsing and new results are
+    stored in it. For workers > 1 sources are parsed by a process pool with a bounded number of pending sources;
+    these are cancelled once the generator is closed"""
+    extract = partial(try_extract, csv_orientation=csv_orientation)
+
+    def lookup(the_source) -> Optional[ParseResult]:
+        return cache.lookup(*the_source, scope=cache_scope, csv_orientation=csv_orientation) if cache else None
+
+    def store(the_source, the_result : ParseResult) -> ParseResult:
+        if cache:
+            cache.store(*the_source, result=the_result, scope=cache_scope, csv_orientation=csv_orientation)
+        return the_result
+
+    if workers == 1:
+        for source in sources:
+            yield lookup(source) or store(source, extract(source))
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+
+    def pop_result() -> ParseResult:
+        the_source, item = pending.popleft()
+        return store(the_source, item.result()) if isinstance(item, Future) else item
+
+    try:
+        for source in sources:
+            cached = lookup(source)
+            pending.append((source, cached or executor.submit(extract, source)))
+            if len(pending) >= MAX_PENDING_PER_WORKER * workers:
+                yield pop_result()
+        while pending:
+            yield pop_result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def try_extract(source : tuple[str, Optional[bytes]], csv_orientation : Optional[str]) -> ParseResult:
+    name, data = source
+    try:
+        if data is None:
+            xrd_datas = parser.extract(fpath=name, csv_orientation=csv_orientation)
+        else:
+            suffix = PathTools.get_suffix(fpath=name)
+            xrd_datas = parser.extract_bytes(data=data, suffix=suffix, csv_orientation=csv_orientation, fname=os.path.basename(name))
+        return name, xrd_datas, None
+    except Exception as e:
+        return name, [], e.__repr__()
+
+
 def multiplot(patterns : list[XrdPattern], start_idx : int):
     labels = [p.get_name() for p in patterns]
     fig, axes = plt.subplots(4, 8, figsize=(20, 10))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from xrdpattern.xrd import XrdData
+
+# -------------------------------------------
+
+@dataclass
+class DuplicateCluster:
+    """A kept pattern together with the sources of the patterns that were dropped as its duplicates"""
+    fpath : str
+    exact_duplicates : list[str] = field(default_factory=list)
+    near_duplicates : list[str] = field(default_factory=list)
+
+    @property
+    def num_duplicates(self) -> int:
+        return len(self.exact_duplicates) + len(self.near_duplicates)
+
+
+class Deduplicator:
+    """Remembers the patterns kept so far and flags new patterns as duplicates of them. Exact duplicates share a
+    content hash of their two theta and intensity arrays. If near_duplicates is set, patterns are additionally
+    standardized to num_entries values and compared via random hyperplane LSH: the num_bits signature is split into
+    num_bands bands and patterns sharing a band are candidates, which count as duplicates if the cosine similarity
+    of their (mean centered) standardized intensities is at least threshold. A kept pattern is not a duplicate of
+    itself, so dbs loaded with a deduplicator can be merged with it"""
+    def __init__(self, near_duplicates : bool = False, threshold : float = 0.99, num_entries : int = 512,
+                 num_bits : int = 64, num_bands : int = 8, seed : int = 0):
+        if num_bits % num_bands != 0:
+            raise ValueError(f'Number of bits {num_bits} must be divisible by number of bands {num_bands}')
+        self.near_duplicates : bool = near_duplicates
+        self.threshold : float = threshold
+        self.num_entries : int = num_entries
+        self.num_bands : int = num_bands
+
+        self.clusters : list[DuplicateCluster] = []
+        self._hashes : dict[bytes, int] = {}
+        self._kept : dict[int, weakref.ref] = {}
+        self._buckets : dict[tuple[int, bytes], list[int]] = {}
+        self._vectors : dict[int, NDArray] = {}
+        self._planes : NDArray = np.random.default_rng(seed).standard_normal((num_bits, num_entries)).astype(np.float32)
+
+    def is_duplicate(self, pattern : XrdData, fpath : str) -> bool:
+        """Returns True if pattern duplicates a kept pattern, otherwise keeps it"""
+        content_hash = get_content_hash(pattern=pattern)
+        if content_hash in self._hashes:
+            cluster_index = self._hashes[content_hash]
+            if self.clusters[cluster_index].fpath == fpath and self._kept[cluster_index]() is pattern:
+                return False
+            self.clusters[cluster_index].exact_duplicates.append(fpath)
+            return True
+
+        vector, band_keys = None, []
+        if self.near_duplicates:
+            vector = self.get_vector(pattern=pattern)
+            band_keys = self.get_band_keys(vector=vector)
+            match = self._find_near(vector=vector, band_keys=band_keys)
+            if not match is None:
+                self.clusters[match].near_duplicates.append(fpath)
+                return True
+
+        cluster_index = len(self.clusters)
+        self.clusters.append(DuplicateCluster(fpath=fpath))
+        self._hashes[content_hash] = cluster_index
+        self._kept[cluster_index] = weakref.ref(pattern)
+        if self.near_duplicates:
+            self._vectors[cluster_index] = vector
+            for key in band_keys:
+                self._buckets.setdefault(key, []).append(cluster_index)
+        return False
+
+    def _find_near(self, vector : NDArray, band_keys : list[tuple[int, bytes]]) -> Optional[int]:
+        candidates = sorted({c for key in band_keys for c in self._buckets.get(key, [])})
+        for candidate in candidates:
+            if float(np.dot(vector, self._vectors[candidate])) >= self.threshold:
+                return candidate
+        return None
+
+    def get_vector(self, pattern : XrdData) -> NDArray:
+        """Unit norm, mean centered standardized intensities"""
+        _, intensities = pattern.get_pattern_data(num_entries=self.num_entries)
+        vector = (intensities - np.mean(intensities)).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get_band_keys(self, vector : NDArray) -> list[tuple[int, bytes]]:
+        bits = (self._planes @ vector) > 0
+        return [(band, np.packbits(band_bits).tobytes()) for band, band_bits in enumerate(np.split(bits, self.num_bands))]
+
+    # -------------------------------------------
+    # report
+
+    def get_duplicate_clusters(self) -> list[DuplicateCluster]:
+        return [c for c in self.clusters if c.num_duplicates > 0]
+
+    def get_report(self) -> str:
+        clusters = self.get_duplicate_clusters()
+        num_exact = sum(len(c.exact_duplicates) for c in clusters)
+        num_near = sum(len(c.near_duplicates) for c in clusters)
+        lines = [f'Dropped {num_exact + num_near} duplicate patterns ({num_exact} exact, {num_near} near) '
+                 f'in {len(clusters)} clusters:']
+        for c in clusters:
+            lines.append(f'- {c.fpath}')
+            lines += [f'    = {fpath}' for fpath in c.exact_duplicates]
+            lines += [f'    ~ {fpath}' for fpath in c.near_duplicates]
+        return '\n'.join(lines)
+
+
+def get_content_hash(pattern : XrdData) -> bytes:
+    content_hash = hashlib.blake2b(digest_size=16)
+    for arr in (pattern.two_theta_values, pattern.intensities):
+        content_hash.update(np.ascontiguousarray(arr, dtype='<f8').tobytes())
+    return content_hash.digest()
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from xrdpattern.xrd import XrdData, XrayInfo, LabelType
+
+if TYPE_CHECKING:
+    from .db import PatternDB
+    from .pattern import XrdPattern
+
+INDEXED_LABELS = [lt for lt in LabelType if not lt in (LabelType.lengths, LabelType.angles)]
+NO_SPACEGROUP = 0
+
+# -------------------------------------------
+
+class LabelIndex:
+    """Columnar index of per pattern scalar attributes of a PatternDB. Rows are appended in place (with amortized
+    growth) as patterns are added; missing float values are nan, a missing spacegroup is NO_SPACEGROUP and the
+    presence of labels is recorded as a bitmask over INDEXED_LABELS"""
+    column_dtypes = {
+        'spacegroup' : np.int16,
+        'primary_wavelength' : np.float64,
+        'secondary_wavelength' : np.float64,
+        'temp_K' : np.float64,
+        'crystallite_size_nm' : np.float64,
+        'label_mask' : np.uint16,
+        'startval' : np.float64,
+        'endval' : np.float64,
+        'num_entries' : np.int64,
+        'format_code' : np.int16
+    }
+
+    def __init__(self, capacity : int = 16):
+        self.size : int = 0
+        self.formats : list[Optional[str]] = []
+        self._columns : dict[str, NDArray] = {name : np.empty(capacity, dtype=dtype) for name, dtype in self.column_dtypes.items()}
+
+    @classmethod
+    def from_patterns(cls, patterns : Iterable[XrdData]) -> LabelIndex:
+        index = cls()
+        index.extend(patterns)
+        return index
+
+    @classmethod
+    def concatenate(cls, indices : list[LabelIndex]) -> LabelIndex:
+        """Merges indices without revisiting their patterns; format codes are remapped onto the merged categories"""
+        merged = cls(capacity=max(sum(len(index) for index in indices), 1))
+        for index in indices:
+            code_map = np.array([merged.get_format_code(f) for f in index.formats], dtype=np.int16)
+            start, end = merged.size, merged.size + len(index)
+            for name, column in merged._columns.items():
+                column[start:end] = index[name]
+            if len(index) > 0:
+                merged._columns['format_code'][start:end] = code_map[index['format_code']]
+            merged.size = end
+        return merged
+
+    # -------------------------------------------
+    # update
+
+    def append(self, pattern : XrdData):
+        self._reserve(self.size + 1)
+        self.set_row(row=self.size, pattern=pattern)
+        self.size += 1
+
+    def extend(self, patterns : Iterable[XrdData]):
+        for pattern in patterns:
+            self.append(pattern)
+
+    def set_row(self, row : int, pattern : XrdData):
+        experiment, phase = pattern.powder_experiment, pattern.primary_phase
+        values = {
+            'spacegroup' : NO_SPACEGROUP if phase is None or phase.spacegroup is None else phase.spacegroup,
+            'primary_wavelength' : experiment.xray_info.primary_wavelength,
+            'secondary_wavelength' : experiment.xray_info.secondary_wavelength,
+            'temp_K' : experiment.temp_K,
+            'crystallite_size_nm' : experiment.crystallite_size_nm,
+            'label_mask' : sum(get_label_bit(lt) for lt in INDEXED_LABELS if pattern.has_label(label_type=lt)),
+            'startval' : np.min(pattern.two_theta_values),
+            'endval' : np.max(pattern.two_theta_values),
+            'num_entries' : pattern.num_entries,
+            'format_code' : self.get_format_code(pattern.metadata.original_file_format)
+        }
+        for name, value in values.items():
+            self._columns[name][row] = np.nan if value is None else value
+
+    def set_xray(self, xray_info : XrayInfo):
+        """Mirrors PatternDB.set_xray, which assigns the same xray info to every pattern"""
+        for name, label_type in [('primary_wavelength', LabelType.primary_wavelength), ('secondary_wavelength', LabelType.secondary_wavelength)]:
+            value = getattr(xray_info, name)
+            self._columns[name][:self.size] = np.nan if value is None else value
+            if value is None:
+                self._columns['label_mask'][:self.size] &= ~np.uint16(get_label_bit(label_type))
+            else:
+                self._columns['label_mask'][:self.size] |= np.uint16(get_label_bit(label_type))
+
+    def get_format_code(self, original_format : Optional[str]) -> int:
+        if not original_format in self.formats:
+            self.formats.append(original_format)
+        return self.formats.index(original_format)
+
+    def _reserve(self, capacity : int):
+        current = len(self._columns['spacegroup'])
+        if capacity <= current:
+            return
+        new_capacity = max(capacity, 2 * current)
+        for name, column in self._columns.items():
+            grown = np.empty(new_capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self._columns[name] = grown
+
+    # -------------------------------------------
+    # access
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, name : str) -> NDArray:
+        """Read-only view of the indexed rows of a column"""
+        view = self._columns[name][:self.size]
+        view.flags.writeable = False
+        return view
+
+    def get_original_formats(self) -> NDArray:
+        return np.array(self.formats, dtype=object)[self['format_code']]
+
+    def get_mask(self, labels : Iterable[LabelType] = (),
+                 any_labels : Iterable[LabelType] = (),
+                 spacegroups : Optional[Iterable[int]] = None,
+                 original_formats : Optional[Iterable[str]] = None,
+                 **ranges : tuple[Optional[float], Optional[float]]) -> NDArray:
+        """Rows that carry all of labels, at least one of any_labels (if given), a spacegroup/original format from the
+        given collections and whose numerical columns lie within the given inclusive (low, high) ranges"""
+        mask = np.ones(self.size, dtype=bool)
+        label_mask = self['label_mask']
+
+        required_bits = sum(get_label_bit(lt) for lt in labels)
+        if required_bits:
+            mask &= (label_mask & required_bits) == required_bits
+        any_bits = sum(get_label_bit(lt) for lt in any_labels)
+        if any_bits:
+            mask &= (label_mask & any_bits) != 0
+        if not spacegroups is None:
+            mask &= np.isin(self['spacegroup'], list(spacegroups))
+        if not original_formats is None:
+            codes = [self.formats.index(f) for f in original_formats if f in self.formats]
+            mask &= np.isin(self['format_code'], codes)
+
+        for name, (low, high) in ranges.items():
+            if not name in self.column_dtypes or name in ('label_mask', 'format_code'):
+                raise ValueError(f'Cannot filter by range of {name}. Range filters are available for '
+                                 f'{[n for n in self.column_dtypes if not n in ("label_mask", "format_code")]}')
+            column = self[name]
+            if not low is None:
+                mask &= column >= low
+            if not high is None:
+                mask &= column <= high
+
+        return mask
+
+
+class PatternView:
+    """Selection of patterns of a PatternDB that holds only their indices; patterns are looked up on access"""
+    def __init__(self, db : PatternDB, indices : NDArray):
+        self.db : PatternDB = db
+        self.indices : NDArray = indices
+
+    def query(self, **conditions) -> PatternView:
+        """Narrows down the selection; accepts the same conditions as PatternDB.query"""
+        mask = self.db.index.get_mask(**conditions)
+        return PatternView(db=self.db, indices=self.indices[mask[self.indices]])
+
+    def get_column(self, name : str) -> NDArray:
+        return self.db.index[name][self.indices]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, item : int) -> XrdPattern:
+        return self.db.patterns[self.indices[item]]
+
+    def __iter__(self) -> Iterator[XrdPattern]:
+        for i in self.indices:
+            yield self.db.patterns[i]
+
+    @property
+    def patterns(self) -> list[XrdPattern]:
+        return [self.db.patterns[i] for i in self.indices]
+
+
+def get_label_bit(label_type : LabelType) -> int:
+    if not label_type in INDEXED_LABELS:
+        raise ValueError(f'Label type {label_type} is not indexed. Indexed label types are {INDEXED_LABELS}')
+    return 1 << INDEXED_LABELS.index(label_type)
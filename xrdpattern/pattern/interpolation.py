@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from enum import Enum
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.interpolate import CubicSpline, PchipInterpolator, Akima1DInterpolator
+
+# -------------------------------------------
+
+class InterpolationMethod(Enum):
+    cubic = 'cubic'
+    linear = 'linear'
+    pchip = 'pchip'
+    akima = 'akima'
+    rebin = 'rebin'
+
+
+def interpolate(x : NDArray, y : NDArray, query : NDArray, method : InterpolationMethod) -> NDArray:
+    """Values at query points of the interpolant of x, y (strictly increasing x):
+    - cubic: not-a-knot cubic spline, smooth but may overshoot next to sharp peaks
+    - linear: piecewise linear, cheapest
+    - pchip/akima: monotonicity preserving/damped cubic interpolants without overshoot
+    - rebin: mean of the piecewise linear pattern over the bin of each query point, preserves peak areas when downsampling"""
+    if method == InterpolationMethod.cubic:
+        return CubicSpline(x, y)(query)
+    elif method == InterpolationMethod.linear:
+        return np.interp(query, x, y)
+    elif method == InterpolationMethod.pchip:
+        return PchipInterpolator(x, y)(query)
+    elif method == InterpolationMethod.akima:
+        return Akima1DInterpolator(x, y)(query, extrapolate=True)
+    elif method == InterpolationMethod.rebin:
+        return rebin(x=x, y=y, centers=query)
+    else:
+        raise ValueError(f'Interpolation method {method} is not supported.')
+
+
+def rebin(x : NDArray, y : NDArray, centers : NDArray) -> NDArray:
+    """Mean of the piecewise linear x, y over bins around centers. Bin edges lie halfway between neighbouring centers
+    and are clipped to [x[0], x[-1]]"""
+    if len(centers) == 1:
+        edges = np.array([x[0], x[-1]], dtype=np.float64)
+    else:
+        edges = np.empty(len(centers) + 1)
+        edges[1:-1] = (centers[1:] + centers[:-1]) / 2
+        edges[0] = 2 * centers[0] - edges[1]
+        edges[-1] = 2 * centers[-1] - edges[-2]
+        np.clip(edges, x[0], x[-1], out=edges)
+
+    widths = np.diff(edges)
+    areas = np.diff(get_integral(x=x, y=y, points=edges))
+    return np.where(widths > 0, areas / np.where(widths > 0, widths, 1), np.interp(centers, x, y))
+
+
+def get_integral(x : NDArray, y : NDArray, points : NDArray) -> NDArray:
+    """Integral of the piecewise linear x, y from x[0] to each of points"""
+    dx = np.diff(x)
+    cumulative = np.concatenate(([0], np.cumsum(dx * (y[1:] + y[:-1]) / 2)))
+    intervals = np.clip(np.searchsorted(x, points, side='right') - 1, 0, len(x) - 2)
+    t = points - x[intervals]
+    slopes = (y[intervals + 1] - y[intervals]) / dx[intervals]
+    return cumulative[intervals] + y[intervals] * t + slopes * t * t / 2
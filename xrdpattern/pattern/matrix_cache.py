@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Optional, Iterator, TYPE_CHECKING
+
+import numpy as np
+import orjson
+from numpy.typing import NDArray
+
+from .interpolation import InterpolationMethod
+from .pattern import XrdPattern
+from .standardize import get_std_angles
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+if TYPE_CHECKING:
+    from .db import PatternDB
+
+# -------------------------------------------
+
+class MatrixCache:
+    """Persistent cache of standardized matrices (PatternDB.get_standardized_matrix) in dirpath. Entries are keyed by a
+    sha256 fingerprint of the two theta values and intensities of all patterns together with the standardization
+    parameters and stored as .npy files, which are memory-mapped read-only on lookup. Once the stored matrices exceed
+    max_bytes, the least recently used ones are deleted. Matrices are written to unique temporary files and moved into
+    place and the manifest is only updated under a file lock, so processes can share dirpath"""
+    manifest_fname = 'manifest.json'
+    lock_fname = 'manifest.lock'
+    default_max_bytes = 16 * 1024 ** 3
+
+    def __init__(self, dirpath : str, max_bytes : int = default_max_bytes):
+        self.dirpath : str = os.path.abspath(dirpath)
+        self.max_bytes : int = max_bytes
+        self.num_hits : int = 0
+        os.makedirs(self.dirpath, exist_ok=True)
+
+    @property
+    def manifest_fpath(self) -> str:
+        return os.path.join(self.dirpath, self.manifest_fname)
+
+    @property
+    def lock_fpath(self) -> str:
+        return os.path.join(self.dirpath, self.lock_fname)
+
+    # -------------------------------------------
+    # lookup/store
+
+    def get_matrix(self, db : PatternDB, num_entries : Optional[int] = None,
+                   two_theta_range : Optional[tuple[float, float]] = None,
+                   dtype : type = np.float32,
+                   batch_size : int = 1024,
+                   method : InterpolationMethod = InterpolationMethod.cubic) -> NDArray:
+        """Cached standardized matrix of db. Matrices that are not cached yet are standardized directly into a
+        memory-mapped file; matrices larger than max_bytes are computed in memory without caching"""
+        std_angles = get_std_angles(num_entries=num_entries, two_theta_range=two_theta_range)
+        params = {'num_entries' : len(std_angles),
+                  'two_theta_range' : [float(std_angles[0]), float(std_angles[-1])],
+                  'method' : InterpolationMethod(method).value,
+                  'dtype' : np.dtype(dtype).str}
+        key = self.get_key(fingerprint=self.get_fingerprint(patterns=db.patterns), params=params)
+        matrix = self.lookup(key=key)
+        if not matrix is None:
+            return matrix
+
+        kwargs = {'num_entries' : len(std_angles), 'two_theta_range' : two_theta_range, 'dtype' : dtype,
+                  'batch_size' : batch_size, 'method' : method}
+        shape = (len(db.patterns), len(std_angles))
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        if nbytes == 0 or nbytes > self.max_bytes:
+            return db.get_standardized_matrix(**kwargs)
+
+        fd, tmp_fpath = tempfile.mkstemp(dir=self.dirpath, prefix=f'{key}.', suffix='.npy.tmp')
+        os.close(fd)
+        try:
+            out = np.lib.format.open_memmap(tmp_fpath, mode='w+', dtype=dtype, shape=shape)
+            db.get_standardized_matrix(out=out, **kwargs)
+            out.flush()
+            del out
+            os.replace(tmp_fpath, self.get_matrix_fpath(key=key))
+        finally:
+            if os.path.isfile(tmp_fpath):
+                os.remove(tmp_fpath)
+        matrix = np.load(self.get_matrix_fpath(key=key), mmap_mode='r')
+        self.store(key=key, entry={'shape' : list(shape), 'nbytes' : nbytes, 'params' : params})
+
+        return matrix
+
+    def lookup(self, key : str) -> Optional[NDArray]:
+        with self.lock():
+            manifest = self.load_manifest()
+            if not key in manifest:
+                return None
+            if not os.path.isfile(self.get_matrix_fpath(key=key)):
+                del manifest[key]
+                self.save_manifest(manifest=manifest)
+                return None
+
+            manifest[key]['last_used'] = time.time()
+            self.save_manifest(manifest=manifest)
+            self.num_hits += 1
+            return np.load(self.get_matrix_fpath(key=key), mmap_mode='r')
+
+    def store(self, key : str, entry : dict):
+        with self.lock():
+            manifest = self.load_manifest()
+            manifest[key] = {**entry, 'last_used' : time.time()}
+            total_bytes = sum(e['nbytes'] for e in manifest.values())
+            for old_key in sorted(manifest, key=lambda k: manifest[k]['last_used']):
+                if total_bytes <= self.max_bytes:
+                    break
+                if old_key == key:
+                    continue
+                total_bytes -= manifest.pop(old_key)['nbytes']
+                if os.path.isfile(self.get_matrix_fpath(key=old_key)):
+                    os.remove(self.get_matrix_fpath(key=old_key))
+            self.save_manifest(manifest=manifest)
+
+    def clear(self):
+        with self.lock():
+            for key in self.load_manifest():
+                if os.path.isfile(self.get_matrix_fpath(key=key)):
+                    os.remove(self.get_matrix_fpath(key=key))
+            self.save_manifest(manifest={})
+
+    # -------------------------------------------
+    # manifest
+
+    def load_manifest(self) -> dict[str, dict]:
+        """Read on every access, so processes sharing the cache directory see each others entries"""
+        if not os.path.isfile(self.manifest_fpath):
+            return {}
+        with open(self.manifest_fpath, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def save_manifest(self, manifest : dict[str, dict]):
+        """Callers hold the lock for the whole read-modify-write of the manifest"""
+        fd, tmp_fpath = tempfile.mkstemp(dir=self.dirpath, prefix=f'{self.manifest_fname}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(manifest))
+            os.replace(tmp_fpath, self.manifest_fpath)
+        finally:
+            if os.path.isfile(tmp_fpath):
+                os.remove(tmp_fpath)
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Exclusive lock on the cache directory across processes"""
+        with open(self.lock_fpath, 'a+b') as f:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    # -------------------------------------------
+    # keys
+
+    @staticmethod
+    def get_fingerprint(patterns : list[XrdPattern]) -> str:
+        content_hash = hashlib.sha256()
+        content_hash.update(np.array([len(p.two_theta_values) for p in patterns], dtype='<i8'))
+        for p in patterns:
+            content_hash.update(np.ascontiguousarray(p.two_theta_values, dtype='<f8'))
+            content_hash.update(np.ascontiguousarray(p.intensities, dtype='<f8'))
+        return content_hash.hexdigest()
+
+    @staticmethod
+    def get_key(fingerprint : str, params : dict) -> str:
+        return hashlib.sha256(fingerprint.encode() + orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def get_matrix_fpath(self, key : str) -> str:
+        return os.path.join(self.dirpath, f'{key}.npy')
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Optional
+
+import orjson
+
+from xrdpattern.parsing.xylib.xylib_repr import __version__ as xylib_version
+from xrdpattern.serialization import dumps_json
+from xrdpattern.xrd import XrdData
+from xrdpattern.xrd.metadata import get_library_version
+
+ParseResult = tuple[str, list[XrdData], Optional[str]]
+
+# -------------------------------------------
+
+class ParseCache:
+    """Persistent manifest of parse results stored in dirpath. Entries are keyed by file path (or archive path and
+    member name) and validated by size, mtime and optionally a sha256 content hash as well as the parse options
+    and the xrdpattern and xylib versions they were parsed with. Parsed patterns are stored as aimat json dicts;
+    failures are stored with their reason and are not re-parsed unless retry_failed is set"""
+    manifest_fname = 'manifest.json'
+    results_dirname = 'results'
+
+    def __init__(self, dirpath : str, hash_content : bool = False, retry_failed : bool = False):
+        self.dirpath : str = os.path.abspath(dirpath)
+        self.hash_content : bool = hash_content
+        self.retry_failed : bool = retry_failed
+        self.manifest : dict[str, dict] = {}
+        self.num_hits : int = 0
+
+        os.makedirs(os.path.join(self.dirpath, self.results_dirname), exist_ok=True)
+        if os.path.isfile(self.manifest_fpath):
+            with open(self.manifest_fpath, 'rb') as f:
+                self.manifest = orjson.loads(f.read())
+
+    @property
+    def manifest_fpath(self) -> str:
+        return os.path.join(self.dirpath, self.manifest_fname)
+
+    # -------------------------------------------
+    # lookup/store
+
+    def lookup(self, name : str, data : Optional[bytes], scope : str = '',
+               csv_orientation : Optional[str] = None) -> Optional[ParseResult]:
+        key = self.get_key(name=name, data=data, scope=scope)
+        entry = self.manifest.get(key)
+        if entry is None:
+            return None
+        fingerprint = self.get_fingerprint(name=name, data=data, with_hash='sha256' in entry, csv_orientation=csv_orientation)
+        if any(entry.get(k) != v for k, v in fingerprint.items()):
+            return None
+
+        if entry['reason'] is None:
+            with open(self.get_result_fpath(key=key), 'rb') as f:
+                xrd_datas = [XrdData.from_entry(d) for d in orjson.loads(f.read())]
+        elif self.retry_failed:
+            return None
+        else:
+            xrd_datas = []
+        self.num_hits += 1
+
+        return name, xrd_datas, entry['reason']
+
+    def store(self, name : str, data : Optional[bytes], result : ParseResult, scope : str = '',
+              csv_orientation : Optional[str] = None):
+        """Overwrites the entry of name, including the stored patterns of a previous successful parse"""
+        key = self.get_key(name=name, data=data, scope=scope)
+        _, xrd_datas, err_repr = result
+        result_fpath = self.get_result_fpath(key=key)
+        if err_repr is None:
+            with open(result_fpath, 'wb') as f:
+                f.write(dumps_json([d.to_dict() for d in xrd_datas]))
+        elif os.path.isfile(result_fpath):
+            os.remove(result_fpath)
+        entry = self.get_fingerprint(name=name, data=data, with_hash=self.hash_content, csv_orientation=csv_orientation)
+        entry['reason'] = err_repr
+        self.manifest[key] = entry
+
+    def save(self):
+        tmp_fpath = f'{self.manifest_fpath}.tmp'
+        with open(tmp_fpath, 'wb') as f:
+            f.write(orjson.dumps(self.manifest))
+        os.replace(tmp_fpath, self.manifest_fpath)
+
+    # -------------------------------------------
+    # keys
+
+    @staticmethod
+    def get_key(name : str, data : Optional[bytes], scope : str) -> str:
+        if data is None:
+            return os.path.abspath(name)
+        return f'{os.path.abspath(scope)}::{name}'
+
+    @staticmethod
+    def get_fingerprint(name : str, data : Optional[bytes], with_hash : bool, csv_orientation : Optional[str] = None) -> dict:
+        if data is None:
+            stat = os.stat(name)
+            fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            if with_hash:
+                with open(name, 'rb') as f:
+                    fingerprint['sha256'] = hashlib.sha256(f.read()).hexdigest()
+        else:
+            fingerprint = {'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+        fingerprint['csv_orientation'] = csv_orientation
+        fingerprint['parser_version'] = get_parser_version()
+        return fingerprint
+
+    def get_result_fpath(self, key : str) -> str:
+        fname = f'{hashlib.sha1(key.encode()).hexdigest()}.json'
+        return os.path.join(self.dirpath, self.results_dirname, fname)
+
+
+def get_parser_version() -> str:
+    return f'{get_library_version("xrdpattern")}+xylib-{xylib_version}'
@@ -8,11 +8,12 @@ from typing import Optional
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy.typing import NDArray
-from scipy.interpolate import CubicSpline
 
 from xrdpattern.parsing import MasterParser, Formats
-from xrdpattern.xrd import XrdData
+from xrdpattern.xrd import XrdData, PatternHeader
 from xrdpattern.xrd.experiment import PowderExperiment
+from .interpolation import InterpolationMethod, interpolate
+from .view_cache import view_cache
 
 parser = MasterParser()
 
@@ -29,11 +30,21 @@ class XrdPattern(XrdData):
         pattern = cls(**kwargs)
         return pattern
 
+    @staticmethod
+    def load_header(fpath : str) -> PatternHeader:
+        """Reads labels, metadata and length of an aimat json or binary pattern without loading its data"""
+        return PatternHeader.load(fpath=fpath)
+
     def save(self, fpath : str, force_overwrite : bool = False):
         if os.path.isfile(fpath) and not force_overwrite:
             raise ValueError(f'File {fpath} already exists')
+        if fpath.endswith(f'.{Formats.aimat_binary_suffix()}'):
+            with open(fpath, 'wb') as f:
+                f.write(self.to_bytes())
+            return
+
         if not fpath.endswith(f'.{Formats.aimat_suffix()}'):
-            print(f'[Warning]: Saved xrd files should end with ".{Formats.aimat_suffix()}" suffix. '
+            print(f'[Warning]: Saved xrd files should end with ".{Formats.aimat_suffix()}" or ".{Formats.aimat_binary_suffix()}" suffix. '
                   f'Given filename is {os.path.basename(fpath)}')
         with open(fpath, 'w') as f:
             f.write(self.to_str())
@@ -41,7 +52,11 @@ class XrdPattern(XrdData):
     # ------------------------------------------
     # standardization
 
-    def get_pattern_data(self, apply_standardization : bool = True, num_entries : Optional[int] = None) -> tuple[NDArray, NDArray]:
+    def get_pattern_data(self, apply_standardization : bool = True, num_entries : Optional[int] = None,
+                         method : InterpolationMethod = InterpolationMethod.cubic) -> tuple[NDArray, NDArray]:
+        """method selects the interpolation used for standardization, see interpolation.interpolate. Standardized
+        data is memoized in view_cache (if enabled via view_cache.enable) until the two theta values or intensities
+        of the pattern change"""
         if not apply_standardization and not num_entries is None:
             raise ValueError('num_entries specifies target number entries for standardization. '
                              'Cannot be used without standardization')
@@ -50,13 +65,21 @@ class XrdPattern(XrdData):
             if num_entries is None:
                 num_entries = self.std_num_entries()
             start, stop = self.std_two_theta_range()
-            angles, intensities = self._get_uniform(start_val=start, stop_val=stop, num_entries=num_entries)
+            method = InterpolationMethod(method)
+            params = (num_entries, start, stop, method.value, False)
+            cached = view_cache.get(pattern=self, params=params)
+            if cached is None:
+                angles, intensities = self._get_uniform(start_val=start, stop_val=stop, num_entries=num_entries, method=method)
+                view_cache.put(pattern=self, params=params, angles=angles, intensities=intensities)
+            else:
+                angles, intensities = cached
         else:
             angles, intensities = copy.deepcopy(self.two_theta_values), copy.copy(self.intensities)
 
         return angles, intensities
 
-    def _get_uniform(self, start_val : float, stop_val : float, num_entries : int, constant_padding : bool = False) -> (list[float], list[float]):
+    def _get_uniform(self, start_val : float, stop_val : float, num_entries : int, constant_padding : bool = False,
+                     method : InterpolationMethod = InterpolationMethod.cubic) -> (list[float], list[float]):
         start, end = self.two_theta_values[0], self.two_theta_values[-1]
         std_angles = np.linspace(start=start_val, stop=stop_val, num=num_entries)
 
@@ -64,14 +87,13 @@ class XrdPattern(XrdData):
         y = np.array(self.intensities)
         x, y = self.to_strictly_increasing(x, y)
 
-        cs = CubicSpline(x, y)
-        std_intensities = cs(std_angles)
+        std_intensities = np.empty(num_entries)
         below_start_indices = np.where(std_angles < start)[0]
         above_end_indices = np.where(std_angles > end)[0]
 
         indices_in_range = np.where((std_angles >= start) & (std_angles <= end))[0]
-        range_min = np.min(std_intensities[indices_in_range])
-        std_intensities -= range_min
+        in_range_intensities = interpolate(x=x, y=y, query=std_angles[indices_in_range], method=InterpolationMethod(method))
+        std_intensities[indices_in_range] = in_range_intensities - np.min(in_range_intensities)
 
         if constant_padding:
             below_start, after_end = y[0], y[-1]
@@ -89,6 +111,8 @@ class XrdPattern(XrdData):
 
     @staticmethod
     def to_strictly_increasing(x : NDArray, y : NDArray):
+        if np.all(x[1:] > x[:-1]):
+            return x, y
         indices = np.argsort(x)
         x_sorted, y_sorted = x[indices], y[indices]
         _, unique_indices = np.unique(x_sorted, return_index=True)
@@ -1,6 +1,6 @@
 import time
-from collections.abc import Collection
-from typing import Iterator
+from collections.abc import Iterable
+from typing import Iterator, Optional
 
 import progressbar
 from progressbar import ProgressBar
@@ -104,9 +104,11 @@ class TrackedInt:
 
 
 class TrackedCollection(Iterator):
-    def __init__(self, iterable : Collection):
+    def __init__(self, iterable : Iterable, length : Optional[int] = None):
+        if length is None:
+            length = len(iterable)
         self.inner : Iterator = iter(iterable)
-        self.tracking_int : TrackedInt = TrackedInt(start_value=0, finish_value=len(iterable))
+        self.tracking_int : TrackedInt = TrackedInt(start_value=0, finish_value=length)
 
     def __next__(self) -> object:
         self.tracking_int.increment(to_add=1)
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.linalg import solve_banded
+from scipy.sparse import csr_matrix
+
+from .interpolation import InterpolationMethod
+from .pattern import XrdPattern
+
+MIN_SPLINE_POINTS = 4
+OPERATOR_METHODS = (InterpolationMethod.cubic, InterpolationMethod.linear)
+
+# -------------------------------------------
+
+class GridGroup:
+    """Patterns of a batch that share one two theta grid, identified by the hash of their two theta values"""
+    def __init__(self, grid_hash : bytes, original_x : NDArray):
+        self.grid_hash : bytes = grid_hash
+        self.original_x : NDArray = original_x
+        self.selection : Optional[NDArray] = get_selection(x=original_x)
+        self.x : NDArray = original_x if self.selection is None else original_x[self.selection]
+        self.rows : list[int] = []
+        self.intensities : list[NDArray] = []
+
+    def get_ys(self) -> list[NDArray]:
+        """Intensities at the strictly increasing two theta values x"""
+        if self.selection is None:
+            return self.intensities
+        return [y[self.selection] for y in self.intensities]
+
+
+class ResamplingOperator:
+    """Linear map from intensities on a source grid to the values of their interpolant at the standardization angles
+    within the measured range, std_angles[low:high]. Linear interpolation is the sparse product value_map @ y. The
+    not-a-knot cubic spline is evaluated in Hermite form, values = value_map @ y + slope_map @ s, with the knot slopes s
+    solving the tridiagonal system A s = slope_rhs @ y. value_map, slope_map and slope_rhs are sparse, so a group of
+    patterns on the source grid is resampled with sparse matrix products and one banded solve"""
+    def __init__(self, original_x : NDArray, std_angles : NDArray, method : InterpolationMethod = InterpolationMethod.cubic):
+        if not method in OPERATOR_METHODS:
+            raise ValueError(f'Resampling operators are available for {OPERATOR_METHODS}. Got {method}')
+        original_x = np.asarray(original_x, dtype=np.float64)
+        self.selection : Optional[NDArray] = get_selection(x=original_x)
+        x = original_x if self.selection is None else original_x[self.selection]
+        if len(x) < MIN_SPLINE_POINTS:
+            raise ValueError(f'Resampling requires at least {MIN_SPLINE_POINTS} distinct two theta values. Got {len(x)}')
+
+        lows, highs = get_bounds(std_angles=std_angles, starts=original_x[:1], ends=original_x[-1:])
+        self.low, self.high = int(lows[0]), int(highs[0])
+        query = std_angles[self.low:self.high]
+        intervals = get_intervals(knots=x, query=query)
+
+        dx = np.diff(x)
+        h = dx[intervals]
+        t = (query - x[intervals]) / h
+        columns = np.stack([intervals, intervals + 1], axis=1)
+        self.slope_map : Optional[csr_matrix] = None
+        if method == InterpolationMethod.linear:
+            self.value_map : csr_matrix = make_row_map(weights=np.stack([1 - t, t], axis=1), columns=columns, num_columns=len(x))
+            return
+
+        t2, t3 = t * t, t * t * t
+        value_weights = np.stack([2 * t3 - 3 * t2 + 1, 3 * t2 - 2 * t3], axis=1)
+        slope_weights = h[:, None] * np.stack([t3 - 2 * t2 + t, t3 - t2], axis=1)
+        self.value_map : csr_matrix = make_row_map(weights=value_weights, columns=columns, num_columns=len(x))
+        self.slope_map : csr_matrix = make_row_map(weights=slope_weights, columns=columns, num_columns=len(x))
+        self.banded, self.slope_rhs = get_slope_system(x=x, dx=dx)
+
+    def apply(self, ys : NDArray) -> NDArray:
+        """Spline values at std_angles[low:high] of the columns of ys, intensities in the order of the source grid"""
+        if not self.selection is None:
+            ys = ys[self.selection]
+        return self.apply_selected(ys=ys)
+
+    def apply_selected(self, ys : NDArray) -> NDArray:
+        """As apply for intensities that are already reduced to the strictly increasing source grid"""
+        ys = np.asarray(ys, dtype=np.float64)
+        if self.slope_map is None:
+            return self.value_map @ ys
+        slopes = solve_banded((1, 1), self.banded, self.slope_rhs @ ys, overwrite_b=True, check_finite=False)
+        return self.value_map @ ys + self.slope_map @ slopes
+
+    @property
+    def nbytes(self) -> int:
+        matrices = [self.value_map] if self.slope_map is None else [self.value_map, self.slope_map, self.slope_rhs]
+        num_bytes = sum(m.data.nbytes + m.indices.nbytes + m.indptr.nbytes for m in matrices)
+        if not self.slope_map is None:
+            num_bytes += self.banded.nbytes
+        return num_bytes + (0 if self.selection is None else self.selection.nbytes)
+
+
+class OperatorCache:
+    """LRU cache of resampling operators keyed by (source grid hash, standardization grid, method)"""
+    def __init__(self, maxsize : int = 64):
+        self.maxsize : int = maxsize
+        self.hits : int = 0
+        self.misses : int = 0
+        self._operators : OrderedDict[tuple, ResamplingOperator] = OrderedDict()
+
+    def get(self, grid_hash : bytes, original_x : NDArray, std_angles : NDArray,
+            method : InterpolationMethod = InterpolationMethod.cubic) -> ResamplingOperator:
+        key = self.get_key(grid_hash=grid_hash, std_angles=std_angles, method=method)
+        if key in self._operators:
+            self.hits += 1
+            self._operators.move_to_end(key)
+            return self._operators[key]
+
+        self.misses += 1
+        operator = ResamplingOperator(original_x=original_x, std_angles=std_angles, method=method)
+        self._operators[key] = operator
+        while len(self._operators) > self.maxsize:
+            self._operators.popitem(last=False)
+        return operator
+
+    def contains(self, grid_hash : bytes, std_angles : NDArray, method : InterpolationMethod = InterpolationMethod.cubic) -> bool:
+        return self.get_key(grid_hash=grid_hash, std_angles=std_angles, method=method) in self._operators
+
+    def clear(self):
+        self._operators.clear()
+        self.hits, self.misses = 0, 0
+
+    def __len__(self) -> int:
+        return len(self._operators)
+
+    @staticmethod
+    def get_key(grid_hash : bytes, std_angles : NDArray, method : InterpolationMethod) -> tuple:
+        return grid_hash, len(std_angles), float(std_angles[0]), float(std_angles[-1]), method.value
+
+
+operator_cache = OperatorCache()
+
+# -------------------------------------------
+
+def standardize_batch(patterns : list[XrdPattern], std_angles : NDArray, constant_padding : bool = False,
+                      cache : Optional[OperatorCache] = None,
+                      method : InterpolationMethod = InterpolationMethod.cubic) -> NDArray:
+    """Standardized intensities of patterns on std_angles as a (len(patterns), len(std_angles)) float64 matrix with the
+    semantics of XrdPattern._get_uniform: interpolation, shift by the minimum inside the measured range, padding
+    outside of it and normalization to a maximum of 1. Patterns are grouped by the hash of their two theta grid. For
+    cubic and linear interpolation, groups of several patterns and grids with a cached operator are resampled by the
+    ResamplingOperator of their grid from cache (default: the module wide operator_cache) and the splines of all
+    remaining patterns are solved as one block tridiagonal system. Other methods are applied pattern by pattern"""
+    cache = operator_cache if cache is None else cache
+    method = InterpolationMethod(method)
+    result = np.empty((len(patterns), len(std_angles)), dtype=np.float64)
+    groups : dict[bytes, GridGroup] = {}
+    hashes_by_id : dict[int, tuple[bytes, NDArray]] = {}
+    for row, pattern in enumerate(patterns):
+        original_x = np.asarray(pattern.two_theta_values)
+        if not id(original_x) in hashes_by_id:
+            hashes_by_id[id(original_x)] = get_grid_hash(x=original_x), original_x
+        grid_hash = hashes_by_id[id(original_x)][0]
+        if not grid_hash in groups:
+            groups[grid_hash] = GridGroup(grid_hash=grid_hash, original_x=original_x)
+        groups[grid_hash].rows.append(row)
+        groups[grid_hash].intensities.append(np.asarray(pattern.intensities))
+
+    singles = []
+    for group in groups.values():
+        is_shared = len(group.rows) > 1 or cache.contains(grid_hash=group.grid_hash, std_angles=std_angles, method=method)
+        if len(group.x) >= MIN_SPLINE_POINTS and method in OPERATOR_METHODS and is_shared:
+            operator = cache.get(grid_hash=group.grid_hash, original_x=group.original_x, std_angles=std_angles, method=method)
+            result[group.rows] = standardize_group(group=group, operator=operator, num_entries=len(std_angles),
+                                                   constant_padding=constant_padding)
+        elif len(group.x) >= MIN_SPLINE_POINTS and method == InterpolationMethod.cubic:
+            singles.append(group)
+        else:
+            for row in group.rows:
+                result[row] = patterns[row]._get_uniform(start_val=std_angles[0], stop_val=std_angles[-1],
+                                                         num_entries=len(std_angles), constant_padding=constant_padding,
+                                                         method=method)[1]
+    if len(singles) > 0:
+        result[[g.rows[0] for g in singles]] = standardize_separate(groups=singles, std_angles=std_angles,
+                                                                    constant_padding=constant_padding)
+    return result
+
+
+def standardize_group(group : GridGroup, operator : ResamplingOperator, num_entries : int, constant_padding : bool) -> NDArray:
+    """Patterns on one grid: resampled together by the operator of the grid"""
+    ys = group.get_ys()
+    values = operator.apply_selected(ys=np.stack(ys, axis=1))
+    pad_below, pad_above = get_padding(ys=ys, constant_padding=constant_padding)
+
+    matrix = np.empty((len(ys), num_entries))
+    matrix[:, :operator.low] = pad_below[:, None]
+    matrix[:, operator.high:] = pad_above[:, None]
+    in_range = matrix[:, operator.low:operator.high]
+    in_range[:] = values.T
+    in_range -= np.min(in_range, axis=1, keepdims=True)
+    normalize_rows(matrix=matrix)
+    return matrix
+
+
+def standardize_separate(groups : list[GridGroup], std_angles : NDArray, constant_padding : bool) -> NDArray:
+    """Patterns on distinct grids: all splines are concatenated into one block tridiagonal system"""
+    xs, ys = [g.x for g in groups], [g.get_ys()[0] for g in groups]
+    offsets = np.concatenate(([0], np.cumsum([len(x) for x in xs])))
+    x, y = np.concatenate(xs).astype(np.float64), np.concatenate(ys).astype(np.float64)
+    lows, highs = get_bounds(std_angles=std_angles,
+                             starts=np.array([g.original_x[0] for g in groups], dtype=np.float64),
+                             ends=np.array([g.original_x[-1] for g in groups], dtype=np.float64))
+
+    segment_offsets = np.concatenate(([0], np.cumsum(highs - lows)))
+    query = np.empty(segment_offsets[-1], dtype=np.float64)
+    intervals = np.empty(segment_offsets[-1], dtype=np.intp)
+    for i, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        segment = slice(segment_offsets[i], segment_offsets[i + 1])
+        query[segment] = std_angles[lows[i]:highs[i]]
+        intervals[segment] = get_intervals(knots=x[start:end], query=query[segment]) + start
+
+    coefficients = get_spline_coefficients(x=x, y=y, offsets=offsets)
+    values = evaluate(coefficients=coefficients, intervals=intervals, h=query - x[intervals])
+
+    pad_below, pad_above = get_padding(ys=ys, constant_padding=constant_padding)
+    return finalize(values=values, num_entries=len(std_angles), lows=lows, highs=highs,
+                    pad_below=pad_below, pad_above=pad_above)
+
+# -------------------------------------------
+# kernels
+
+def get_spline_coefficients(x : NDArray, y : NDArray, offsets : NDArray) -> tuple[NDArray, ...]:
+    """Per interval polynomial coefficients c0..c3 (highest order first, in powers of x - x[i]) of not-a-knot cubic
+    splines through the concatenated knots x, y of several curves, the k-th curve spanning offsets[k]:offsets[k+1]"""
+    firsts, lasts = offsets[:-1], offsets[1:] - 1
+    dx = np.diff(x)
+    dx[lasts[:-1]] = 1
+    slope = np.diff(y) / dx
+    slope[lasts[:-1]] = 0
+
+    slopes = get_knot_slopes(x=x, dx=dx, slope=slope, firsts=firsts, lasts=lasts)
+    t = (slopes[:-1] + slopes[1:] - 2 * slope) / dx
+    return t / dx, (slope - slopes[:-1]) / dx - t, slopes[:-1], y[:-1]
+
+
+def get_knot_slopes(x : NDArray, dx : NDArray, slope : NDArray, firsts : NDArray, lasts : NDArray) -> NDArray:
+    """Knot derivatives of the not-a-knot splines from the banded system set up by scipy's CubicSpline. The systems of
+    all curves form one block tridiagonal matrix that is solved in a single banded solve"""
+    size = len(x)
+    banded = np.empty((3, size))
+    b = np.empty(size)
+    banded[1, 1:-1] = 2 * (dx[:-1] + dx[1:])
+    banded[0, 2:] = dx[:-1]
+    banded[2, :-2] = dx[1:]
+    b[1:-1] = 3 * (dx[1:] * slope[:-1] + dx[:-1] * slope[1:])
+
+    d = x[firsts + 2] - x[firsts]
+    banded[1, firsts] = dx[firsts + 1]
+    banded[0, firsts + 1] = d
+    b[firsts] = ((dx[firsts] + 2 * d) * dx[firsts + 1] * slope[firsts] + dx[firsts] ** 2 * slope[firsts + 1]) / d
+
+    d = x[lasts] - x[lasts - 2]
+    banded[1, lasts] = dx[lasts - 2]
+    banded[2, lasts - 1] = d
+    b[lasts] = (dx[lasts - 1] ** 2 * slope[lasts - 2] + (2 * d + dx[lasts - 1]) * dx[lasts - 2] * slope[lasts - 1]) / d
+
+    banded[0, firsts] = 0
+    banded[2, lasts] = 0
+    return solve_banded((1, 1), banded, b, overwrite_ab=True, overwrite_b=True, check_finite=False)
+
+
+def get_slope_system(x : NDArray, dx : NDArray) -> tuple[NDArray, csr_matrix]:
+    """The not-a-knot slope system of a single curve, A s = rhs @ y, as banded A and sparse tridiagonal rhs"""
+    size = len(x)
+    banded = np.zeros((3, size))
+    banded[1, 1:-1] = 2 * (dx[:-1] + dx[1:])
+    banded[0, 2:] = dx[:-1]
+    banded[2, :-2] = dx[1:]
+
+    weights = np.empty((size, 3))
+    columns = np.arange(size)[:, None] + np.array([-1, 0, 1])
+    ratio = dx[1:] / dx[:-1]
+    weights[1:-1] = 3 * np.stack([-ratio, ratio - 1 / ratio, 1 / ratio], axis=1)
+
+    d = x[2] - x[0]
+    banded[1, 0], banded[0, 1] = dx[1], d
+    a, c = (dx[0] + 2 * d) * dx[1] / (d * dx[0]), dx[0] ** 2 / (d * dx[1])
+    weights[0], columns[0] = [-a, a - c, c], [0, 1, 2]
+
+    d = x[-1] - x[-3]
+    banded[1, -1], banded[2, -2] = dx[-2], d
+    a, c = dx[-1] ** 2 / (d * dx[-2]), (2 * d + dx[-1]) * dx[-2] / (d * dx[-1])
+    weights[-1], columns[-1] = [-a, a - c, c], [size - 3, size - 2, size - 1]
+
+    return banded, make_row_map(weights=weights, columns=columns, num_columns=size)
+
+
+def make_row_map(weights : NDArray, columns : NDArray, num_columns : int) -> csr_matrix:
+    """Sparse matrix whose i-th row holds weights[i] at columns[i]"""
+    num_rows, row_nnz = weights.shape
+    indptr = np.arange(0, num_rows * row_nnz + 1, row_nnz)
+    return csr_matrix((weights.ravel(), columns.ravel(), indptr), shape=(num_rows, num_columns))
+
+
+def get_intervals(knots : NDArray, query : NDArray) -> NDArray:
+    """Index of the spline piece used at each query point; points beyond the knots use the outermost pieces"""
+    intervals = np.searchsorted(knots, query, side='right') - 1
+    return np.clip(intervals, 0, len(knots) - 2, out=intervals)
+
+
+def evaluate(coefficients : tuple[NDArray, ...], intervals : NDArray, h : NDArray) -> NDArray:
+    c0, c1, c2, c3 = (c[intervals] for c in coefficients)
+    c0 *= h
+    c0 += c1
+    c0 *= h
+    c0 += c2
+    c0 *= h
+    c0 += c3
+    return c0
+
+
+def finalize(values : NDArray, num_entries : int, lows : NDArray, highs : NDArray,
+             pad_below : NDArray, pad_above : NDArray) -> NDArray:
+    """Assembles the (len(lows), num_entries) matrix from the concatenated in range values of each row: shift by the
+    row-wise minimum, padding below lows and from highs on and max normalization"""
+    lengths = highs - lows
+    segment_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    values -= np.repeat(np.minimum.reduceat(values, segment_starts), lengths)
+
+    columns = np.arange(num_entries)
+    matrix = np.where(columns[None, :] < lows[:, None], pad_below[:, None], pad_above[:, None])
+    rows = np.repeat(np.arange(len(lows)), lengths)
+    matrix[rows, np.arange(len(values)) - np.repeat(segment_starts - lows, lengths)] = values
+
+    normalize_rows(matrix=matrix)
+    return matrix
+
+
+def normalize_rows(matrix : NDArray):
+    max_intensities = np.max(matrix, axis=1, keepdims=True)
+    matrix /= np.where(max_intensities > 0, max_intensities, 1)
+
+
+def get_bounds(std_angles : NDArray, starts : NDArray, ends : NDArray) -> tuple[NDArray, NDArray]:
+    """Column range [low, high) of std_angles within [start, end] of each pattern"""
+    lows, highs = np.searchsorted(std_angles, starts, side='left'), np.searchsorted(std_angles, ends, side='right')
+    if np.any(highs <= lows):
+        raise ValueError('Standardization range does not overlap with the two theta range of every pattern')
+    return lows, highs
+
+
+def get_padding(ys : list[NDArray], constant_padding : bool) -> tuple[NDArray, NDArray]:
+    if constant_padding:
+        return np.array([y[0] for y in ys], dtype=np.float64), np.array([y[-1] for y in ys], dtype=np.float64)
+    return np.zeros(len(ys)), np.zeros(len(ys))
+
+
+def get_selection(x : NDArray) -> Optional[NDArray]:
+    """Indices that XrdPattern.to_strictly_increasing keeps of x, None if x is strictly increasing already"""
+    if np.all(x[1:] > x[:-1]):
+        return None
+    indices = np.argsort(x)
+    _, unique_indices = np.unique(x[indices], return_index=True)
+    return indices[unique_indices]
+
+
+def get_grid_hash(x : NDArray) -> bytes:
+    return hashlib.blake2b(np.ascontiguousarray(x, dtype='<f8').tobytes(), digest_size=16).digest()
+
+
+def get_std_angles(num_entries : Optional[int] = None, two_theta_range : Optional[tuple[float, float]] = None) -> NDArray:
+    num_entries = num_entries or XrdPattern.std_num_entries()
+    start, stop = two_theta_range or XrdPattern.std_two_theta_range()
+    return np.linspace(start=start, stop=stop, num=num_entries)
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import operator
+import os
+from collections.abc import MutableSequence, MutableMapping
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+import orjson
+from numpy.typing import NDArray
+
+from xrdpattern.serialization import dumps_json
+from xrdpattern.xrd import XrdData, PowderExperiment, Metadata, PatternHeader
+from .pattern import XrdPattern
+
+# -------------------------------------------
+
+class PatternStore:
+    """Columnar on-disk store of patterns split into shards. Each shard concatenates the two theta values and
+    intensities of its patterns into one array each with an offsets index; source paths, labels and metadata go
+    into a json side table. Shards are memory-mapped on first access, so opening a store only reads its manifest.
+    Materialized patterns own copies of their arrays and can be modified freely"""
+    manifest_fname = 'store.json'
+    version = 1
+    default_shard_size = 10**5
+
+    def __init__(self, dirpath : str):
+        with open(os.path.join(dirpath, self.manifest_fname), 'rb') as f:
+            manifest = orjson.loads(f.read())
+        if manifest['version'] > self.version:
+            raise ValueError(f'Pattern store version {manifest["version"]} is newer than supported version {self.version}')
+
+        self.dirpath : str = dirpath
+        self.shard_sizes : list[int] = manifest['shard_sizes']
+        self.shard_starts : NDArray = np.cumsum([0] + self.shard_sizes)
+        self._shards : dict[int, StoreShard] = {}
+
+    @classmethod
+    def is_store(cls, dirpath : str) -> bool:
+        return os.path.isfile(os.path.join(dirpath, cls.manifest_fname))
+
+    @classmethod
+    def write(cls, dirpath : str, entries : Iterable[tuple[str, XrdData]], shard_size : int = default_shard_size) -> PatternStore:
+        """Writes (fpath, pattern) entries in order, holding at most one shard of patterns in memory"""
+        if shard_size < 1:
+            raise ValueError(f'Shard size must be at least 1. Got {shard_size}')
+        os.makedirs(dirpath, exist_ok=True)
+
+        shard_sizes = []
+        buffer = []
+        for entry in entries:
+            buffer.append(entry)
+            if len(buffer) == shard_size:
+                StoreShard.write(dirpath=os.path.join(dirpath, get_shard_name(len(shard_sizes))), entries=buffer)
+                shard_sizes.append(len(buffer))
+                buffer = []
+        if len(buffer) > 0:
+            StoreShard.write(dirpath=os.path.join(dirpath, get_shard_name(len(shard_sizes))), entries=buffer)
+            shard_sizes.append(len(buffer))
+
+        manifest_fpath = os.path.join(dirpath, cls.manifest_fname)
+        with open(f'{manifest_fpath}.tmp', 'wb') as f:
+            f.write(orjson.dumps({'version' : cls.version, 'shard_sizes' : shard_sizes}))
+        os.replace(f'{manifest_fpath}.tmp', manifest_fpath)
+
+        return cls(dirpath=dirpath)
+
+    # -------------------------------------------
+    # access
+
+    def __len__(self) -> int:
+        return int(self.shard_starts[-1])
+
+    def __getitem__(self, index : int) -> XrdPattern:
+        shard, local_index = self._locate(index=index)
+        return shard.get_pattern(index=local_index)
+
+    def __iter__(self) -> Iterator[XrdPattern]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def get_fpath(self, index : int) -> str:
+        shard, local_index = self._locate(index=index)
+        return shard.get_record(index=local_index)['fpath']
+
+    def get_header(self, index : int) -> PatternHeader:
+        shard, local_index = self._locate(index=index)
+        return shard.get_header(index=local_index)
+
+    def iter_headers(self) -> Iterator[tuple[str, PatternHeader]]:
+        for index in range(len(self)):
+            shard, local_index = self._locate(index=index)
+            record = shard.get_record(index=local_index)
+            yield record['fpath'], shard.get_header(index=local_index, record=record)
+
+    def iter_entries(self) -> Iterator[tuple[str, XrdPattern]]:
+        for index in range(len(self)):
+            shard, local_index = self._locate(index=index)
+            record = shard.get_record(index=local_index)
+            yield record['fpath'], shard.get_pattern(index=local_index, record=record)
+
+    def _locate(self, index : int) -> tuple[StoreShard, int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f'Pattern index {index} out of range for store with {len(self)} patterns')
+
+        shard_index = int(np.searchsorted(self.shard_starts, index, side='right')) - 1
+        if not shard_index in self._shards:
+            self._shards[shard_index] = StoreShard(dirpath=os.path.join(self.dirpath, get_shard_name(shard_index)))
+        return self._shards[shard_index], index - int(self.shard_starts[shard_index])
+
+
+class StoreShard:
+    def __init__(self, dirpath : str):
+        def load(name : str) -> NDArray:
+            return np.load(os.path.join(dirpath, f'{name}.npy'), mmap_mode='r')
+
+        self.two_theta_values : NDArray = load('two_theta_values')
+        self.intensities : NDArray = load('intensities')
+        self.offsets : NDArray = load('offsets')
+        self.table : NDArray = load('table')
+        self.table_offsets : NDArray = load('table_offsets')
+
+    @staticmethod
+    def write(dirpath : str, entries : list[tuple[str, XrdData]]):
+        os.makedirs(dirpath, exist_ok=True)
+        patterns = [p for _, p in entries]
+        records = [dumps_json({'fpath' : fpath,
+                               'label' : p.powder_experiment.to_dict(),
+                               'metadata' : p.metadata.to_dict()}) for fpath, p in entries]
+        columns = {
+            'two_theta_values' : np.concatenate([p.two_theta_values for p in patterns]).astype('<f8'),
+            'intensities' : np.concatenate([p.intensities for p in patterns]).astype('<f8'),
+            'offsets' : get_offsets(lengths=[len(p.two_theta_values) for p in patterns]),
+            'table' : np.frombuffer(b''.join(records), dtype=np.uint8),
+            'table_offsets' : get_offsets(lengths=[len(r) for r in records])
+        }
+        for name, arr in columns.items():
+            np.save(os.path.join(dirpath, f'{name}.npy'), arr)
+
+    def get_record(self, index : int) -> dict:
+        start, end = self.table_offsets[index], self.table_offsets[index + 1]
+        return orjson.loads(self.table[start:end].tobytes())
+
+    def get_header(self, index : int, record : Optional[dict] = None) -> PatternHeader:
+        record = record or self.get_record(index=index)
+        num_entries = int(self.offsets[index + 1] - self.offsets[index])
+        return PatternHeader.from_meta(meta=record, num_entries=num_entries)
+
+    def get_pattern(self, index : int, record : Optional[dict] = None) -> XrdPattern:
+        record = record or self.get_record(index=index)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return XrdPattern(two_theta_values=np.array(self.two_theta_values[start:end]),
+                          intensities=np.array(self.intensities[start:end]),
+                          powder_experiment=PowderExperiment.from_entry(record['label']),
+                          metadata=Metadata.from_entry(record['metadata']))
+
+
+# -------------------------------------------
+
+class StorePatterns(MutableSequence):
+    """Sequence over the first num_stored patterns of a store that are materialized on first access and then kept,
+    so modifications of them persist. Appended patterns are held in memory; other insertions and deletions as well as
+    slice assignments materialize all patterns"""
+    def __init__(self, store : PatternStore, num_stored : Optional[int] = None):
+        self.store : PatternStore = store
+        self.num_stored : int = len(store) if num_stored is None else min(num_stored, len(store))
+        self._loaded : dict[int, XrdPattern] = {}
+        self._appended : list[XrdPattern] = []
+        self._fpath_dict : Optional[StoreFpathDict] = None
+
+    @property
+    def num_loaded(self) -> int:
+        return len(self._loaded)
+
+    def __len__(self) -> int:
+        return self.num_stored + len(self._appended)
+
+    def __getitem__(self, index : Union[int, slice]) -> Union[XrdPattern, list[XrdPattern]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = self._normalize(index=index)
+        if index >= self.num_stored:
+            return self._appended[index - self.num_stored]
+        if not index in self._loaded:
+            self._loaded[index] = self.store[index]
+        return self._loaded[index]
+
+    def __setitem__(self, index : Union[int, slice], value):
+        if isinstance(index, slice):
+            self._materialize()
+            self._appended[index] = value
+            return
+        index = self._normalize(index=index)
+        if index >= self.num_stored:
+            self._appended[index - self.num_stored] = value
+        else:
+            self._loaded[index] = value
+
+    def __delitem__(self, index : Union[int, slice]):
+        self._materialize()
+        del self._appended[index]
+
+    def insert(self, index : int, value : XrdPattern):
+        if index < len(self):
+            self._materialize()
+        self._appended.insert(index - self.num_stored, value)
+
+    def __iter__(self) -> Iterator[XrdPattern]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, StorePatterns)):
+            return False
+        return len(self) == len(other) and all(p1 == p2 for p1, p2 in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f'StorePatterns(store={self.store.dirpath}, num_patterns={len(self)}, num_loaded={self.num_loaded})'
+
+    def _normalize(self, index : int) -> int:
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f'Pattern index {index} out of range for {len(self)} patterns')
+        return index
+
+    def _materialize(self):
+        if not self._fpath_dict is None:
+            self._fpath_dict.get_dict()
+        self._appended = list(self)
+        self.num_stored = 0
+        self._loaded = {}
+
+
+class StoreFpathDict(MutableMapping):
+    """Maps source paths to the patterns of a StorePatterns sequence. Built on first access, which loads all
+    stored patterns"""
+    def __init__(self, patterns : StorePatterns):
+        self.patterns : StorePatterns = patterns
+        self._dict : Optional[dict[str, list[XrdPattern]]] = None
+        patterns._fpath_dict = self
+
+    @property
+    def is_built(self) -> bool:
+        return not self._dict is None
+
+    def get_dict(self) -> dict[str, list[XrdPattern]]:
+        if self._dict is None:
+            self._dict = {}
+            for index in range(self.patterns.num_stored):
+                fpath = self.patterns.store.get_fpath(index=index)
+                if not fpath in self._dict:
+                    self._dict[fpath] = []
+                self._dict[fpath].append(self.patterns[index])
+        return self._dict
+
+    def __getitem__(self, fpath : str) -> list[XrdPattern]:
+        return self.get_dict()[fpath]
+
+    def __setitem__(self, fpath : str, patterns : list[XrdPattern]):
+        self.get_dict()[fpath] = patterns
+
+    def __delitem__(self, fpath : str):
+        del self.get_dict()[fpath]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.get_dict())
+
+    def __len__(self) -> int:
+        return len(self.get_dict())
+
+    def __repr__(self) -> str:
+        return repr(self.get_dict()) if self.is_built else f'StoreFpathDict(store={self.patterns.store.dirpath})'
+
+
+def get_shard_name(shard_index : int) -> str:
+    return f'shard_{shard_index:05d}'
+
+
+def get_offsets(lengths : list[int]) -> NDArray:
+    return np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
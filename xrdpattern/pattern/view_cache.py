@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from .pattern import XrdPattern
+
+# -------------------------------------------
+
+class ViewEntry:
+    def __init__(self, pattern : XrdPattern, angles : NDArray, intensities : NDArray):
+        self.pattern_ref : weakref.ref = weakref.ref(pattern)
+        self.source_two_theta_values : NDArray = np.array(pattern.two_theta_values)
+        self.source_intensities : NDArray = np.array(pattern.intensities)
+        self.angles : NDArray = np.array(angles)
+        self.intensities : NDArray = np.array(intensities)
+
+    def is_valid(self, pattern : XrdPattern) -> bool:
+        """Entries are valid while the pattern holds the data they were computed from"""
+        if not self.pattern_ref() is pattern:
+            return False
+        return (np.array_equal(self.source_intensities, pattern.intensities) and
+                np.array_equal(self.source_two_theta_values, pattern.two_theta_values))
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.source_two_theta_values, self.source_intensities, self.angles, self.intensities)
+        return sum(arr.nbytes for arr in arrays)
+
+
+class StandardizedViewCache:
+    """Memo of the standardized data of patterns, keyed by pattern instance and standardization parameters
+    (num_entries, two theta range, method, padding). An entry keeps a snapshot of the two theta values and intensities
+    it was computed from and is recomputed once they change, whether reassigned or modified in place; no other field
+    of a pattern enters standardization. Entries of all patterns share a budget of max_bytes (snapshots included)
+    and are evicted least recently used first. A budget of 0 disables caching"""
+    default_max_bytes = 256 * 1024 ** 2
+
+    def __init__(self, max_bytes : int = default_max_bytes):
+        self.max_bytes : int = max_bytes
+        self.nbytes : int = 0
+        self.hits : int = 0
+        self.misses : int = 0
+        self._entries : OrderedDict[tuple, ViewEntry] = OrderedDict()
+        self._keys_by_pattern : dict[int, set[tuple]] = {}
+
+    def get(self, pattern : XrdPattern, params : tuple) -> Optional[tuple[NDArray, NDArray]]:
+        """Copies of the cached standardized angles and intensities or None if there is no valid entry"""
+        if not self.is_enabled:
+            return None
+        key = (id(pattern),) + params
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_valid(pattern=pattern):
+            self.misses += 1
+            if not entry is None:
+                self._remove(key=key)
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.angles.copy(), entry.intensities.copy()
+
+    def put(self, pattern : XrdPattern, params : tuple, angles : NDArray, intensities : NDArray):
+        if not self.is_enabled:
+            return
+        entry = ViewEntry(pattern=pattern, angles=angles, intensities=intensities)
+        if entry.nbytes > self.max_bytes:
+            return
+
+        key = (id(pattern),) + params
+        if key in self._entries:
+            self._remove(key=key)
+        if not id(pattern) in self._keys_by_pattern:
+            self._keys_by_pattern[id(pattern)] = set()
+            weakref.finalize(pattern, self._forget, id(pattern))
+        self._keys_by_pattern[id(pattern)].add(key)
+        self._entries[key] = entry
+        self.nbytes += entry.nbytes
+
+        while self.nbytes > self.max_bytes:
+            self._remove(key=next(iter(self._entries)))
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def enable(self, max_bytes : int = default_max_bytes):
+        self.max_bytes = max_bytes
+        while self.nbytes > self.max_bytes:
+            self._remove(key=next(iter(self._entries)))
+
+    def disable(self):
+        self.clear()
+        self.max_bytes = 0
+
+    def clear(self):
+        for key in list(self._entries):
+            self._remove(key=key)
+        self.hits, self.misses = 0, 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key : tuple):
+        entry = self._entries.pop(key)
+        self.nbytes -= entry.nbytes
+        pattern_keys = self._keys_by_pattern.get(key[0])
+        if not pattern_keys is None:
+            pattern_keys.discard(key)
+
+    def _forget(self, pattern_id : int):
+        """Drops the entries of a garbage collected pattern"""
+        for key in self._keys_by_pattern.pop(pattern_id, set()):
+            if key in self._entries and self._entries[key].pattern_ref() is None:
+                self._remove(key=key)
+
+
+view_cache = StandardizedViewCache(max_bytes=0)
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import dataclasses
+import math
 import os
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, date, time
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from types import NoneType
-from typing import Optional
-from typing import get_type_hints, get_origin, get_args, Union
+from typing import Optional, Callable
+from typing import get_type_hints, get_origin, get_args, Union, Any
 
+import numpy as np
 import orjson
 
 # ---------------------------------------------------------------------
@@ -25,6 +28,21 @@ class Serializable:
     def from_str(cls, s: str):
         pass
 
+    def to_dict(self) -> Any:
+        """Native (json compatible) representation, nested serializables are native as well"""
+        return orjson.loads(self.to_str())
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls.from_str(dumps_json(d).decode('utf-8'))
+
+    @classmethod
+    def from_entry(cls, entry):
+        """Accepts both the native representation and the legacy layout in which nested objects are json strings"""
+        if isinstance(entry, str):
+            return cls.from_str(entry)
+        return cls.from_dict(entry)
+
     def save(self, fpath : str, force_overwrite : bool = False) -> str:
         fpath = os.path.abspath(path=fpath)
         dirpath = os.path.dirname(fpath)
@@ -49,6 +67,17 @@ class Serializable:
         return cls.from_str(str_data)
 
 
+def dumps_json(obj) -> bytes:
+    """Serializes native dicts in a single pass; numpy arrays and scalars are written directly"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=to_native)
+
+
+def to_native(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f'Object {obj} of type {type(obj)} is not json serializable')
+
+
 def get_suffix(fpath) -> Optional[str]:
     parts = fpath.split('.')
     if len(parts) == 1:
@@ -76,14 +105,17 @@ def get_free_path(save_dirpath : str, name : str, suffix : Optional[str] = None,
 
 
 BasicSerializable = (bool | int | float | str | Serializable | Decimal | datetime | date | time | Enum | None)
+Decoder = Callable[[Any], Any]
 
 @dataclass
 class JsonDataclass(Serializable):
     """Enables serialization of dataclasses with following attributes:
     - Basic serializable types as defined above:
         - Serialization: get_basic_entry()
-        - Deserialization: make_basic()
-    - Lists, tuples or dicts of basic serializable types"""
+        - Deserialization: get_basic_decoder()
+    - Lists, tuples or dicts of basic serializable types
+    Nested serializables are stored as native dicts (to_dict) so that the json is parsed in a single pass.
+    Field names and per field decoders are resolved once per class (get_field_names, get_decode_plan)"""
 
     def __init__(self, *args, **kwargs):
         _, __ = args, kwargs
@@ -91,59 +123,89 @@ class JsonDataclass(Serializable):
             raise TypeError(f'{self.__class__} must be a dataclass to be Jsonifyable')
 
     def to_str(self) -> str:
-        defined_fields = set([f.name for f in dataclasses.fields(self) if f.init])
+        return dumps_json(self.to_dict()).decode("utf-8")
+
+    def to_dict(self) -> dict:
         json_dict = {}
-        for attr, value in [(attr, value) for attr, value in self.__dict__.items() if attr in defined_fields]:
+        for attr in self.get_field_names():
+            value = getattr(self, attr)
             if isinstance(value, list):
-                entry = [self.get_basic_entry(x) for x in value]
+                entry = [self.get_native_entry(x) for x in value]
             elif isinstance(value, tuple):
-                entry = tuple([self.get_basic_entry(x) for x in value])
+                entry = tuple([self.get_native_entry(x) for x in value])
             elif isinstance(value, dict):
                 key_list = [self.get_basic_entry(k) for k in value.keys()]
-                value_list = [self.get_basic_entry(v) for v in value.values()]
+                value_list = [self.get_native_entry(v) for v in value.values()]
                 entry = (key_list, value_list)
             else:
-                entry = self.get_basic_entry(obj=value)
+                entry = self.get_native_entry(obj=value)
             json_dict[attr] = entry
 
-        return orjson.dumps(json_dict).decode("utf-8")
+        return json_dict
 
     @classmethod
     def from_str(cls, json_str: str):
-        if not dataclasses.is_dataclass(cls):
-            raise TypeError(f'{cls} is not a dataclass. from_json can only be used with dataclasses')
+        return cls.from_dict(orjson.loads(json_str))
 
-        json_dict = orjson.loads(json_str)
-        type_hints = get_type_hints(cls)
+    @classmethod
+    def from_dict(cls, json_dict : dict):
+        decode_plan = cls.get_decode_plan()
         init_dict = {}
         for key, value in json_dict.items():
-            dtype = type_hints.get(key)
-            if TypeAnalzer.is_optional(dtype) and value is None:
-                init_dict[key] = None
-                continue
-            if dtype is None:
+            decoder = decode_plan.get(key)
+            if decoder is None:
                 continue
-
-            dtype = TypeAnalzer.strip_nonetype(dtype)
-            origin = get_origin(dtype)
-            if origin == list:
-                item_type = TypeAnalzer.get_inner_types(dtype)[0]
-                restored_value = [cls.make_basic(basic_cls=item_type, s=x) for x in value]
-            elif origin == tuple:
-                item_types = TypeAnalzer.get_inner_types(dtype)
-                restored_value = tuple(
-                    [cls.make_basic(basic_cls=item_type, s=s) for item_type, s in zip(item_types, value)])
-            elif origin == dict or dtype == dict:
-                key_type, value_type = TypeAnalzer.get_inner_types(dtype)
-                key_list = [cls.make_basic(basic_cls=key_type, s=x) for x in value[0]]
-                value_list = [cls.make_basic(basic_cls=value_type, s=x) for x in value[1]]
-                restored_value = {key: value for key, value in zip(key_list, value_list)}
-            else:
-                restored_value = cls.make_basic(basic_cls=dtype, s=value)
-            init_dict[key] = restored_value
+            init_dict[key] = decoder(value)
 
         return cls(**init_dict)
 
+    # ---------------------------------------------------------
+    # plans
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_field_names(cls) -> tuple[str, ...]:
+        return tuple([f.name for f in dataclasses.fields(cls) if f.init])
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_decode_plan(cls) -> dict[str, Decoder]:
+        """Decoders per field, compiled once per class from its type hints"""
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f'{cls} is not a dataclass. from_json can only be used with dataclasses')
+        return {key : cls.make_decoder(dtype=dtype) for key, dtype in get_type_hints(cls).items()}
+
+    @classmethod
+    def make_decoder(cls, dtype : type) -> Decoder:
+        is_optional = TypeAnalzer.is_optional(dtype)
+        dtype = TypeAnalzer.strip_nonetype(dtype)
+        origin = get_origin(dtype)
+        if origin == list:
+            item_decoder = cls.get_basic_decoder(TypeAnalzer.get_inner_types(dtype)[0])
+            decoder = lambda value: [item_decoder(x) for x in value]
+        elif origin == tuple:
+            item_decoders = [cls.get_basic_decoder(t) for t in TypeAnalzer.get_inner_types(dtype)]
+            decoder = lambda value: tuple([d(x) for d, x in zip(item_decoders, value)])
+        elif origin == dict or dtype == dict:
+            key_type, value_type = TypeAnalzer.get_inner_types(dtype)
+            key_decoder, value_decoder = cls.get_basic_decoder(key_type), cls.get_basic_decoder(value_type)
+            decoder = lambda value: {key_decoder(k): value_decoder(v) for k, v in zip(value[0], value[1])}
+        else:
+            decoder = cls.get_basic_decoder(dtype)
+
+        if is_optional:
+            return lambda value: None if value is None else decoder(value)
+        return decoder
+
+    @classmethod
+    def get_native_entry(cls, obj):
+        """Like get_basic_entry but keeps finite numbers as numbers and nested serializables as native dicts"""
+        if isinstance(obj, Serializable):
+            return obj.to_dict()
+        if isinstance(obj, (int, float)) and not isinstance(obj, (bool, Enum)) and math.isfinite(obj):
+            return obj
+        return cls.get_basic_entry(obj)
+
     @staticmethod
     def get_basic_entry(obj) -> (str | int | NoneType):
         if not isinstance(obj, BasicSerializable):
@@ -163,8 +225,12 @@ class JsonDataclass(Serializable):
             entry = str(obj)
         return entry
 
+    @classmethod
+    def make_basic(cls, basic_cls, s: str):
+        return cls.get_basic_decoder(basic_cls)(s)
+
     @staticmethod
-    def make_basic(basic_cls, s: str):
+    def get_basic_decoder(basic_cls) -> Decoder:
         castable_classes = ['str', 'int', 'float', 'bool', 'Decimal', 'UUID', 'Path']
         converters = {
             datetime: datetime.fromisoformat,
@@ -173,18 +239,18 @@ class JsonDataclass(Serializable):
         }
 
         if basic_cls in converters:
-            instance = converters[basic_cls](s)
+            decoder = converters[basic_cls]
         elif basic_cls.__name__ in castable_classes:
-            instance = basic_cls(s)
+            decoder = basic_cls
         elif issubclass(basic_cls, Enum):
-            instance = basic_cls[s]
+            decoder = lambda s: basic_cls[s]
         elif issubclass(basic_cls, Serializable):
-            instance = basic_cls.from_str(s)
+            decoder = basic_cls.from_entry
         elif basic_cls == NoneType:
-            instance = None
+            decoder = lambda s: None
         else:
             raise TypeError(f'Unsupported type {basic_cls}')
-        return instance
+        return decoder
 
 
 class TypeAnalzer:
@@ -2,3 +2,4 @@ from .experiment import XrayInfo, PowderExperiment, LabelType
 from .data import XrdData
 from .metadata import Metadata
 from .xray import XrdAnode, XrayInfo
+from .header import PatternHeader
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
-import json
+import struct
 from dataclasses import dataclass, field
 from dataclasses import fields
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 from numpy.typing import NDArray
 from orjson import orjson
 
 from xrdpattern.crystal import CrystalStructure
-from xrdpattern.serialization import Serializable
+from xrdpattern.serialization import Serializable, dumps_json
 from xrdpattern.xrd.experiment import PowderExperiment, LabelType
 from xrdpattern.xrd.metadata import Metadata
 
 
+BINARY_MAGIC = b'XRDPATB\x00'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<8sIIQ') # magic, version, metadata length, number of entries
+BINARY_ALIGNMENT = 8
+
 # -------------------------------------------
 
 @dataclass
@@ -49,21 +54,61 @@ class XrdData(Serializable):
 
     @classmethod
     def from_str(cls, json_str: str) -> XrdData:
-        data = orjson.loads(json_str)
+        return cls.from_dict(orjson.loads(json_str))
+
+    def to_str(self) -> str:
+        return dumps_json(self.to_dict()).decode('utf-8')
+
+    @classmethod
+    def from_dict(cls, data : dict) -> XrdData:
+        """Reads both the flat layout and the legacy one in which label and metadata are nested json strings"""
         two_theta_values = np.array(data['two_theta_values'])
         intensities = np.array(data['intensities'])
-        label = PowderExperiment.from_str(data['label'])
-        metadata = Metadata.from_str(data['metadata'])
+        label = PowderExperiment.from_entry(data['label'])
+        metadata = Metadata.from_entry(data['metadata'])
 
         return cls(two_theta_values=two_theta_values, intensities=intensities, powder_experiment=label, metadata=metadata)
 
-    def to_str(self) -> str:
-        the_dict = {'two_theta_values' : self.two_theta_values.tolist(),
-                    'intensities' : self.intensities.tolist(),
-                    'label' : self.powder_experiment.to_str(),
-                    'metadata' : self.metadata.to_str()}
+    def to_dict(self) -> dict:
+        return {'two_theta_values' : self.two_theta_values,
+                'intensities' : self.intensities,
+                'label' : self.powder_experiment.to_dict(),
+                'metadata' : self.metadata.to_dict()}
 
-        return json.dumps(the_dict)
+    @classmethod
+    def from_bytes(cls, data : Union[bytes, memoryview], copy : bool = True) -> XrdData:
+        """Inverse of to_bytes. The arrays are owned and writable unless copy is False, in which case they are
+        read-only views into data (zero-copy) that keep it, e.g. an open mmap, alive"""
+        magic, version, meta_len, num_entries = BINARY_HEADER.unpack_from(data, 0)
+        if magic != BINARY_MAGIC:
+            raise ValueError(f'Data is not a binary xrd pattern. Got magic bytes {magic}')
+        if version > BINARY_VERSION:
+            raise ValueError(f'Binary xrd pattern version {version} is newer than supported version {BINARY_VERSION}')
+
+        meta = orjson.loads(bytes(data[BINARY_HEADER.size:BINARY_HEADER.size + meta_len]))
+        offset = get_aligned(BINARY_HEADER.size + meta_len)
+        x_dtype, y_dtype = meta['dtypes']
+        two_theta_values = np.frombuffer(data, dtype=x_dtype, count=num_entries, offset=offset)
+        intensities = np.frombuffer(data, dtype=y_dtype, count=num_entries, offset=offset + two_theta_values.nbytes)
+        if copy:
+            two_theta_values, intensities = two_theta_values.copy(), intensities.copy()
+        label = PowderExperiment.from_entry(meta['label'])
+        metadata = Metadata.from_entry(meta['metadata'])
+
+        return cls(two_theta_values=two_theta_values, intensities=intensities, powder_experiment=label, metadata=metadata)
+
+    def to_bytes(self) -> bytes:
+        """Binary layout: fixed header, json metadata (label, metadata, array dtypes) padded to BINARY_ALIGNMENT
+        bytes, followed by the raw little-endian two theta and intensity arrays"""
+        x, y = (np.ascontiguousarray(arr) for arr in (self.two_theta_values, self.intensities))
+        x, y = (arr.astype(arr.dtype.newbyteorder('<'), copy=False) for arr in (x, y))
+        meta = dumps_json({'label' : self.powder_experiment.to_dict(),
+                           'metadata' : self.metadata.to_dict(),
+                           'dtypes' : [x.dtype.str, y.dtype.str]})
+        header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(meta), len(x))
+        padding = bytes(get_aligned(len(header) + len(meta)) - len(header) - len(meta))
+
+        return b''.join([header, meta, padding, x.tobytes(), y.tobytes()])
 
     def to_init_dict(self):
         return {f.name: getattr(self, f.name) for f in fields(self)}
@@ -141,3 +186,7 @@ class XrdData(Serializable):
             return not powder_experiment.phases[0].basis is None
         else:
             raise ValueError(f'Label type {label_type} is not supported.')
+
+
+def get_aligned(offset : int) -> int:
+    return -(-offset // BINARY_ALIGNMENT) * BINARY_ALIGNMENT
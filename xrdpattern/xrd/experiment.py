@@ -5,6 +5,7 @@ from enum import Enum
 from typing import Optional
 
 import torch
+from gemmi import cif
 from tensordict import TensorDict
 
 from xrdpattern.crystal import CrystalStructure
@@ -44,24 +45,22 @@ class PowderExperiment(JsonDataclass):
 
     @classmethod
     def from_cif(cls, cif_content : str) -> PowderExperiment:
-        structure = CrystalStructure.from_cif(cif_content)
-        structure.calculate_properties()
+        doc = cif.read_string(cif_content)
+        return cls.from_cif_block(block=doc.sole_block())
+
+    @classmethod
+    def from_cif_block(cls, block : cif.Block) -> PowderExperiment:
+        """Symmetry analysis of the structure is deferred until one of its derived properties is accessed"""
+        structure = CrystalStructure.from_cif_block(block)
+        structure.defer_properties()
 
         xray_info = XrayInfo.mk_empty()
-        lines = cif_content.split('\n')
-        for l in lines:
-            if '_diffrn_radiation_wavelength' in l:
-                parts = l.split()
-                if len(parts) > 1:
-                    xray_info.primary_wavelength = float(parts[-1])
-
-        blocks = cif_content.split(f'loop_')
-        for b in blocks:
-            if '_diffrn_radiation_wavelength_wt' in b:
-                b = b.strip()
-                b_lines = b.split('\n')
-                xray_info.primary_wavelength = float(b_lines[-2].split()[0])
-                xray_info.secondary_wavelength = float(b_lines[-1].split()[0])
+        wavelengths = [cif.as_number(v) for v in block.find_values('_diffrn_radiation_wavelength')]
+        wavelengths = [w for w in wavelengths if w == w]
+        if len(wavelengths) > 0:
+            xray_info.primary_wavelength = wavelengths[0]
+        if len(wavelengths) > 1 and block.find_values('_diffrn_radiation_wavelength_wt'):
+            xray_info.secondary_wavelength = wavelengths[1]
 
         return cls(phases=[structure], xray_info=xray_info, is_simulated=False)
 
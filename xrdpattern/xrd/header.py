@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import orjson
+
+from xrdpattern.crystal import CrystalStructure
+from xrdpattern.xrd.data import BINARY_MAGIC, BINARY_HEADER, BINARY_VERSION
+from xrdpattern.xrd.experiment import PowderExperiment, LabelType
+from xrdpattern.xrd.metadata import Metadata
+from xrdpattern.xrd.xray import XrayInfo
+
+ARRAY_KEYS = ('two_theta_values', 'intensities')
+STRUCTURAL_CHARS = re.compile(rb'["\[\]{}]')
+STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+WHITESPACE = re.compile(rb'\s*')
+
+# -------------------------------------------
+
+@dataclass
+class PatternHeader:
+    """Labels and metadata of a stored pattern (aimat json or binary) that can be read without materializing
+    its arrays, crystal structures or pymatgen objects. Mirrors the label queries of XrdData"""
+    num_entries : int
+    metadata : Metadata
+    xray_info : XrayInfo
+    is_simulated : bool = False
+    crystallite_size_nm : Optional[float] = None
+    temp_K : Optional[float] = None
+    num_phases : int = 0
+    spacegroup : Optional[int] = None
+    chemical_composition : Optional[str] = None
+    has_lattice : bool = False
+    has_basis : bool = False
+
+    @classmethod
+    def load(cls, fpath : str) -> PatternHeader:
+        """Binary patterns are read up to the end of their json metadata only"""
+        with open(fpath, 'rb') as f:
+            prefix = f.read(BINARY_HEADER.size)
+            if prefix.startswith(BINARY_MAGIC):
+                meta_len, num_entries = cls._unpack_binary_header(prefix)
+                return cls.from_meta(meta=orjson.loads(f.read(meta_len)), num_entries=num_entries)
+            content = prefix + f.read()
+        return cls.from_json(content=content)
+
+    @classmethod
+    def from_bytes(cls, data : Union[bytes, memoryview]) -> PatternHeader:
+        if bytes(data[:len(BINARY_MAGIC)]) == BINARY_MAGIC:
+            meta_len, num_entries = cls._unpack_binary_header(data)
+            meta = orjson.loads(bytes(data[BINARY_HEADER.size:BINARY_HEADER.size + meta_len]))
+            return cls.from_meta(meta=meta, num_entries=num_entries)
+        return cls.from_json(content=bytes(data))
+
+    @classmethod
+    def from_json(cls, content : bytes) -> PatternHeader:
+        """Splices the (flat) intensity and two theta arrays out of the json before parsing the remainder"""
+        spans = sorted(get_array_spans(content=content, keys=ARRAY_KEYS).values())
+        num_entries = get_num_values(array_bytes=content[spans[0][0]:spans[0][1]])
+        (start1, end1), (start2, end2) = spans
+        meta = orjson.loads(b''.join([content[:start1], b'[]', content[end1:start2], b'[]', content[end2:]]))
+        return cls.from_meta(meta=meta, num_entries=num_entries)
+
+    @classmethod
+    def from_meta(cls, meta : dict, num_entries : int) -> PatternHeader:
+        """meta holds label and metadata entries in either the flat or the legacy nested string layout"""
+        label = load_entry(meta['label'])
+        phases = [load_entry(p) for p in label['phases']]
+        experiment_plan, crystal_plan = PowderExperiment.get_decode_plan(), CrystalStructure.get_decode_plan()
+
+        def get_label(key : str):
+            value = label.get(key)
+            return None if value is None else experiment_plan[key](value)
+
+        def get_phase_label(key : str):
+            value = phases[0].get(key) if len(phases) > 0 else None
+            return None if value is None else crystal_plan[key](value)
+
+        return cls(num_entries=num_entries,
+                   metadata=Metadata.from_entry(meta['metadata']),
+                   xray_info=XrayInfo.from_entry(label['xray_info']),
+                   is_simulated=bool(get_label('is_simulated')),
+                   crystallite_size_nm=get_label('crystallite_size_nm'),
+                   temp_K=get_label('temp_K'),
+                   num_phases=len(phases),
+                   spacegroup=get_phase_label('spacegroup'),
+                   chemical_composition=get_phase_label('chemical_composition'),
+                   has_lattice=len(phases) > 0 and phases[0].get('lattice') is not None,
+                   has_basis=len(phases) > 0 and phases[0].get('basis') is not None)
+
+    @staticmethod
+    def _unpack_binary_header(data : Union[bytes, memoryview]) -> tuple[int, int]:
+        magic, version, meta_len, num_entries = BINARY_HEADER.unpack_from(data, 0)
+        if version > BINARY_VERSION:
+            raise ValueError(f'Binary xrd pattern version {version} is newer than supported version {BINARY_VERSION}')
+        return meta_len, num_entries
+
+    # ---------------------------------------
+    # properties
+
+    @property
+    def is_partially_labeled(self) -> bool:
+        return any(self.has_label(label_type=lt) for lt in LabelType.get_main_labels())
+
+    @property
+    def is_fully_labeled(self) -> bool:
+        return self.has_label(label_type=LabelType.lattice) and self.has_label(label_type=LabelType.basis)
+
+    def has_label(self, label_type : LabelType) -> bool:
+        if label_type == LabelType.primary_wavelength:
+            return not self.xray_info.primary_wavelength is None
+        if label_type == LabelType.secondary_wavelength:
+            return not self.xray_info.secondary_wavelength is None
+
+        if self.num_phases == 0:
+            return False
+
+        if label_type == LabelType.lattice:
+            return self.has_lattice
+        elif label_type == LabelType.spg:
+            return self.spacegroup is not None
+        elif label_type == LabelType.composition:
+            return self.chemical_composition is not None
+        elif label_type == LabelType.temperature:
+            return self.temp_K is not None
+        elif label_type == LabelType.crystallite_size:
+            return self.crystallite_size_nm is not None
+        elif label_type == LabelType.basis:
+            return self.has_basis
+        else:
+            raise ValueError(f'Label type {label_type} is not supported.')
+
+
+def get_array_spans(content : bytes, keys : tuple[str, ...]) -> dict[str, tuple[int, int]]:
+    """Byte spans [start, end) of the brackets enclosing the (one dimensional) json arrays stored under keys of the
+    top level object. Strings and nested values are skipped, so keys occurring inside them are not matched"""
+    targets = {f'"{key}"'.encode() : key for key in keys}
+    spans = {}
+    depth, pos = 0, 0
+    while len(spans) < len(keys):
+        match = STRUCTURAL_CHARS.search(content, pos)
+        if match is None:
+            break
+        char, pos = match.group(), match.end()
+        if char == b'"':
+            string_end = STRING_END.match(content, pos)
+            if string_end is None:
+                raise ValueError('Json content contains an unterminated string')
+            key, pos = targets.get(content[match.start():string_end.end()]), string_end.end()
+            colon_pos = WHITESPACE.match(content, pos).end()
+            if depth == 1 and key and content[colon_pos:colon_pos + 1] == b':':
+                start = WHITESPACE.match(content, colon_pos + 1).end()
+                if content[start:start + 1] != b'[':
+                    raise ValueError(f'Json value of key "{key}" is not an array')
+                end = content.index(b']', start) + 1
+                spans[key], pos = (start, end), end
+        elif char in (b'[', b'{'):
+            depth += 1
+        else:
+            depth -= 1
+
+    missing = [key for key in keys if not key in spans]
+    if missing:
+        raise ValueError(f'Json content does not contain key "{missing[0]}"')
+    return spans
+
+
+def get_num_values(array_bytes : bytes) -> int:
+    if array_bytes[1:-1].strip() == b'':
+        return 0
+    return array_bytes.count(b',') + 1
+
+
+def load_entry(entry : Union[str, dict]) -> dict:
+    return orjson.loads(entry) if isinstance(entry, str) else entry
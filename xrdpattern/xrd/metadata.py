@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from importlib.metadata import version
 from typing import Optional
 
@@ -25,5 +26,6 @@ class Metadata(JsonDataclass):
         self.filename = None
 
 
+@lru_cache
 def get_library_version(library_name : str):
     return version(library_name)
\ No newline at end of file
@@ -46,3 +46,21 @@
 #endif // SWIGPYTHON
 
 %include "xylib/xylib.h"
+
+#if defined(SWIGPYTHON)
+// bulk access to column values; returns the first n values as a bytearray of native
+// doubles so that they can be wrapped with numpy.frombuffer without per-point calls
+%extend xylib::Column {
+    PyObject* get_values_buffer(int n) const {
+        if (n < 0)
+            n = 0;
+        PyObject* buffer = PyByteArray_FromStringAndSize(NULL, (Py_ssize_t) n * sizeof(double));
+        if (buffer == NULL)
+            return NULL;
+        double* values = (double*) PyByteArray_AS_STRING(buffer);
+        for (int i = 0; i < n; ++i)
+            values[i] = $self->get_value(i);
+        return buffer;
+    }
+}
+#endif // SWIGPYTHON